@@ -10,9 +10,12 @@ sys.path.append(".")
 from app.core.config import settings  # noqa: E402
 from app.core.database import Base  # noqa: E402
 from app.auth import models as _auth  # noqa: F401, E402
+from app.core import catalog as _catalog  # noqa: F401, E402
+from app.dashboard import models as _dashboard  # noqa: F401, E402
 from app.enrollments import models as _enrollments  # noqa: F401, E402
 from app.grades import models as _grades  # noqa: F401, E402
 from app.periods import models as _periods  # noqa: F401, E402
+from app.reports import models as _reports  # noqa: F401, E402
 from app.roles import models as _roles  # noqa: F401, E402
 from app.subjects import models as _subjects  # noqa: F401, E402
 from app.users import models as _users  # noqa: F401, E402
@@ -37,17 +40,24 @@ def run_migrations_offline() -> None:
         context.run_migrations()
 
 
+def _run_with(connection) -> None:  # type: ignore[no-untyped-def]
+    context.configure(connection=connection, target_metadata=target_metadata)
+    with context.begin_transaction():
+        context.run_migrations()
+
+
 def run_migrations_online() -> None:
-    connectable = context.config.attributes.get("connection", None)
-    if connectable is None:
-        from sqlalchemy import create_engine
+    # Quien invoca (las pruebas) puede pasar su propia conexión en config.attributes.
+    connection = context.config.attributes.get("connection", None)
+    if connection is not None:
+        _run_with(connection)
+        return
 
-        connectable = create_engine(settings.database_url, pool_pre_ping=True)
+    from sqlalchemy import create_engine
 
+    connectable = create_engine(settings.database_url, pool_pre_ping=True)
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
-        with context.begin_transaction():
-            context.run_migrations()
+        _run_with(connection)
 
 
 if context.is_offline_mode():
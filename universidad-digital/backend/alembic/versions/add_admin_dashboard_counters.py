@@ -0,0 +1,63 @@
+"""add admin_dashboard_counters with its single row
+
+Revision ID: 004_dashboard_counters
+Revises: 003_query_indexes
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "004_dashboard_counters"
+down_revision = "003_query_indexes"
+branch_labels = None
+depends_on = None
+
+
+# Mismos conteos que app.dashboard.services._count_admin_dashboard.
+SEED_ROW = """
+INSERT INTO admin_dashboard_counters (
+    id, total_users, total_students, total_teachers, total_subjects,
+    inactive_subjects, active_periods, reconciled_at
+)
+SELECT
+    1,
+    (SELECT count(*) FROM users WHERE is_active),
+    (SELECT count(users.id) FROM users
+        JOIN user_roles ON user_roles.user_id = users.id
+        JOIN roles ON roles.id = user_roles.role_id
+        WHERE roles.name = 'Estudiante' AND users.is_active),
+    (SELECT count(DISTINCT users.id) FROM users
+        JOIN user_roles ON user_roles.user_id = users.id
+        JOIN roles ON roles.id = user_roles.role_id
+        WHERE roles.name = 'Docente' AND users.is_active),
+    (SELECT count(*) FROM subjects),
+    (SELECT count(*) FROM subjects WHERE NOT is_active),
+    (SELECT count(*) FROM academic_periods WHERE is_active),
+    CURRENT_TIMESTAMP
+WHERE NOT EXISTS (SELECT 1 FROM admin_dashboard_counters WHERE id = 1)
+"""
+
+
+def upgrade() -> None:
+    # Las bases creadas con create_all y selladas en 003 ya tienen la tabla.
+    if not sa.inspect(op.get_bind()).has_table("admin_dashboard_counters"):
+        op.create_table(
+            "admin_dashboard_counters",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("total_users", sa.Integer(), nullable=False),
+            sa.Column("total_students", sa.Integer(), nullable=False),
+            sa.Column("total_teachers", sa.Integer(), nullable=False),
+            sa.Column("total_subjects", sa.Integer(), nullable=False),
+            sa.Column("inactive_subjects", sa.Integer(), nullable=False),
+            sa.Column("active_periods", sa.Integer(), nullable=False),
+            sa.Column("reconciled_at", sa.DateTime(timezone=True), nullable=True),
+            sa.PrimaryKeyConstraint("id"),
+        )
+    op.execute(SEED_ROW)
+
+
+def downgrade() -> None:
+    op.drop_table("admin_dashboard_counters")
@@ -0,0 +1,42 @@
+"""add catalog_versions with one row per cached catalog
+
+Revision ID: 006_catalog_versions
+Revises: 005_period_snapshots
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "006_catalog_versions"
+down_revision = "005_period_snapshots"
+branch_labels = None
+depends_on = None
+
+
+# Igual que app.core.catalog.CATALOG_TABLES.
+CATALOG_TABLES = ("subjects", "periods", "roles")
+
+
+def upgrade() -> None:
+    # Las bases creadas con create_all y selladas antes de esta revisión ya tienen la tabla.
+    if not sa.inspect(op.get_bind()).has_table("catalog_versions"):
+        op.create_table(
+            "catalog_versions",
+            sa.Column("name", sa.String(length=50), nullable=False),
+            sa.Column("version", sa.Integer(), nullable=False),
+            sa.PrimaryKeyConstraint("name"),
+        )
+    for name in CATALOG_TABLES:
+        op.execute(
+            sa.text(
+                "INSERT INTO catalog_versions (name, version) SELECT :name, 0 "
+                "WHERE NOT EXISTS (SELECT 1 FROM catalog_versions WHERE name = :name)"
+            ).bindparams(name=name)
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("catalog_versions")
@@ -0,0 +1,96 @@
+"""add period snapshot marker and per-period summary tables
+
+Revision ID: 005_period_snapshots
+Revises: 004_dashboard_counters
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "005_period_snapshots"
+down_revision = "004_dashboard_counters"
+branch_labels = None
+depends_on = None
+
+
+def _period_fk() -> sa.ForeignKeyConstraint:
+    return sa.ForeignKeyConstraint(["period_id"], ["academic_periods.id"])
+
+
+def _tables() -> tuple[tuple[str, tuple], ...]:
+    return (
+        (
+            "period_snapshots",
+            (
+                sa.Column("period_id", sa.Integer(), nullable=False),
+                sa.Column(
+                    "created_at",
+                    sa.DateTime(timezone=True),
+                    server_default=sa.text("now()"),
+                    nullable=False,
+                ),
+                _period_fk(),
+                sa.PrimaryKeyConstraint("period_id"),
+            ),
+        ),
+        (
+            "period_student_summaries",
+            (
+                sa.Column("period_id", sa.Integer(), nullable=False),
+                sa.Column("user_id", sa.Integer(), nullable=False),
+                sa.Column("subjects_count", sa.Integer(), nullable=False),
+                sa.Column("credits_attempted", sa.Integer(), nullable=False),
+                sa.Column("credits_graded", sa.Integer(), nullable=False),
+                sa.Column("weighted_average", sa.Numeric(5, 2), nullable=True),
+                _period_fk(),
+                sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+                sa.PrimaryKeyConstraint("period_id", "user_id"),
+            ),
+        ),
+        (
+            "period_subject_summaries",
+            (
+                sa.Column("period_id", sa.Integer(), nullable=False),
+                sa.Column("subject_id", sa.Integer(), nullable=False),
+                sa.Column("enrollments_count", sa.Integer(), nullable=False),
+                sa.Column("graded_count", sa.Integer(), nullable=False),
+                sa.Column("average", sa.Numeric(5, 2), nullable=True),
+                sa.Column("min_grade", sa.Numeric(5, 2), nullable=True),
+                sa.Column("max_grade", sa.Numeric(5, 2), nullable=True),
+                _period_fk(),
+                sa.ForeignKeyConstraint(["subject_id"], ["subjects.id"]),
+                sa.PrimaryKeyConstraint("period_id", "subject_id"),
+            ),
+        ),
+        (
+            "period_teacher_summaries",
+            (
+                sa.Column("period_id", sa.Integer(), nullable=False),
+                sa.Column("teacher_id", sa.Integer(), nullable=False),
+                sa.Column("subjects_count", sa.Integer(), nullable=False),
+                sa.Column("students_count", sa.Integer(), nullable=False),
+                sa.Column("enrollments_count", sa.Integer(), nullable=False),
+                sa.Column("average", sa.Numeric(5, 2), nullable=True),
+                _period_fk(),
+                sa.ForeignKeyConstraint(["teacher_id"], ["users.id"]),
+                sa.PrimaryKeyConstraint("period_id", "teacher_id"),
+            ),
+        ),
+    )
+
+
+def upgrade() -> None:
+    # Las bases creadas con create_all y selladas antes de esta revisión ya tienen las tablas.
+    # Sin snapshots los periodos cerrados se materializan en la primera lectura de reportes.
+    inspector = sa.inspect(op.get_bind())
+    for name, elements in _tables():
+        if not inspector.has_table(name):
+            op.create_table(name, *elements)
+
+
+def downgrade() -> None:
+    for name, _elements in reversed(_tables()):
+        op.drop_table(name)
@@ -0,0 +1,94 @@
+"""add composite and partial indexes for list, dashboard and transcript queries
+
+Revision ID: 003_query_indexes
+Revises: 002_token_version
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "003_query_indexes"
+down_revision = "002_token_version"
+branch_labels = None
+depends_on = None
+
+
+# (nombre, tabla, columnas, opciones): deben coincidir con los Index de los modelos.
+INDEXES = (
+    (
+        "ix_enrollments_teacher_id_active",
+        "enrollments",
+        ["teacher_id", "id"],
+        {"postgresql_where": sa.text("is_active"), "sqlite_where": sa.text("is_active")},
+    ),
+    (
+        "ix_enrollments_user_id_active",
+        "enrollments",
+        ["user_id", "id"],
+        {"postgresql_where": sa.text("is_active"), "sqlite_where": sa.text("is_active")},
+    ),
+    (
+        "ix_grades_enrollment_id_id",
+        "grades",
+        ["enrollment_id", "id"],
+        {"postgresql_include": ["value"]},
+    ),
+    (
+        "ix_user_roles_role_id_user_id",
+        "user_roles",
+        ["role_id", "user_id"],
+        {},
+    ),
+    (
+        "ix_users_id_active",
+        "users",
+        ["id"],
+        {"postgresql_where": sa.text("is_active"), "sqlite_where": sa.text("is_active")},
+    ),
+    (
+        "ix_users_updated_at",
+        "users",
+        ["updated_at"],
+        {},
+    ),
+)
+
+# Prefijos de los índices compuestos: el planner los prefería por ser más chicos y
+# perdía el index-only scan. Se eliminan después de crear los compuestos.
+REDUNDANT = (("ix_user_roles_role_id", "user_roles", ["role_id"]),)
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY no puede ejecutarse dentro de una transacción. Si una
+    # creación falla queda un índice INVALID que if_not_exists no repara: eliminarlo y reintentar.
+    with op.get_context().autocommit_block():
+        for name, table, columns, options in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=False,
+                if_not_exists=True,
+                postgresql_concurrently=True,
+                **options,
+            )
+        for name, table, _columns in REDUNDANT:
+            op.drop_index(name, table_name=table, if_exists=True, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns in REDUNDANT:
+            op.create_index(
+                name, table, columns, unique=False, if_not_exists=True, postgresql_concurrently=True
+            )
+        for name, table, _columns, _options in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                if_exists=True,
+                postgresql_concurrently=True,
+            )
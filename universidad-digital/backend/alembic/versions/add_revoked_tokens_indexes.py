@@ -0,0 +1,47 @@
+"""index revoked_tokens.revoked_at and expires_at for the filter refresh and the purge
+
+Revision ID: 007_revoked_tokens_indexes
+Revises: 006_catalog_versions
+Create Date: 2026-10-18
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "007_revoked_tokens_indexes"
+down_revision = "006_catalog_versions"
+branch_labels = None
+depends_on = None
+
+
+# Deben coincidir con index=True de app.auth.models.RevokedToken.
+INDEXES = (
+    ("ix_revoked_tokens_revoked_at", ["revoked_at"]),
+    ("ix_revoked_tokens_expires_at", ["expires_at"]),
+)
+
+
+def upgrade() -> None:
+    # Igual que 003_query_indexes: CONCURRENTLY fuera de la transacción de la migración.
+    with op.get_context().autocommit_block():
+        for name, columns in INDEXES:
+            op.create_index(
+                name,
+                "revoked_tokens",
+                columns,
+                unique=False,
+                if_not_exists=True,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _columns in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name="revoked_tokens",
+                if_exists=True,
+                postgresql_concurrently=True,
+            )
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth.principal import Principal, principal_cache
+from app.auth.revocation import revocation_filter
+from app.auth.services import cache_principal, ensure_active, principal_user_stmt, read_token_payload
+from app.core.errors import UnauthorizedError
+from app.core.names import name_cache
+
+
+async def get_current_user_async(db: AsyncSession, request: Request) -> Principal:
+    """Versión asíncrona de get_current_user."""
+    payload = read_token_payload(request)
+    jti = payload["jti"]
+    if await db.run_sync(revocation_filter.is_revoked, jti):
+        raise UnauthorizedError("Token revocado.")
+
+    await db.run_sync(name_cache.refresh_users)
+    principal = principal_cache.get(jti)
+    if principal is None:
+        result = await db.execute(principal_user_stmt(int(payload["sub"])))
+        principal = cache_principal(payload, result.scalar_one_or_none())
+    return ensure_active(principal)
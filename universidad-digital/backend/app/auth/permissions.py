@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from enum import IntFlag
+
+
+class Permission(IntFlag):
+    """Bits de permiso; cada rol base activa uno."""
+
+    NONE = 0
+    ADMIN = 1 << 0
+    TEACHER = 1 << 1
+    STUDENT = 1 << 2
+
+
+ROLE_PERMISSIONS: dict[str, Permission] = {
+    "Administrador": Permission.ADMIN,
+    "Docente": Permission.TEACHER,
+    "Estudiante": Permission.STUDENT,
+}
+
+
+def mask_for_roles(role_names: Iterable[str]) -> int:
+    """Máscara efectiva de un conjunto de roles (los roles sin bits no suman)."""
+    mask = Permission.NONE
+    for name in role_names:
+        mask |= ROLE_PERMISSIONS.get(name, Permission.NONE)
+    return int(mask)
+
+
+def roles_for_mask(mask: int) -> tuple[str, ...]:
+    """Nombres de los roles base presentes en una máscara."""
+    return tuple(name for name, bit in ROLE_PERMISSIONS.items() if mask & bit)
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+
+from app.auth.permissions import Permission, roles_for_mask
+from app.core.config import settings
+from app.users.models import User
+
+
+@dataclass(frozen=True)
+class Principal:
+    """Identidad autenticada sin objetos ORM; los permisos vienen del token."""
+
+    id: int
+    email: str
+    full_name: str
+    is_active: bool
+    created_at: datetime
+    permissions: int
+
+    @classmethod
+    def from_user(cls, user: User, permissions: int) -> Principal:
+        return cls(
+            id=user.id,
+            email=user.email,
+            full_name=user.full_name,
+            is_active=user.is_active,
+            created_at=user.created_at,
+            permissions=permissions,
+        )
+
+    def has(self, permission: Permission | int) -> bool:
+        return bool(self.permissions & permission)
+
+    @property
+    def role_names(self) -> tuple[str, ...]:
+        return roles_for_mask(self.permissions)
+
+
+class PrincipalCache:
+    """LRU acotado con TTL de principales indexados por jti."""
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[str, tuple[float, Principal]] = OrderedDict()
+        self._by_user: dict[int, set[str]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, jti: str) -> Principal | None:
+        with self._lock:
+            entry = self._entries.get(jti)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires, principal = entry
+            if expires <= time.monotonic():
+                self._discard(jti)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(jti)
+            self.hits += 1
+            return principal
+
+    def put(self, jti: str, principal: Principal, token_expires_at: datetime) -> None:
+        ttl = settings.principal_cache_ttl_seconds
+        if ttl <= 0:
+            return
+        remaining = token_expires_at.timestamp() - time.time()
+        expires = time.monotonic() + min(ttl, remaining)
+        with self._lock:
+            self._discard(jti)
+            self._entries[jti] = (expires, principal)
+            self._by_user.setdefault(principal.id, set()).add(jti)
+            while len(self._entries) > settings.principal_cache_max_entries:
+                oldest = next(iter(self._entries))
+                self._discard(oldest)
+
+    def invalidate_user(self, user_id: int) -> None:
+        """Descarta todos los principales cacheados de un usuario."""
+        with self._lock:
+            for jti in self._by_user.pop(user_id, set()):
+                self._entries.pop(jti, None)
+
+    def invalidate_jti(self, jti: str) -> None:
+        with self._lock:
+            self._discard(jti)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_user.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+    def _discard(self, jti: str) -> None:
+        entry = self._entries.pop(jti, None)
+        if entry is None:
+            return
+        user_jtis = self._by_user.get(entry[1].id)
+        if user_jtis is not None:
+            user_jtis.discard(jti)
+            if not user_jtis:
+                del self._by_user[entry[1].id]
+
+
+principal_cache = PrincipalCache()
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session
+
+from app.auth.models import RevokedToken
+from app.core.config import settings
+from app.core.database import SessionLocal
+
+
+logger = logging.getLogger(__name__)
+
+# Margen de relectura: un revoked_at asignado por una transacción que confirmó
+# tarde puede quedar por detrás de la marca de agua ya observada.
+_REFRESH_OVERLAP = timedelta(seconds=60)
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+class RevocationFilter:
+    """Conjunto en memoria de jti revocados; la base solo se consulta ante un positivo."""
+
+    def __init__(self) -> None:
+        self._expirations: dict[str, datetime] = {}
+        self._watermark: datetime | None = None
+        self._last_refresh = 0.0
+        self._lock = threading.Lock()
+        self.checks = 0
+        self.positives = 0
+        self.table_rows: int | None = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._watermark is not None
+
+    def load(self, db: Session) -> None:
+        """Carga todos los tokens revocados vigentes."""
+        now = datetime.now(timezone.utc)
+        rows = db.execute(
+            select(RevokedToken.jti, RevokedToken.expires_at, RevokedToken.revoked_at).where(
+                RevokedToken.expires_at > now
+            )
+        ).all()
+        with self._lock:
+            # Conserva lo agregado con add() mientras corría la consulta.
+            self._expirations = {
+                **{jti: expires_at for jti, expires_at in self._expirations.items() if expires_at > now},
+                **{jti: _as_utc(expires_at) for jti, expires_at, _ in rows},
+            }
+            self._watermark = max(
+                (_as_utc(revoked_at) for _, _, revoked_at in rows if revoked_at),
+                default=now,
+            )
+            self._last_refresh = time.monotonic()
+
+    def refresh(self, db: Session) -> None:
+        """Incorpora revocaciones nuevas usando revoked_at como marca de agua."""
+        if self._watermark is None:
+            self.load(db)
+            return
+        since = self._watermark - _REFRESH_OVERLAP
+        rows = db.execute(
+            select(RevokedToken.jti, RevokedToken.expires_at, RevokedToken.revoked_at).where(
+                RevokedToken.revoked_at >= since
+            )
+        ).all()
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            for jti, expires_at, revoked_at in rows:
+                self._expirations[jti] = _as_utc(expires_at)
+                if revoked_at and _as_utc(revoked_at) > self._watermark:
+                    self._watermark = _as_utc(revoked_at)
+            self._expirations = {
+                jti: expires_at for jti, expires_at in self._expirations.items() if expires_at > now
+            }
+            self._last_refresh = time.monotonic()
+
+    def maybe_refresh(self, db: Session) -> None:
+        if not self.loaded:
+            self.load(db)
+            return
+        with self._lock:
+            if time.monotonic() - self._last_refresh < settings.revocation_refresh_seconds:
+                return
+            # Un solo hilo refresca; los demás siguen con el conjunto actual.
+            self._last_refresh = time.monotonic()
+        self.refresh(db)
+
+    def add(self, jti: str, expires_at: datetime) -> None:
+        """Registra localmente un token recién revocado por este proceso."""
+        with self._lock:
+            self._expirations[jti] = _as_utc(expires_at)
+
+    def is_revoked(self, db: Session, jti: str) -> bool:
+        """Verifica revocación; solo un positivo del filtro se confirma en la base."""
+        self.maybe_refresh(db)
+        self.checks += 1
+        if jti not in self._expirations:
+            return False
+        self.positives += 1
+        return is_token_revoked(db, jti)
+
+    def stats(self) -> dict[str, float | int | None]:
+        checks = self.checks
+        return {
+            "checks": checks,
+            "positives": self.positives,
+            "hit_rate": (self.positives / checks) if checks else 0.0,
+            "filter_size": len(self._expirations),
+            "table_rows": self.table_rows,
+        }
+
+
+revocation_filter = RevocationFilter()
+
+
+def is_token_revoked(db: Session, jti: str) -> bool:
+    """Verifica en la base si un token fue revocado."""
+    return bool(db.scalar(select(RevokedToken.id).where(RevokedToken.jti == jti)))
+
+
+def purge_expired_tokens(db: Session) -> int:
+    """Elimina tokens revocados cuya expiración ya pasó y actualiza el tamaño de la tabla."""
+    result = db.execute(
+        delete(RevokedToken).where(RevokedToken.expires_at <= datetime.now(timezone.utc))
+    )
+    db.commit()
+    revocation_filter.table_rows = db.scalar(select(func.count(RevokedToken.id)))
+    return result.rowcount or 0
+
+
+def revocation_stats(db: Session) -> dict[str, float | int | None]:
+    """Métricas del filtro con el tamaño actual de revoked_tokens."""
+    revocation_filter.table_rows = db.scalar(select(func.count(RevokedToken.id)))
+    return revocation_filter.stats()
+
+
+class _PurgeScheduler:
+    """Hilo en segundo plano que purga periódicamente revoked_tokens."""
+
+    def __init__(self) -> None:
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None or settings.revoked_tokens_purge_minutes <= 0:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="revoked-tokens-purge", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self._thread = None
+
+    def _run(self) -> None:
+        interval = settings.revoked_tokens_purge_minutes * 60
+        while not self._stop.wait(interval):
+            db = SessionLocal()
+            try:
+                purged = purge_expired_tokens(db)
+                if purged:
+                    logger.info("Tokens revocados expirados purgados: %s", purged)
+            except Exception:  # noqa: BLE001
+                logger.exception("Fallo al purgar revoked_tokens.")
+            finally:
+                db.close()
+
+
+purge_scheduler = _PurgeScheduler()
@@ -11,8 +11,10 @@ from app.auth.services import (
     revoke_token,
 )
 from app.core.config import settings
-from app.core.deps import get_current_user_dep, get_db
+from app.auth.revocation import revocation_stats
+from app.core.deps import get_current_user_dep, get_db, require_roles_dep
 from app.users.schemas import UserResponse
+from app.users.services import get_user
 
 
 router = APIRouter(prefix="/auth", tags=["auth"])
@@ -53,5 +55,16 @@ def logout_endpoint(
 
 
 @router.get("/me", response_model=UserResponse)
-def me_endpoint(user=Depends(get_current_user_dep)) -> UserResponse:
-    return UserResponse.model_validate(user, from_attributes=True)
+def me_endpoint(
+    db: Session = Depends(get_db), user=Depends(get_current_user_dep)
+) -> UserResponse:
+    # Los roles completos (incluidos los que no aportan permisos) se leen de la BD.
+    return UserResponse.model_validate(get_user(db, user.id), from_attributes=True)
+
+
+@router.get("/revocation/stats")
+def revocation_stats_endpoint(
+    db: Session = Depends(get_db),
+    _admin=Depends(require_roles_dep("Administrador")),
+) -> dict:
+    return revocation_stats(db)
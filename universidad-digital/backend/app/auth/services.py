@@ -4,12 +4,17 @@ from datetime import datetime, timezone
 from uuid import uuid4
 
 from fastapi import Request
-from sqlalchemy import select
+from sqlalchemy import Select, select
 from sqlalchemy.orm import Session
 
 from app.auth.models import RevokedToken
+from app.auth.permissions import Permission, mask_for_roles
+from app.auth.principal import Principal, principal_cache
+from app.auth.revocation import is_token_revoked, revocation_filter  # noqa: F401
 from app.core.config import settings
 from app.core.errors import ForbiddenError, NotFoundError, UnauthorizedError
+from app.core.metrics import logins_total
+from app.core.names import name_cache
 from app.core.security import create_access_token, decode_access_token, is_jwt_error, verify_password
 from app.users.models import User
 
@@ -18,16 +23,20 @@ def authenticate_user(db: Session, email: str, password: str) -> User:
     """Valida credenciales y estado del usuario."""
     user = db.scalar(select(User).where(User.email == email.lower().strip()))
     if not user or not verify_password(password, user.hashed_password):
+        logins_total.inc("invalid_credentials")
         raise UnauthorizedError("Credenciales inválidas.")
     if not user.is_active:
+        logins_total.inc("inactive")
         raise ForbiddenError("Usuario inactivo.")
+    logins_total.inc("success")
     return user
 
 
 def create_token_for_user(user: User) -> tuple[str, str, datetime]:
-    """Genera token JWT y retorna token, jti y expiración."""
+    """Genera token JWT con la máscara de permisos y la versión del usuario."""
     jti = uuid4().hex
-    token = create_access_token(subject=str(user.id), jti=jti)
+    claims = {"perm": mask_for_roles(role.name for role in user.roles), "ver": user.token_version}
+    token = create_access_token(subject=str(user.id), jti=jti, claims=claims)
     payload = decode_access_token(token)
     exp = datetime.fromtimestamp(payload["exp"], tz=timezone.utc)
     return token, jti, exp
@@ -38,11 +47,8 @@ def revoke_token(db: Session, jti: str, expires_at: datetime) -> None:
     revoked = RevokedToken(jti=jti, expires_at=expires_at)
     db.add(revoked)
     db.commit()
-
-
-def is_token_revoked(db: Session, jti: str) -> bool:
-    """Verifica si un token fue revocado."""
-    return bool(db.scalar(select(RevokedToken).where(RevokedToken.jti == jti)))
+    revocation_filter.add(jti, expires_at)
+    principal_cache.invalidate_jti(jti)
 
 
 def get_token_from_request(request: Request) -> str | None:
@@ -53,8 +59,8 @@ def get_token_from_request(request: Request) -> str | None:
     return request.cookies.get(settings.cookie_name)
 
 
-def get_current_user(db: Session, request: Request) -> User:
-    """Resuelve el usuario autenticado desde la request."""
+def read_token_payload(request: Request) -> dict:
+    """Decodifica el token de la request y valida que incluya jti y sub."""
     token = get_token_from_request(request)
     if not token:
         raise UnauthorizedError("Token no proporcionado.")
@@ -68,23 +74,56 @@ def get_current_user(db: Session, request: Request) -> User:
 
     jti = payload.get("jti")
     sub = payload.get("sub")
-    if not jti or not sub:
+    if not jti or not sub or not isinstance(payload.get("perm"), int):
         raise UnauthorizedError("Token inválido.")
-    if is_token_revoked(db, jti):
-        raise UnauthorizedError("Token revocado.")
+    return payload
+
 
-    user = db.get(User, int(sub))
+def principal_user_stmt(user_id: int) -> Select:
+    return select(User).where(User.id == user_id)
+
+
+def cache_principal(payload: dict, user: User | None) -> Principal:
+    """Construye y cachea el principal del usuario cargado para el token.
+
+    Rechaza el token si sus roles cambiaron desde la emisión (versión distinta).
+    """
     if not user:
         raise NotFoundError("Usuario no encontrado.")
-    if not user.is_active:
+    if payload.get("ver") != user.token_version:
+        raise UnauthorizedError("Token desactualizado; inicia sesión nuevamente.")
+    principal = Principal.from_user(user, payload["perm"])
+    principal_cache.put(
+        payload["jti"], principal, datetime.fromtimestamp(payload["exp"], tz=timezone.utc)
+    )
+    return principal
+
+
+def ensure_active(principal: Principal) -> Principal:
+    if not principal.is_active:
         raise ForbiddenError("Usuario inactivo.")
-    return user
+    return principal
+
+
+def get_current_user(db: Session, request: Request) -> Principal:
+    """Resuelve el principal autenticado desde la request (cacheado por jti)."""
+    payload = read_token_payload(request)
+    jti = payload["jti"]
+    if revocation_filter.is_revoked(db, jti):
+        raise UnauthorizedError("Token revocado.")
+
+    # Descarta principales de usuarios cuyos roles o estado cambió otro worker.
+    name_cache.refresh_users(db)
+    principal = principal_cache.get(jti)
+    if principal is None:
+        user = db.execute(principal_user_stmt(int(payload["sub"]))).scalar_one_or_none()
+        principal = cache_principal(payload, user)
+    return ensure_active(principal)
 
 
-def require_roles(user: User, allowed_roles: set[str]) -> None:
-    """Valida que el usuario tenga roles permitidos."""
-    user_roles = {role.name for role in user.roles}
-    if not user_roles.intersection(allowed_roles):
+def require_roles(user: Principal, allowed: Permission | int) -> None:
+    """Valida que la máscara del usuario incluya alguno de los permisos dados."""
+    if not user.has(allowed):
         raise ForbiddenError("Permisos insuficientes.")
 
 
@@ -0,0 +1,90 @@
+"""Preparación del esquema y datos base, separada del arranque de los workers.
+
+    python -m app.core.bootstrap
+
+crea las tablas faltantes, siembra roles y versiones de catálogo y deja el sello de
+versión del esquema. Con APP_STARTUP_BOOTSTRAP=false los workers solo comprueban
+ese sello al arrancar.
+"""
+from __future__ import annotations
+
+from sqlalchemy import Column, MetaData, String, Table, inspect, select
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.core.catalog import ensure_catalog_versions
+from app.core.database import Base, SessionLocal, engine, init_db
+from app.dashboard.services import ensure_admin_counters
+from app.roles.services import ensure_default_roles
+
+
+# Última revisión de alembic/versions. Toda tabla de los modelos tiene su migración, así
+# que create_all + sello y `alembic upgrade head` llegan al mismo esquema
+# (tests/test_explain_indexes.py lo compara en PostgreSQL).
+SCHEMA_VERSION = "007_revoked_tokens_indexes"
+
+# Misma tabla que usa Alembic para su sello, así `alembic upgrade` continúa desde aquí.
+_version_table = Table(
+    "alembic_version",
+    MetaData(),
+    Column("version_num", String(32), primary_key=True),
+)
+
+
+def current_schema_version(connection: Connection) -> str | None:
+    if not inspect(connection).has_table(_version_table.name):
+        return None
+    return connection.execute(select(_version_table.c.version_num)).scalar_one_or_none()
+
+
+def stamp_schema_version(connection: Connection) -> None:
+    """Sella el esquema recién creado; no pisa una revisión distinta de Alembic."""
+    current = current_schema_version(connection)
+    if current == SCHEMA_VERSION:
+        return
+    if current is not None:
+        raise RuntimeError(
+            f"El esquema está en la revisión {current}; ejecutar `alembic upgrade head`."
+        )
+    _version_table.create(connection, checkfirst=True)
+    connection.execute(_version_table.insert().values(version_num=SCHEMA_VERSION))
+
+
+def seed_defaults(db: Session) -> None:
+    """Datos base idempotentes: roles por defecto, versiones de catálogo y contadores."""
+    ensure_default_roles(db)
+    ensure_catalog_versions(db)
+    ensure_admin_counters(db)
+
+
+def bootstrap() -> None:
+    """Crea tablas, siembra datos base y sella la versión del esquema."""
+    init_db(force=True)
+    with engine.begin() as connection:
+        stamp_schema_version(connection)
+    with SessionLocal() as db:
+        seed_defaults(db)
+
+
+def verify_schema_version() -> None:
+    """Comprobación de arranque de los workers: el sello y que existan las tablas."""
+    with engine.connect() as connection:
+        # has_table antes del select: en PostgreSQL un error abortaría la transacción.
+        current = current_schema_version(connection)
+        # Un sello puesto a mano (alembic stamp) no garantiza que las tablas existan.
+        missing = sorted(set(Base.metadata.tables) - set(inspect(connection).get_table_names()))
+    if current != SCHEMA_VERSION:
+        raise RuntimeError(
+            f"Versión de esquema {current or 'ausente'}, se esperaba {SCHEMA_VERSION}; "
+            "ejecutar `alembic upgrade head` o `python -m app.core.bootstrap`."
+        )
+    if missing:
+        raise RuntimeError(
+            f"El esquema está sellado en {SCHEMA_VERSION} pero faltan tablas: {', '.join(missing)}; "
+            "ejecutar `python -m app.core.bootstrap`."
+        )
+
+
+if __name__ == "__main__":
+    bootstrap()
+    print(f"Esquema en {SCHEMA_VERSION}; roles, catálogos y contadores sembrados.")
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+
+from fastapi import Request, Response, status
+from sqlalchemy import String, event, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Mapped, Session, mapped_column
+
+from app.core.config import settings
+from app.core.database import Base
+
+
+CATALOG_TABLES = ("subjects", "periods", "roles")
+_PENDING_KEY = "catalog_versions_bumped"
+
+
+class CatalogVersion(Base):
+    """Versión por tabla de catálogo; la incrementan los servicios que la modifican."""
+
+    __tablename__ = "catalog_versions"
+
+    name: Mapped[str] = mapped_column(String(50), primary_key=True)
+    version: Mapped[int] = mapped_column(default=0, nullable=False)
+
+
+class CatalogVersionCache:
+    """Copia en memoria de las versiones, releída cada APP_CATALOG_VERSION_REFRESH_SECONDS.
+
+    Los cambios hechos en este proceso la expiran al confirmar; los de otros
+    procesos se ven tras el intervalo de refresco. La lectura usa la sesión del
+    llamador, igual que revocation_filter.is_revoked(db, jti).
+    """
+
+    def __init__(self) -> None:
+        self._versions: dict[str, int] = {}
+        self._loaded_at: float | None = None
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(self, db: Session, name: str) -> int:
+        if self._claim_reload():
+            self.load(db)
+        return self._versions.get(name, 0)
+
+    def load(self, db: Session) -> None:
+        generation = self._generation
+        rows = db.execute(select(CatalogVersion.name, CatalogVersion.version)).all()
+        with self._lock:
+            self._versions = {name: version for name, version in rows}
+            # Si hubo un commit local durante la lectura, la próxima consulta relee.
+            self._loaded_at = time.monotonic() if generation == self._generation else None
+
+    def expire(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._loaded_at = None
+
+    def _claim_reload(self) -> bool:
+        loaded_at = self._loaded_at
+        if loaded_at is not None and time.monotonic() - loaded_at <= settings.catalog_version_refresh_seconds:
+            return False
+        with self._lock:
+            if self._loaded_at is None:
+                # Sin carga previa o tras un commit local: el llamador necesita la versión nueva.
+                return True
+            if time.monotonic() - self._loaded_at <= settings.catalog_version_refresh_seconds:
+                return False
+            # Refresco periódico: un solo hilo relee; los demás sirven el dict actual.
+            self._loaded_at = time.monotonic()
+            return True
+
+
+catalog_versions = CatalogVersionCache()
+
+
+def ensure_catalog_versions(db: Session) -> None:
+    """Crea las filas de versión faltantes."""
+    existing = set(db.scalars(select(CatalogVersion.name)))
+    missing = [name for name in CATALOG_TABLES if name not in existing]
+    if not missing:
+        return
+    for name in missing:
+        db.add(CatalogVersion(name=name, version=0))
+    try:
+        db.commit()
+    except IntegrityError:
+        # Otro worker las creó al mismo tiempo.
+        db.rollback()
+
+
+def bump_catalog_version(db: Session, name: str) -> None:
+    """Incrementa la versión de un catálogo dentro de la transacción en curso."""
+    db.execute(
+        update(CatalogVersion)
+        .where(CatalogVersion.name == name)
+        .values(version=CatalogVersion.version + 1)
+    )
+    db.info.setdefault(_PENDING_KEY, set()).add(name)
+
+
+@event.listens_for(Session, "after_commit")
+def _expire_after_commit(session: Session) -> None:
+    if session.info.pop(_PENDING_KEY, None):
+        catalog_versions.expire()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+def catalog_etag(db: Session, name: str, request: Request) -> str:
+    """ETag fuerte: versión del catálogo más los parámetros de consulta."""
+    query = "&".join(f"{key}={value}" for key, value in sorted(request.query_params.multi_items()))
+    digest = hashlib.sha1(query.encode()).hexdigest()[:12]
+    return f'"{name}-{catalog_versions.get(db, name)}-{digest}"'
+
+
+def catalog_cache_headers(etag: str) -> dict[str, str]:
+    return {
+        "ETag": etag,
+        "Cache-Control": f"private, max-age={settings.catalog_cache_max_age_seconds}, must-revalidate",
+    }
+
+
+def not_modified(request: Request, etag: str) -> Response | None:
+    """Respuesta 304 si If-None-Match coincide con el ETag vigente."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return None
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    if "*" in candidates or etag in candidates:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=catalog_cache_headers(etag))
+    return None
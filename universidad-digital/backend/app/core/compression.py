@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import gzip
+from collections.abc import Callable
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+try:  # Dependencias opcionales: sin ellas solo se negocia gzip.
+    import brotli
+except ImportError:  # pragma: no cover - depende del entorno
+    brotli = None
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - depende del entorno
+    zstandard = None
+
+
+_COMPRESSIBLE_TYPES = ("application/json", "text/", "application/xml", "application/javascript")
+# Por encima de este tamaño la compresión sale del event loop.
+_THREADPOOL_MIN_BYTES = 256 * 1024
+
+
+def _gzip(body: bytes) -> bytes:
+    return gzip.compress(body, compresslevel=settings.compression_gzip_level, mtime=0)
+
+
+def _brotli(body: bytes) -> bytes:
+    return brotli.compress(body, quality=settings.compression_brotli_quality)
+
+
+def _zstd(body: bytes) -> bytes:
+    return zstandard.ZstdCompressor(level=settings.compression_zstd_level).compress(body)
+
+
+def available_encoders() -> dict[str, Callable[[bytes], bytes]]:
+    """Codificadores instalados, en el orden de preferencia configurado."""
+    installed: dict[str, Callable[[bytes], bytes]] = {"gzip": _gzip}
+    if brotli is not None:
+        installed["br"] = _brotli
+    if zstandard is not None:
+        installed["zstd"] = _zstd
+    return {name: installed[name] for name in settings.compression_encodings if name in installed}
+
+
+def negotiate_encoding(accept_encoding: str, available: list[str]) -> str | None:
+    """Elige la codificación con mayor q aceptada por el cliente; empata el orden del servidor."""
+    weights: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        weights[name] = quality
+    best: str | None = None
+    best_quality = 0.0
+    for name in available:
+        quality = weights.get(name, weights.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = name, quality
+    return best
+
+
+class CompressionMiddleware:
+    """Comprime respuestas completas (un solo cuerpo) según Accept-Encoding.
+
+    Las respuestas en streaming (exportaciones, reporte de importación), las que ya
+    traen Content-Encoding, las de tipo no textual y las menores a
+    APP_COMPRESSION_MIN_SIZE pasan sin cambios.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self.encoders = available_encoders()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.encoders:
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(
+            Headers(scope=scope).get("accept-encoding", ""), list(self.encoders)
+        )
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressionResponder(send, encoding, self.encoders[encoding])
+        await self.app(scope, receive, responder)
+
+
+class _CompressionResponder:
+    def __init__(self, send: Send, encoding: str, encoder: Callable[[bytes], bytes]) -> None:
+        self.send = send
+        self.encoding = encoding
+        self.encoder = encoder
+        self.start: Message | None = None
+        self.passthrough = False
+
+    async def __call__(self, message: Message) -> None:
+        if self.passthrough:
+            await self.send(message)
+            return
+        if message["type"] == "http.response.start":
+            self.start = message
+            if not self._eligible(Headers(raw=message["headers"]), message.get("status")):
+                await self._pass(None)
+            return
+        if message["type"] != "http.response.body":
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        if message.get("more_body", False) or len(body) < settings.compression_min_size:
+            # Un cuerpo en varias partes es streaming: se transmite tal cual.
+            await self._pass(message)
+            return
+        if len(body) >= _THREADPOOL_MIN_BYTES:
+            compressed = await run_in_threadpool(self.encoder, body)
+        else:
+            compressed = self.encoder(body)
+        headers = MutableHeaders(raw=self.start["headers"])
+        headers["Content-Encoding"] = self.encoding
+        headers["Content-Length"] = str(len(compressed))
+        headers.add_vary_header("Accept-Encoding")
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            # El cuerpo comprimido no es idéntico byte a byte: el ETag pasa a débil.
+            headers["ETag"] = f"W/{etag}"
+        self.passthrough = True
+        await self.send(self.start)
+        await self.send({"type": "http.response.body", "body": compressed})
+
+    def _eligible(self, headers: Headers, status_code: int | None) -> bool:
+        if status_code is None or status_code < 200 or status_code in (204, 304):
+            return False
+        if "content-encoding" in headers or "no-transform" in headers.get("cache-control", ""):
+            return False
+        content_type = headers.get("content-type", "")
+        return content_type.startswith(_COMPRESSIBLE_TYPES)
+
+    async def _pass(self, message: Message | None) -> None:
+        self.passthrough = True
+        if self.start is not None:
+            headers = MutableHeaders(raw=self.start["headers"])
+            if "content-encoding" not in headers:
+                # La respuesta podría variar en otra petición con un cuerpo mayor.
+                headers.add_vary_header("Accept-Encoding")
+            await self.send(self.start)
+        if message is not None:
+            await self.send(message)
@@ -28,12 +28,71 @@ class Settings(BaseSettings):
 
     cors_origins: list[str] = Field(default_factory=list)
 
+    database_async: bool = Field(default=False)
+    database_async_url: str | None = Field(default=None)
+
+    db_pool_size: int = Field(default=10)
+    db_max_overflow: int = Field(default=30)
+    db_pool_timeout_seconds: float = Field(default=30.0)
+    db_pool_recycle_seconds: int = Field(default=1800)
+    db_pool_pre_ping: bool = Field(default=True)
+    db_pool_warmup: int = Field(default=0)
+
+    enrollment_import_batch_size: int = Field(default=1000)
+    export_yield_per: int = Field(default=1000)
+    transcript_cache_max_entries: int = Field(default=50000)
+    catalog_version_refresh_seconds: float = Field(default=2.0)
+    catalog_cache_max_age_seconds: int = Field(default=0)
+    user_name_cache_max_entries: int = Field(default=50000)
+    name_cache_refresh_seconds: float = Field(default=5.0)
+    fast_json: bool = Field(default=False)
+
+    # Conteo de sentencias por petición (X-DB-Queries, Server-Timing); nunca en producción.
+    sql_instrumentation: bool = Field(default=True)
+    sql_repeat_threshold: int = Field(default=10)
+    sql_repeat_raise: bool = Field(default=False)
+
+    # GET /metrics en formato Prometheus y latencia por ruta. Sin valor explícito solo fuera
+    # de producción: el endpoint no tiene autenticación y hay que restringirlo en el proxy.
+    metrics_enabled: bool | None = Field(default=None)
+
+    compression_enabled: bool = Field(default=True)
+    compression_min_size: int = Field(default=1024)
+    compression_encodings: list[str] = Field(default_factory=lambda: ["zstd", "br", "gzip"])
+    compression_gzip_level: int = Field(default=6)
+    compression_brotli_quality: int = Field(default=4)
+    compression_zstd_level: int = Field(default=3)
+
     auto_create_tables: bool = True
+    # false: los workers no crean tablas ni siembran datos; solo verifican el sello de
+    # esquema que deja `python -m app.core.bootstrap` (o `alembic upgrade head`).
+    startup_bootstrap: bool = Field(default=True)
+
+    page_size_default: int = Field(default=100)
+    page_size_max: int = Field(default=500)
+
+    revocation_refresh_seconds: float = Field(default=5.0)
+    revoked_tokens_purge_minutes: int = Field(default=60)
+
+    # Cambios de roles o estado hechos en otro worker se ven en name_cache_refresh_seconds
+    # (sondeo de users.updated_at); el TTL acota además cualquier otra deriva.
+    principal_cache_ttl_seconds: float = Field(default=30.0)
+    principal_cache_max_entries: int = Field(default=10000)
+
+    password_hash_workers: int = Field(default=2)
+    password_hash_queue_size: int = Field(default=8)
+    password_hash_queue_timeout_seconds: float = Field(default=0.5)
 
     @property
     def is_production(self) -> bool:
         return self.env.lower() == "production"
 
+    @property
+    def metrics_active(self) -> bool:
+        if self.metrics_enabled is None:
+            return not self.is_production
+        return self.metrics_enabled
+
     
         
 
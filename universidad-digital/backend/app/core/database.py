@@ -1,29 +1,54 @@
 from __future__ import annotations
 
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 
 from app.core.config import settings
+from app.core.pool import InstrumentedQueuePool
 
 
 class Base(DeclarativeBase):
     pass
 
 
-engine = create_engine(settings.database_url, pool_pre_ping=True)
+_pool_options = {
+    "pool_size": settings.db_pool_size,
+    "max_overflow": settings.db_max_overflow,
+    "pool_timeout": settings.db_pool_timeout_seconds,
+    "pool_recycle": settings.db_pool_recycle_seconds,
+    "pool_pre_ping": settings.db_pool_pre_ping,
+}
+
+engine = create_engine(settings.database_url, poolclass=InstrumentedQueuePool, **_pool_options)
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False, class_=Session)
 
+# Modo asíncrono opcional (APP_DATABASE_ASYNC); psycopg 3 sirve ambos modos con la misma URL.
+async_engine = (
+    create_async_engine(settings.database_async_url or settings.database_url, **_pool_options)
+    if settings.database_async
+    else None
+)
+AsyncSessionLocal = (
+    async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False, class_=AsyncSession)
+    if async_engine is not None
+    else None
+)
+
 
-def init_db() -> None:
-    """Crea tablas automáticamente si está habilitado."""
+def init_db(force: bool = False) -> None:
+    """Crea tablas automáticamente si está habilitado (o siempre con force=True)."""
 
-    if not settings.auto_create_tables:
+    if not (force or settings.auto_create_tables):
         return
     # Importar modelos para registrar en metadata
     from app.auth import models as _auth  # noqa: F401
+    from app.core import catalog as _catalog  # noqa: F401
+    from app.dashboard import models as _dashboard  # noqa: F401
     from app.enrollments import models as _enrollments  # noqa: F401
     from app.grades import models as _grades  # noqa: F401
     from app.periods import models as _periods  # noqa: F401
+    from app.reports import models as _reports  # noqa: F401
     from app.roles import models as _roles  # noqa: F401
     from app.subjects import models as _subjects  # noqa: F401
     from app.users import models as _users  # noqa: F401
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 from typing import Callable
 
 from fastapi import Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.auth.async_services import get_current_user_async
+from app.auth.permissions import ROLE_PERMISSIONS, Permission
+from app.auth.principal import Principal
 from app.auth.services import get_current_user, require_roles
-from app.core.database import SessionLocal
-from app.users.models import User
+from app.core.database import AsyncSessionLocal, SessionLocal
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -22,16 +25,49 @@ def get_db() -> Generator[Session, None, None]:
 
 def get_current_user_dep(
     request: Request, db: Session = Depends(get_db)
-) -> User:
+) -> Principal:
     """Resuelve el usuario autenticado para dependencias."""
     return get_current_user(db, request)
 
 
-def require_roles_dep(*roles: str) -> Callable[[User], User]:
-    """Crea una dependencia de verificación de roles."""
-    allowed = set(roles)
+def _roles_mask(roles: tuple[str, ...]) -> Permission:
+    mask = Permission.NONE
+    for role in roles:
+        mask |= ROLE_PERMISSIONS[role]
+    return mask
 
-    def _dependency(user: User = Depends(get_current_user_dep)) -> User:
+
+def require_roles_dep(*roles: str) -> Callable[[Principal], Principal]:
+    """Crea una dependencia de verificación de roles (comparación de bits)."""
+    allowed = _roles_mask(roles)
+
+    def _dependency(user: Principal = Depends(get_current_user_dep)) -> Principal:
+        require_roles(user, allowed)
+        return user
+
+    return _dependency
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Provee una sesión asíncrona (requiere APP_DATABASE_ASYNC=true)."""
+    if AsyncSessionLocal is None:
+        raise RuntimeError("APP_DATABASE_ASYNC no está habilitado.")
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def get_current_user_async_dep(
+    request: Request, db: AsyncSession = Depends(get_async_db)
+) -> Principal:
+    """Resuelve el usuario autenticado para dependencias asíncronas."""
+    return await get_current_user_async(db, request)
+
+
+def require_roles_async_dep(*roles: str) -> Callable[[Principal], Principal]:
+    """Crea una dependencia asíncrona de verificación de roles."""
+    allowed = _roles_mask(roles)
+
+    async def _dependency(user: Principal = Depends(get_current_user_async_dep)) -> Principal:
         require_roles(user, allowed)
         return user
 
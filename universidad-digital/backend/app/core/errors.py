@@ -26,3 +26,11 @@ class UnauthorizedError(AppError):
 class ForbiddenError(AppError):
     """Acceso denegado por permisos."""
     pass
+
+
+class ServiceUnavailableError(AppError):
+    """Servicio saturado temporalmente; el cliente puede reintentar."""
+
+    def __init__(self, message: str, retry_after: int = 1) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
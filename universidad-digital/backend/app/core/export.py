@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+
+from fastapi import Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+
+
+class ExportFormat(str, Enum):
+    csv = "csv"
+    ndjson = "ndjson"
+
+
+_MEDIA_TYPES = {
+    ExportFormat.csv: "text/csv; charset=utf-8",
+    ExportFormat.ndjson: "application/x-ndjson",
+}
+
+RowTransform = Callable[[Mapping[str, Any]], Mapping[str, Any]]
+
+
+def export_format_dep(
+    export_format: ExportFormat = Query(default=ExportFormat.csv, alias="format"),
+) -> ExportFormat:
+    """Formato de exportación solicitado (`?format=csv|ndjson`)."""
+    return export_format
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Tipo no serializable: {type(value).__name__}")
+
+
+def iter_export(
+    stmt: Select,
+    columns: Sequence[str],
+    export_format: ExportFormat,
+    transform: RowTransform | None = None,
+) -> Iterator[str]:
+    """Recorre la consulta con un cursor del servidor y produce el archivo por partes.
+
+    Usa una sesión propia que vive lo mismo que la descarga; la memoria depende de
+    APP_EXPORT_YIELD_PER y no del total de filas.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if export_format is ExportFormat.csv:
+        # La cabecera sale antes de ejecutar la consulta: el primer byte es inmediato.
+        writer.writerow(columns)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+    db = SessionLocal()
+    try:
+        result = db.execute(stmt, execution_options={"yield_per": settings.export_yield_per})
+        for partition in result.mappings().partitions():
+            for row in partition:
+                data = transform(row) if transform else row
+                if export_format is ExportFormat.csv:
+                    writer.writerow(["" if data[c] is None else data[c] for c in columns])
+                else:
+                    buffer.write(json.dumps({c: data[c] for c in columns}, default=_json_default))
+                    buffer.write("\n")
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    finally:
+        db.close()
+
+
+def export_response(
+    stmt: Select,
+    columns: Sequence[str],
+    export_format: ExportFormat,
+    filename: str,
+    transform: RowTransform | None = None,
+) -> StreamingResponse:
+    """StreamingResponse de una exportación CSV o NDJSON."""
+    return StreamingResponse(
+        iter_export(stmt, columns, export_format, transform),
+        media_type=_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}.{export_format.value}"',
+        },
+    )
@@ -0,0 +1,254 @@
+"""Contadores e histogramas de proceso en formato de texto de Prometheus.
+
+Cada hilo escribe en su propio shard sin tomar locks y el scrape (app.metrics) suma
+todos los shards; el lock solo se usa la primera vez que un hilo registra su shard y al
+leer. Los shards de hilos terminados se pliegan en un acumulador base.
+El módulo solo depende de la biblioteca estándar: lo importan también los procesos
+del pool de hashing a través de app.core.security.
+"""
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+from collections.abc import Iterable, Sequence
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+PASSWORD_BUCKETS = (0.01, 0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 2.0, 5.0)
+
+_Labels = tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _label_text(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+def _accumulate(
+    target: dict[_Labels, list[float]], shard: dict[_Labels, list[float]], size: int
+) -> None:
+    # list() copia bajo el GIL; otro hilo puede agregar etiquetas mientras tanto.
+    for labels, row in list(shard.items()):
+        total = target.setdefault(labels, [0.0] * size)
+        for index, value in enumerate(list(row)):
+            total[index] += value
+
+
+class _Sharded:
+    """Valores por hilo; escribir no toma locks y leer suma los shards registrados.
+
+    AnyIO descarta los hilos ociosos del threadpool y crea otros: cada shard guarda su
+    hilo y, con el lock tomado, los de hilos terminados se suman a `_base` y se descartan.
+    """
+
+    def __init__(self, size: int) -> None:
+        self._size = size
+        self._local = threading.local()
+        self._shards: list[tuple[threading.Thread, dict[_Labels, list[float]]]] = []
+        self._base: dict[_Labels, list[float]] = {}
+        self._lock = threading.Lock()
+
+    def _shard(self) -> dict[_Labels, list[float]]:
+        try:
+            return self._local.values
+        except AttributeError:
+            values: dict[_Labels, list[float]] = {}
+            with self._lock:
+                self._fold_dead()
+                self._shards.append((threading.current_thread(), values))
+            self._local.values = values
+            return values
+
+    def _fold_dead(self) -> None:
+        """Con el lock tomado. Un hilo terminado ya no escribe en su shard."""
+        alive = []
+        for thread, values in self._shards:
+            if thread.is_alive():
+                alive.append((thread, values))
+            else:
+                _accumulate(self._base, values, self._size)
+        self._shards = alive
+
+    def _merged(self) -> dict[_Labels, list[float]]:
+        merged: dict[_Labels, list[float]] = {}
+        with self._lock:
+            self._fold_dead()
+            _accumulate(merged, self._base, self._size)
+            shards = [values for _thread, values in self._shards]
+        for shard in shards:
+            _accumulate(merged, shard, self._size)
+        return merged
+
+
+class Counter(_Sharded):
+    """Contador monotónico con etiquetas."""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(1)
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        REGISTRY.append(self)
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        shard = self._shard()
+        row = shard.get(labels)
+        if row is None:
+            row = shard[labels] = [0.0]
+        row[0] += amount
+
+    def value(self, *labels: str) -> float:
+        return self._merged().get(labels, [0.0])[0]
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} counter"
+        for labels, row in sorted(self._merged().items()):
+            yield f"{self.name}{_label_text(self.labelnames, labels)} {_number(row[0])}"
+
+
+class Histogram(_Sharded):
+    """Cubetas fijas; cada fila guarda conteos por cubeta (no acumulados), suma y total."""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(len(buckets) + 3)
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        REGISTRY.append(self)
+
+    def observe(self, value: float, *labels: str) -> None:
+        shard = self._shard()
+        row = shard.get(labels)
+        if row is None:
+            row = shard[labels] = [0.0] * (len(self.buckets) + 3)
+        row[bisect.bisect_left(self.buckets, value)] += 1
+        row[-2] += value
+        row[-1] += 1
+
+    def render(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} histogram"
+        for labels, row in sorted(self._merged().items()):
+            yield from histogram_lines(
+                self.name, self.labelnames, labels, self.buckets, row[:-2], row[-2], row[-1]
+            )
+
+
+def histogram_lines(
+    name: str,
+    labelnames: Sequence[str],
+    labels: Sequence[str],
+    buckets: Sequence[float],
+    counts: Sequence[float],
+    total: float,
+    count: float,
+) -> Iterable[str]:
+    """Series _bucket (acumuladas), _sum y _count a partir de conteos por cubeta."""
+    cumulative = 0.0
+    for bound, bucket_count in zip((*buckets, float("inf")), counts):
+        cumulative += bucket_count
+        le = f'le="{_number(bound)}"'
+        yield f"{name}_bucket{_label_text(labelnames, labels, le)} {_number(cumulative)}"
+    yield f"{name}_sum{_label_text(labelnames, labels)} {_number(total)}"
+    yield f"{name}_count{_label_text(labelnames, labels)} {_number(count)}"
+
+
+def sample_lines(name: str, documentation: str, value: float, kind: str = "gauge") -> Iterable[str]:
+    """Una métrica sin etiquetas leída en el momento del scrape."""
+    yield f"# HELP {name} {documentation}"
+    yield f"# TYPE {name} {kind}"
+    yield f"{name} {_number(value)}"
+
+
+REGISTRY: list[Counter | Histogram] = []
+
+http_request_duration = Histogram(
+    "http_request_duration_seconds",
+    "Latencia de las peticiones HTTP por ruta y estado.",
+    ("method", "route", "status"),
+)
+password_hash_duration = Histogram(
+    "password_hash_duration_seconds",
+    "Duración de hash y verificación bcrypt, incluida la espera en el pool de procesos.",
+    ("operation",),
+    buckets=PASSWORD_BUCKETS,
+)
+logins_total = Counter("auth_logins_total", "Intentos de login por resultado.", ("result",))
+enrollments_created_total = Counter(
+    "enrollments_created_total", "Inscripciones creadas (individuales e importadas).", ("source",)
+)
+grades_written_total = Counter(
+    "grades_written_total", "Calificaciones registradas o actualizadas.", ("operation",)
+)
+
+
+def render_registry() -> list[str]:
+    lines: list[str] = []
+    for metric in REGISTRY:
+        lines.extend(metric.render())
+    return lines
+
+
+class MetricsMiddleware:
+    """Mide peticiones en curso y latencia por método, plantilla de ruta y estado.
+
+    La plantilla (`/users/{user_id}`) la deja FastAPI en scope["route"] al enrutar; las
+    peticiones sin ruta se agrupan como "unmatched" para acotar la cardinalidad.
+    """
+
+    # Solo se modifica desde el event loop, no necesita lock.
+    in_flight = 0
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        status = 500
+        started = time.perf_counter()
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"] or 500
+            await send(message)
+
+        MetricsMiddleware.in_flight += 1
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            MetricsMiddleware.in_flight -= 1
+            route = scope.get("route")
+            http_request_duration.observe(
+                time.perf_counter() - started,
+                scope["method"],
+                getattr(route, "path", "unmatched"),
+                str(status),
+            )
@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, TypeVar
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.auth.principal import principal_cache
+from app.core.catalog import catalog_versions
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.periods.models import AcademicPeriod
+from app.subjects.models import Subject
+from app.users.models import User
+
+
+# Igual que en el filtro de revocación: un updated_at confirmado tarde puede quedar
+# por detrás de la marca de agua ya observada.
+_REFRESH_OVERLAP = timedelta(seconds=60)
+
+_T = TypeVar("_T")
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+@dataclass
+class ResolvedNames:
+    """Nombres resueltos para un conjunto de filas."""
+
+    subjects: dict[int, str] = field(default_factory=dict)
+    periods: dict[int, str] = field(default_factory=dict)
+    users: dict[int, str] = field(default_factory=dict)
+
+
+class _VersionedTable:
+    """Tabla de catálogo completa (id -> nombre) ligada a su versión en catalog_versions.
+
+    `names` se reemplaza completo, nunca se modifica: se puede leer sin el lock.
+    """
+
+    def __init__(self, catalog: str, model: type[Subject] | type[AcademicPeriod]) -> None:
+        self.catalog = catalog
+        self.model = model
+        self.names: dict[int, str] = {}
+        self.version: int | None = None
+        self.hits = 0
+        self.misses = 0
+
+    def is_current(self, ids: set[int], version: int) -> bool:
+        # Una versión nueva o un id desconocido (alta en otro proceso) obligan a recargar.
+        return version == self.version and ids <= self.names.keys()
+
+    def fetch(self, db: Session) -> dict[int, str]:
+        return {item_id: name for item_id, name in db.execute(select(self.model.id, self.model.name))}
+
+    def stats(self) -> dict[str, int | None]:
+        return {"size": len(self.names), "version": self.version, "hits": self.hits, "misses": self.misses}
+
+
+class NameCache:
+    """Caché en proceso de id -> nombre para materias, periodos y usuarios.
+
+    Materias y periodos se guardan completos y se recargan cuando cambia su versión
+    de catálogo. Los usuarios van en un LRU acotado que se refresca de forma
+    incremental por updated_at.
+    """
+
+    def __init__(self) -> None:
+        self.subjects = _VersionedTable("subjects", Subject)
+        self.periods = _VersionedTable("periods", AcademicPeriod)
+        self._users: OrderedDict[int, str] = OrderedDict()
+        self._users_watermark: datetime | None = None
+        self._users_refreshed = 0.0
+        self._lock = threading.Lock()
+        self.user_hits = 0
+        self.user_misses = 0
+
+    def warm(self, db: Session) -> None:
+        """Carga materias, periodos y los usuarios más recientes hasta el límite del LRU."""
+        # Versiones antes que filas: si cambian durante la carga, la próxima consulta recarga.
+        tables = [(table, catalog_versions.get(db, table.catalog)) for table in (self.subjects, self.periods)]
+        loaded = [(table, version, table.fetch(db)) for table, version in tables]
+        watermark = datetime.now(timezone.utc)
+        limit = settings.user_name_cache_max_entries
+        rows = (
+            db.execute(select(User.id, User.full_name).order_by(User.id.desc()).limit(limit)).all()
+            if limit > 0
+            else []
+        )
+        with self._lock:
+            for table, version, names in loaded:
+                table.names, table.version = names, version
+            self._users_watermark = watermark
+            self._users_refreshed = time.monotonic()
+            self._users = OrderedDict((user_id, name) for user_id, name in reversed(rows))
+
+    def resolve(
+        self,
+        db: Session,
+        subject_ids: Iterable[int] = (),
+        period_ids: Iterable[int] = (),
+        user_ids: Iterable[int | None] = (),
+    ) -> ResolvedNames:
+        """Resuelve nombres; solo los ids ausentes de la caché se consultan (un IN por tabla)."""
+        resolved = ResolvedNames()
+        subject_set = set(subject_ids)
+        period_set = set(period_ids)
+        user_set = {user_id for user_id in user_ids if user_id is not None}
+        if subject_set:
+            resolved.subjects = self._resolve_table(db, self.subjects, subject_set)
+        if period_set:
+            resolved.periods = self._resolve_table(db, self.periods, period_set)
+        if user_set:
+            resolved.users = self._resolve_users(db, user_set)
+        return resolved
+
+    def invalidate_user(self, user_id: int) -> None:
+        with self._lock:
+            self._users.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.subjects.version = None
+            self.periods.version = None
+            self._users.clear()
+
+    def stats(self) -> dict[str, dict[str, int | None]]:
+        return {
+            "subjects": self.subjects.stats(),
+            "periods": self.periods.stats(),
+            "users": {
+                "size": len(self._users),
+                "max_entries": settings.user_name_cache_max_entries,
+                "hits": self.user_hits,
+                "misses": self.user_misses,
+            },
+        }
+
+    def _resolve_table(self, db: Session, table: _VersionedTable, ids: set[int]) -> dict[int, str]:
+        # Versión y recarga se consultan fuera del lock; solo el reemplazo ocurre dentro.
+        version = catalog_versions.get(db, table.catalog)
+        with self._lock:
+            current = table.is_current(ids, version)
+            if current:
+                table.hits += len(ids)
+            else:
+                table.misses += len(ids)
+            names = table.names
+        if not current:
+            names = table.fetch(db)
+            with self._lock:
+                table.names, table.version = names, version
+        return {item_id: names[item_id] for item_id in ids if item_id in names}
+
+    def _resolve_users(self, db: Session, ids: set[int]) -> dict[int, str]:
+        self.refresh_users(db)
+        found: dict[int, str] = {}
+        with self._lock:
+            users = self._users
+            for user_id in ids:
+                name = users.get(user_id)
+                if name is not None:
+                    users.move_to_end(user_id)
+                    found[user_id] = name
+            missing = ids - found.keys()
+            self.user_hits += len(found)
+            self.user_misses += len(missing)
+        if missing:
+            # La consulta de los faltantes se hace fuera del lock.
+            rows = db.execute(select(User.id, User.full_name).where(User.id.in_(missing))).all()
+            with self._lock:
+                for user_id, name in rows:
+                    found[user_id] = name
+                    self._put_user(user_id, name)
+        return found
+
+    def _put_user(self, user_id: int, name: str) -> None:
+        limit = settings.user_name_cache_max_entries
+        if limit <= 0:
+            return
+        self._users[user_id] = name
+        self._users.move_to_end(user_id)
+        while len(self._users) > limit:
+            self._users.popitem(last=False)
+
+    def refresh_users(self, db: Session) -> None:
+        """Sondea cada APP_NAME_CACHE_REFRESH_SECONDS los usuarios modificados en otros procesos.
+
+        Actualiza sus nombres cacheados y descarta sus principales: un cambio de roles,
+        estado o token_version también actualiza updated_at. get_current_user la llama en
+        cada petición, así que una máscara desactualizada deja de aceptarse en ese plazo.
+        """
+        with self._lock:
+            if time.monotonic() - self._users_refreshed < settings.name_cache_refresh_seconds:
+                return
+            # Un solo hilo refresca; los demás siguen con la copia actual.
+            self._users_refreshed = time.monotonic()
+            watermark = self._users_watermark
+            if watermark is None:
+                self._users_watermark = datetime.now(timezone.utc)
+                return
+        rows = db.execute(
+            select(User.id, User.full_name, User.updated_at).where(
+                User.updated_at >= watermark - _REFRESH_OVERLAP
+            )
+        ).all()
+        for user_id, _name, _updated_at in rows:
+            principal_cache.invalidate_user(user_id)
+        with self._lock:
+            for user_id, name, updated_at in rows:
+                if user_id in self._users:
+                    self._users[user_id] = name
+                if updated_at and _as_utc(updated_at) > self._users_watermark:
+                    self._users_watermark = _as_utc(updated_at)
+
+
+async def resolve_names_in_threadpool(resolve: Callable[..., _T], *args: Any) -> _T:
+    """Ejecuta `resolve(db, *args)` en el threadpool con una sesión síncrona propia.
+
+    Para las rutas asíncronas: versiones de catálogo y fallos de caché se consultan con el
+    engine síncrono y pueden esperar el lock, nada de lo cual debe correr en el event loop.
+    """
+
+    def run() -> _T:
+        with SessionLocal() as db:
+            return resolve(db, *args)
+
+    return await run_in_threadpool(run)
+
+
+name_cache = NameCache()
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import base64
+import binascii
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from fastapi import Query, Response
+from sqlalchemy import Select
+from sqlalchemy.orm import InstrumentedAttribute
+
+from app.core.config import settings
+from app.core.errors import AppError
+
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+_CURSOR_PREFIX = "id:"
+
+
+@dataclass(frozen=True)
+class PageParams:
+    """Parámetros de paginación por cursor (keyset sobre el id)."""
+
+    limit: int | None
+    after_id: int | None = None
+
+
+def encode_cursor(last_id: int) -> str:
+    """Codifica el último id entregado como cursor opaco."""
+    raw = f"{_CURSOR_PREFIX}{last_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    """Decodifica un cursor opaco y retorna el id a partir del cual continuar."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise AppError("Cursor inválido.") from exc
+    if not raw.startswith(_CURSOR_PREFIX) or not raw[len(_CURSOR_PREFIX):].isdigit():
+        raise AppError("Cursor inválido.")
+    return int(raw[len(_CURSOR_PREFIX):])
+
+
+def page_params_dep(
+    limit: int = Query(default=settings.page_size_default, ge=1, le=settings.page_size_max),
+    after: str | None = Query(default=None),
+    unpaginated: bool = Query(default=False, alias="all"),
+) -> PageParams:
+    """Dependencia que resuelve limit/after; `all=true` conserva el listado completo."""
+    if unpaginated:
+        return PageParams(limit=None)
+    return PageParams(limit=limit, after_id=decode_cursor(after) if after else None)
+
+
+def apply_page(stmt: Select, id_column: InstrumentedAttribute, page: PageParams | None) -> Select:
+    """Aplica orden por id, el límite y la condición keyset a una consulta."""
+    stmt = stmt.order_by(id_column)
+    if page is None:
+        return stmt
+    if page.after_id is not None:
+        stmt = stmt.where(id_column > page.after_id)
+    if page.limit is not None:
+        stmt = stmt.limit(page.limit)
+    return stmt
+
+
+def set_next_cursor(response: Response, items: Sequence[Any], page: PageParams) -> None:
+    """Publica el cursor siguiente en la cabecera cuando la página está llena."""
+    if page.limit is None or len(items) < page.limit:
+        return
+    last = items[-1]
+    last_id = last["id"] if isinstance(last, Mapping) else last.id
+    response.headers[NEXT_CURSOR_HEADER] = encode_cursor(last_id)
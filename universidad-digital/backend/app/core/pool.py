@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import bisect
+import itertools
+import threading
+import time
+from typing import Any
+
+from sqlalchemy import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+
+# Límites superiores (ms) del histograma de latencia de checkout.
+CHECKOUT_BUCKETS_MS = (0.1, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+
+class PoolMetrics:
+    """Latencia de checkout (espera + conexión) en un histograma acumulado de cubetas fijas."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.bucket_counts = [0] * (len(CHECKOUT_BUCKETS_MS) + 1)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.connect_errors = 0
+        self.wait_total_ms = 0.0
+        self.wait_max_ms = 0.0
+
+    def observe(self, elapsed_ms: float) -> None:
+        index = bisect.bisect_left(CHECKOUT_BUCKETS_MS, elapsed_ms)
+        with self._lock:
+            self.bucket_counts[index] += 1
+            self.checkouts += 1
+            self.wait_total_ms += elapsed_ms
+            if elapsed_ms > self.wait_max_ms:
+                self.wait_max_ms = elapsed_ms
+
+    def timeout(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def connect_error(self) -> None:
+        with self._lock:
+            self.connect_errors += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            counts = list(itertools.accumulate(self.bucket_counts))
+            checkouts = self.checkouts
+            return {
+                "checkouts": checkouts,
+                "timeouts": self.timeouts,
+                "connect_errors": self.connect_errors,
+                "wait_avg_ms": round(self.wait_total_ms / checkouts, 3) if checkouts else 0.0,
+                "wait_max_ms": round(self.wait_max_ms, 3),
+                "checkout_latency_ms": {
+                    **{f"le_{bound}": count for bound, count in zip(CHECKOUT_BUCKETS_MS, counts)},
+                    "le_inf": counts[-1],
+                },
+            }
+
+
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool que mide cuánto tarda cada checkout en obtener una conexión."""
+
+    def _do_get(self):  # type: ignore[no-untyped-def]
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            pool_metrics.timeout()
+            raise
+        except Exception:
+            # Conexión rechazada, autenticación fallida, etc.: no es espera en el pool.
+            pool_metrics.connect_error()
+            raise
+        pool_metrics.observe((time.perf_counter() - started) * 1000)
+        return connection
+
+
+def pool_stats(engine: Engine) -> dict[str, Any]:
+    """Estado actual del pool y métricas de checkout."""
+    pool = engine.pool
+    stats: dict[str, Any] = {"pool_class": type(pool).__name__, "status": pool.status()}
+    if isinstance(pool, QueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=pool.overflow(),
+        )
+    stats.update(pool_metrics.snapshot())
+    return stats
+
+
+def warm_up_pool(engine: Engine, connections: int) -> int:
+    """Abre conexiones por adelantado para que las primeras requests no paguen el connect."""
+    opened = []
+    try:
+        for _ in range(connections):
+            opened.append(engine.connect())
+    finally:
+        for connection in opened:
+            connection.close()
+    return len(opened)
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import logging
+import re
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import Engine, event
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+DB_QUERIES_HEADER = "X-DB-Queries"
+SERVER_TIMING_HEADER = "Server-Timing"
+
+# Listas de parámetros expandidas (IN) de cualquier estilo: ?, %s, %(x)s, :x, $1.
+_PARAM_LIST = re.compile(r"\(\s*(?:\?|%s|%\(\w+\)s|:\w+|\$\d+)(?:\s*,\s*(?:\?|%s|%\(\w+\)s|:\w+|\$\d+))*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+class RepeatedQueryError(RuntimeError):
+    """Una misma forma de sentencia se repitió más de lo permitido en una petición."""
+
+
+@dataclass
+class QueryStats:
+    """Sentencias y tiempo de base de datos acumulados en una petición o bloque."""
+
+    count: int = 0
+    duration_ms: float = 0.0
+    shapes: Counter[str] = field(default_factory=Counter)
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Formas de sentencia ejecutadas más de `threshold` veces (posible N+1)."""
+        return [(shape, times) for shape, times in self.shapes.most_common() if times > threshold]
+
+
+_current: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def statement_shape(statement: str) -> str:
+    """Normaliza una sentencia para agrupar ejecuciones que solo difieren en parámetros."""
+    return _PARAM_LIST.sub("(?)", _WHITESPACE.sub(" ", statement).strip())
+
+
+def _before_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+    stats = _current.get()
+    if stats is None:
+        return
+    conn.info.setdefault("query_stats_started", []).append(time.perf_counter())
+    stats.count += 1
+    stats.shapes[statement_shape(statement)] += 1
+
+
+def _after_cursor_execute(conn: Any, cursor: Any, statement: str, parameters: Any, context: Any, executemany: bool) -> None:
+    stats = _current.get()
+    started = conn.info.get("query_stats_started")
+    if stats is None or not started:
+        return
+    stats.duration_ms += (time.perf_counter() - started.pop()) * 1000
+
+
+def install_query_listeners(*engines: Engine | None) -> None:
+    """Registra los hooks de conteo; sin QueryStats activo solo cuestan un ContextVar.get()."""
+    for engine in engines:
+        if engine is None or event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+            continue
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+@contextmanager
+def query_stats() -> Iterator[QueryStats]:
+    """Cuenta las sentencias ejecutadas dentro del bloque (scripts y pruebas)."""
+    stats = QueryStats()
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+def _check_repeated(stats: QueryStats, path: str) -> None:
+    threshold = settings.sql_repeat_threshold
+    if threshold <= 0:
+        return
+    repeated = stats.repeated(threshold)
+    if not repeated:
+        return
+    detail = "; ".join(f"{times}x {shape[:200]}" for shape, times in repeated)
+    if settings.sql_repeat_raise:
+        raise RepeatedQueryError(f"{path}: sentencias repetidas (posible N+1): {detail}")
+    logger.warning("%s: sentencias repetidas (posible N+1): %s", path, detail)
+
+
+class QueryStatsMiddleware:
+    """Expone sentencias y tiempo de BD por petición en X-DB-Queries y Server-Timing.
+
+    Las sentencias de la limpieza de dependencias (cierre de sesión) corren después de
+    enviar las cabeceras y no se incluyen; sí cuentan para el detector de repeticiones.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        stats = QueryStats()
+        token = _current.set(stats)
+        started = time.perf_counter()
+
+        async def send_with_stats(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(raw=message["headers"])
+                total_ms = (time.perf_counter() - started) * 1000
+                headers[DB_QUERIES_HEADER] = str(stats.count)
+                headers.append(
+                    SERVER_TIMING_HEADER,
+                    f'db;dur={stats.duration_ms:.2f};desc="{stats.count} queries", app;dur={total_ms:.2f}',
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_stats)
+        finally:
+            _current.reset(token)
+        _check_repeated(stats, scope.get("path", ""))
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Mapping, Sequence
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+
+from app.core.config import settings
+
+try:  # Dependencia opcional; sin ella se usa json de la librería estándar.
+    import orjson
+except ImportError:  # pragma: no cover - depende del entorno
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        # Igual que Pydantic en modo JSON: los Decimal se emiten como texto.
+        return str(value)
+    if isinstance(value, datetime):
+        text = value.isoformat()
+        # Igual que Pydantic y orjson con OPT_UTC_Z: UTC se emite con sufijo Z.
+        return text[:-6] + "Z" if text.endswith("+00:00") else text
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"Tipo no serializable: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """Serializa a JSON con orjson si está disponible."""
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_UTC_Z)
+    return json.dumps(content, default=_default, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse que serializa dicts ya armados sin pasar por Pydantic."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def list_response(
+    response: Response, rows: Sequence[Mapping[str, Any]]
+) -> Sequence[Mapping[str, Any]] | FastJSONResponse:
+    """Respuesta de un listado cuyas filas ya tienen la forma del esquema.
+
+    Por defecto retorna las filas y FastAPI las valida una sola vez con response_model.
+    Con APP_FAST_JSON se serializan directamente, conservando las cabeceras ya fijadas
+    (cursor, ETag).
+    """
+    if not settings.fast_json:
+        return rows
+    headers = {
+        key: value
+        for key, value in response.headers.items()
+        if key not in ("content-length", "content-type")
+    }
+    return FastJSONResponse(list(rows), headers=headers)
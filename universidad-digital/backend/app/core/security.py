@@ -1,38 +1,155 @@
 from __future__ import annotations
 
+import logging
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timedelta, timezone
-from typing import Any
-
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
 
 from app.core.config import settings
-
-
-_pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from app.core.errors import ServiceUnavailableError
+from app.core.metrics import password_hash_duration
+
+if TYPE_CHECKING:
+    from passlib.context import CryptContext
+
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+# jose y passlib se importan al primer uso: no pesan en el arranque de cada worker
+# ni en los procesos del pool de hashing hasta que hacen falta.
+@lru_cache(maxsize=1)
+def _pwd_context() -> CryptContext:
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+def _hash_sync(password: str) -> str:
+    return _pwd_context().hash(password)
+
+
+def _verify_sync(password: str, hashed_password: str) -> bool:
+    return _pwd_context().verify(password, hashed_password)
+
+
+class _PasswordPool:
+    """Pool de procesos acotado para bcrypt con rechazo explícito al saturarse."""
+
+    def __init__(self) -> None:
+        self._executor: ProcessPoolExecutor | None = None
+        self._slots: threading.BoundedSemaphore | None = None
+        self._lock = threading.Lock()
+
+    def _ensure(self) -> tuple[ProcessPoolExecutor, threading.BoundedSemaphore]:
+        with self._lock:
+            if self._executor is None or self._slots is None:
+                workers = settings.password_hash_workers
+                self._executor = ProcessPoolExecutor(
+                    max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+                )
+                self._slots = threading.BoundedSemaphore(
+                    workers + settings.password_hash_queue_size
+                )
+            return self._executor, self._slots
+
+    def run(self, fn: Callable[..., _T], *args: Any) -> _T:
+        if settings.password_hash_workers <= 0:
+            return fn(*args)
+        executor, slots = self._ensure()
+        try:
+            return self._submit(executor, slots, fn, *args)
+        except BrokenProcessPool:
+            # Murió un proceso hijo (OOM, segfault): ese executor ya no acepta trabajo.
+            logger.warning("Pool de hashing roto; se recrea y se reintenta una vez.")
+            self._discard(executor)
+            executor, slots = self._ensure()
+            return self._submit(executor, slots, fn, *args)
+
+    def _discard(self, executor: ProcessPoolExecutor) -> None:
+        """Descarta un executor roto salvo que otro hilo ya lo haya reemplazado."""
+        with self._lock:
+            if self._executor is not executor:
+                return
+            executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            self._slots = None
+
+    @staticmethod
+    def _submit(
+        executor: ProcessPoolExecutor,
+        slots: threading.BoundedSemaphore,
+        fn: Callable[..., _T],
+        *args: Any,
+    ) -> _T:
+        if not slots.acquire(timeout=settings.password_hash_queue_timeout_seconds):
+            raise ServiceUnavailableError("Servicio de autenticación saturado, reintente.")
+        try:
+            future: Future[_T] = executor.submit(fn, *args)
+            return future.result()
+        finally:
+            slots.release()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            self._slots = None
+
+
+_password_pool = _PasswordPool()
 
 
 def hash_password(password: str) -> str:
     """Genera un hash seguro para contraseñas."""
 
-    return _pwd_context.hash(password)
+    started = time.perf_counter()
+    try:
+        return _password_pool.run(_hash_sync, password)
+    finally:
+        password_hash_duration.observe(time.perf_counter() - started, "hash")
 
 
 def verify_password(password: str, hashed_password: str) -> bool:
     """Verifica una contraseña contra su hash."""
 
-    return _pwd_context.verify(password, hashed_password)
+    started = time.perf_counter()
+    try:
+        return _password_pool.run(_verify_sync, password, hashed_password)
+    finally:
+        password_hash_duration.observe(time.perf_counter() - started, "verify")
+
+
+def shutdown_password_pool() -> None:
+    """Detiene los procesos de hashing (apagado de la aplicación)."""
 
+    _password_pool.shutdown()
 
-def create_access_token(subject: str, jti: str, expires_minutes: int | None = None) -> str:
-    """Crea un JWT firmado."""
+
+def create_access_token(
+    subject: str,
+    jti: str,
+    expires_minutes: int | None = None,
+    claims: dict[str, Any] | None = None,
+) -> str:
+    """Crea un JWT firmado; `claims` agrega campos adicionales al payload."""
 
     expires = datetime.now(timezone.utc) + timedelta(
         minutes=expires_minutes or settings.jwt_expiration_minutes
     )
     if not settings.jwt_secret:
         raise RuntimeError("APP_JWT_SECRET no configurado.")
-    payload: dict[str, Any] = {"sub": subject, "jti": jti, "exp": expires}
+    payload: dict[str, Any] = {**(claims or {}), "sub": subject, "jti": jti, "exp": expires}
+    from jose import jwt
+
     return jwt.encode(payload, settings.jwt_secret, algorithm=settings.jwt_algorithm)
 
 
@@ -41,8 +158,12 @@ def decode_access_token(token: str) -> dict[str, Any]:
 
     if not settings.jwt_secret:
         raise RuntimeError("APP_JWT_SECRET no configurado.")
+    from jose import jwt
+
     return jwt.decode(token, settings.jwt_secret, algorithms=[settings.jwt_algorithm])
 
 
 def is_jwt_error(exc: Exception) -> bool:
+    from jose import JWTError
+
     return isinstance(exc, JWTError)
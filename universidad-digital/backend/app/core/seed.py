@@ -0,0 +1,279 @@
+"""Generador determinista de datos a escala universitaria.
+
+    python -m app.core.seed --scale 1.0          # 100k estudiantes, 2k docentes, ...
+    python -m app.core.seed --scale 0.01 --seed 7
+
+Carga usuarios, user_roles, materias, periodos, inscripciones y calificaciones con
+COPY en PostgreSQL (executemany por lotes en otros motores), sin pasar por los
+servicios. Las contraseñas salen de un pool pequeño hasheado una sola vez:
+seed_password(user_id, pool). Los ids se asignan a partir del máximo existente, así
+que correr el seeder de nuevo agrega datos sin violar restricciones únicas.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import asdict, dataclass, fields, replace
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import Table, func, select, text
+from sqlalchemy.engine import Connection
+
+from app.core.bootstrap import bootstrap
+from app.core.catalog import bump_catalog_version
+from app.core.database import SessionLocal, engine
+from app.core.security import hash_password
+from app.dashboard.services import reconcile_admin_counters
+from app.enrollments.models import Enrollment
+from app.grades.models import Grade
+from app.periods.models import AcademicPeriod
+from app.roles.models import Role, UserRole
+from app.subjects.models import Subject
+from app.users.models import User
+
+
+_GRADE_VALUES = [Decimal(value).scaleb(-2) for value in range(3000, 10001)]
+_SCALED_FIELDS = ("students", "teachers", "admins", "subjects")
+
+
+@dataclass(frozen=True)
+class SeedConfig:
+    """Tamaño del conjunto; --scale multiplica estudiantes, docentes, admins y materias."""
+
+    students: int = 100_000
+    teachers: int = 2_000
+    admins: int = 5
+    subjects: int = 3_000
+    periods: int = 20
+    periods_per_student: int = 4
+    subjects_per_period: int = 5
+    grades_per_enrollment: int = 3
+    active_ratio: float = 0.95
+    password_pool: int = 8
+    batch_size: int = 10_000
+    seed: int = 20240101
+
+    def scaled(self, factor: float) -> SeedConfig:
+        return replace(
+            self, **{name: max(1, int(getattr(self, name) * factor)) for name in _SCALED_FIELDS}
+        )
+
+
+def seed_password(user_id: int, pool: int) -> str:
+    """Contraseña en claro de un usuario sembrado (12 caracteres, válida para todo rol)."""
+    return f"SeedPass{user_id % pool:04d}"
+
+
+def _next_id(connection: Connection, table: Table) -> int:
+    return (connection.execute(select(func.max(table.c.id))).scalar() or 0) + 1
+
+
+def _load(
+    connection: Connection,
+    table: Table,
+    columns: Sequence[str],
+    rows: Iterable[tuple[Any, ...]],
+    batch_size: int,
+) -> int:
+    """Inserta filas con COPY (PostgreSQL) o executemany por lotes."""
+    count = 0
+    if connection.dialect.name == "postgresql":
+        raw = connection.connection.driver_connection
+        statement = f"COPY {table.name} ({', '.join(columns)}) FROM STDIN"
+        with raw.cursor() as cursor, cursor.copy(statement) as copy:
+            for row in rows:
+                copy.write_row(row)
+                count += 1
+        return count
+    insert = table.insert()
+    batch: list[dict[str, Any]] = []
+    for row in rows:
+        batch.append(dict(zip(columns, row)))
+        if len(batch) >= batch_size:
+            connection.execute(insert, batch)
+            count += len(batch)
+            batch = []
+    if batch:
+        connection.execute(insert, batch)
+        count += len(batch)
+    return count
+
+
+def _sync_sequences(connection: Connection, tables: Iterable[Table]) -> None:
+    """Los ids explícitos no avanzan las secuencias de PostgreSQL."""
+    if connection.dialect.name != "postgresql":
+        return
+    for table in tables:
+        connection.execute(
+            text(
+                f"SELECT setval(pg_get_serial_sequence('{table.name}', 'id'), "
+                f"(SELECT max(id) FROM {table.name}))"
+            )
+        )
+
+
+def seed_database(config: SeedConfig) -> dict[str, Any]:
+    """Genera y carga el conjunto completo en una transacción; retorna conteos y tiempos."""
+    bootstrap()
+    rng = random.Random(config.seed)
+    timings: dict[str, float] = {}
+    counts: dict[str, int] = {}
+
+    def timed(name: str, loader: Iterator[tuple[Any, ...]] | list[tuple[Any, ...]], table: Table, columns: Sequence[str]) -> None:
+        started = time.perf_counter()
+        counts[name] = _load(connection, table, columns, loader, config.batch_size)
+        timings[name] = round(time.perf_counter() - started, 2)
+
+    started = time.perf_counter()
+    hashes = [hash_password(seed_password(index, config.password_pool)) for index in range(config.password_pool)]
+    timings["password_pool"] = round(time.perf_counter() - started, 2)
+
+    users_table = User.__table__
+    with engine.begin() as connection:
+        role_ids = dict(connection.execute(select(Role.name, Role.id)).all())
+        first_user = _next_id(connection, users_table)
+        groups = (
+            ("admin", "Administrador", config.admins),
+            ("teacher", "Docente", config.teachers),
+            ("student", "Estudiante", config.students),
+        )
+        ranges: dict[str, range] = {}
+        next_user = first_user
+        for prefix, _role, count in groups:
+            ranges[prefix] = range(next_user, next_user + count)
+            next_user += count
+
+        def user_rows() -> Iterator[tuple[Any, ...]]:
+            for prefix, _role, _count in groups:
+                label = prefix.capitalize()
+                for user_id in ranges[prefix]:
+                    yield (
+                        user_id,
+                        f"{prefix}{user_id}@seed.ud.edu",
+                        f"{label} {user_id}",
+                        hashes[user_id % config.password_pool],
+                        True,
+                    )
+
+        def user_role_rows() -> Iterator[tuple[Any, ...]]:
+            for prefix, role, _count in groups:
+                for user_id in ranges[prefix]:
+                    yield (user_id, role_ids[role])
+
+        timed("users", user_rows(), users_table, ("id", "email", "full_name", "hashed_password", "is_active"))
+        timed("user_roles", user_role_rows(), UserRole.__table__, ("user_id", "role_id"))
+
+        first_subject = _next_id(connection, Subject.__table__)
+        subject_ids = range(first_subject, first_subject + config.subjects)
+        timed(
+            "subjects",
+            [(sid, f"S{sid:06d}", f"Materia {sid}", 2 + sid % 5, True) for sid in subject_ids],
+            Subject.__table__,
+            ("id", "code", "name", "credits", "is_active"),
+        )
+
+        first_period = _next_id(connection, AcademicPeriod.__table__)
+        period_ids = range(first_period, first_period + config.periods)
+        origin = date(2016, 1, 1)
+        timed(
+            "periods",
+            [
+                (
+                    pid,
+                    f"P{pid:05d}",
+                    f"Periodo {origin.year + index // 2}-{index % 2 + 1}",
+                    origin + timedelta(days=182 * index),
+                    origin + timedelta(days=182 * index + 150),
+                    index == config.periods - 1,
+                )
+                for index, pid in enumerate(period_ids)
+            ],
+            AcademicPeriod.__table__,
+            ("id", "code", "name", "start_date", "end_date", "is_active"),
+        )
+
+        # Cada materia la dicta un docente fijo; (estudiante, materia, periodo) nunca se repite.
+        teacher_ids = ranges["teacher"]
+        first_enrollment = _next_id(connection, Enrollment.__table__)
+        periods_per_student = min(config.periods_per_student, config.periods)
+        subjects_per_period = min(config.subjects_per_period, config.subjects)
+
+        def enrollment_rows() -> Iterator[tuple[Any, ...]]:
+            enrollment_id = first_enrollment
+            for student_id in ranges["student"]:
+                for period_id in rng.sample(period_ids, periods_per_student):
+                    for subject_id in rng.sample(subject_ids, subjects_per_period):
+                        yield (
+                            enrollment_id,
+                            student_id,
+                            subject_id,
+                            period_id,
+                            teacher_ids[subject_id % len(teacher_ids)],
+                            rng.random() < config.active_ratio,
+                        )
+                        enrollment_id += 1
+
+        timed(
+            "enrollments",
+            enrollment_rows(),
+            Enrollment.__table__,
+            ("id", "user_id", "subject_id", "period_id", "teacher_id", "is_active"),
+        )
+
+        first_grade = _next_id(connection, Grade.__table__)
+        enrollment_count = counts["enrollments"]
+
+        def grade_rows() -> Iterator[tuple[Any, ...]]:
+            grade_id = first_grade
+            choice = rng.choice
+            for enrollment_id in range(first_enrollment, first_enrollment + enrollment_count):
+                for _ in range(config.grades_per_enrollment):
+                    yield (grade_id, enrollment_id, choice(_GRADE_VALUES))
+                    grade_id += 1
+
+        timed("grades", grade_rows(), Grade.__table__, ("id", "enrollment_id", "value"))
+        _sync_sequences(
+            connection,
+            (users_table, UserRole.__table__, Subject.__table__, AcademicPeriod.__table__, Enrollment.__table__, Grade.__table__),
+        )
+
+    with SessionLocal() as db:
+        bump_catalog_version(db, "subjects")
+        bump_catalog_version(db, "periods")
+        db.commit()
+        reconcile_admin_counters(db)
+
+    return {
+        "config": asdict(config),
+        "counts": counts,
+        "seconds": timings,
+        "first_ids": {"users": first_user, "subjects": first_subject, "periods": first_period},
+        "password": f"seed_password(user_id, {config.password_pool}) = SeedPass{{user_id % {config.password_pool}:04d}}",
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=float, default=1.0)
+    for item in fields(SeedConfig):
+        parser.add_argument(
+            f"--{item.name.replace('_', '-')}", type=type(item.default), default=None, dest=item.name
+        )
+    args = parser.parse_args()
+
+    config = SeedConfig().scaled(args.scale)
+    overrides = {item.name: getattr(args, item.name) for item in fields(SeedConfig) if getattr(args, item.name) is not None}
+    config = replace(config, **overrides)
+    started = time.perf_counter()
+    summary = seed_database(config)
+    summary["total_seconds"] = round(time.perf_counter() - started, 2)
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
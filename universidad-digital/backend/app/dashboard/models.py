@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class AdminDashboardCounters(Base):
+    """Contadores del dashboard administrador mantenidos por los servicios (fila única)."""
+
+    __tablename__ = "admin_dashboard_counters"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    total_users: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    total_students: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    total_teachers: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    total_subjects: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    inactive_subjects: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    active_periods: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    reconciled_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
@@ -1,9 +1,19 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
+from app.core.database import engine
 from app.core.deps import get_db, require_roles_dep
-from app.dashboard.services import get_admin_dashboard, get_teacher_dashboard, get_student_dashboard
-from app.dashboard.schemas import AdminDashboardResponse
+from app.auth.principal import principal_cache
+from app.core.names import name_cache
+from app.core.pool import pool_stats
+from app.transcripts.services import transcript_cache
+from app.dashboard.services import (
+    get_admin_dashboard,
+    get_student_dashboard,
+    get_teacher_dashboard,
+    reconcile_admin_counters,
+)
+from app.dashboard.schemas import AdminCountersReconcileResponse, AdminDashboardResponse
 
 
 
@@ -18,6 +28,32 @@ def admin_dashboard(
     return get_admin_dashboard(db)
 
 
+@router.post("/admin/reconcile", response_model=AdminCountersReconcileResponse)
+def admin_dashboard_reconcile(
+    db: Session = Depends(get_db),
+    _admin=Depends(require_roles_dep("Administrador")),
+):
+    return {"drift": reconcile_admin_counters(db)}
+
+
+@router.get("/admin/db-pool")
+def admin_db_pool(
+    _admin=Depends(require_roles_dep("Administrador")),
+):
+    return pool_stats(engine)
+
+
+@router.get("/admin/caches")
+def admin_caches(
+    _admin=Depends(require_roles_dep("Administrador")),
+):
+    return {
+        "names": name_cache.stats(),
+        "principals": principal_cache.stats(),
+        "transcripts": transcript_cache.stats(),
+    }
+
+
 @router.get("/teacher")
 def teacher_dashboard(
     db: Session = Depends(get_db),
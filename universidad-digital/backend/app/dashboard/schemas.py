@@ -8,3 +8,7 @@ class AdminDashboardResponse(BaseModel):
     total_subjects: int
     inactive_subjects: int
     active_periods: int
+
+
+class AdminCountersReconcileResponse(BaseModel):
+    drift: dict[str, int]
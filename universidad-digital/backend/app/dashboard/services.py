@@ -1,16 +1,38 @@
+import logging
+from datetime import datetime, timezone
+
 from sqlalchemy.orm import Session
-from sqlalchemy import func, true
+from sqlalchemy import func, update
+from sqlalchemy.exc import IntegrityError
 
+from app.dashboard.models import AdminDashboardCounters
 from app.users.models import User
 from app.subjects.models import Subject
 from app.periods.models import AcademicPeriod
 from app.roles.models import Role
 from app.enrollments.models import Enrollment
 from app.grades.models import Grade 
+
+
+logger = logging.getLogger(__name__)
+
+ADMIN_COUNTERS_ID = 1
+ADMIN_COUNTER_FIELDS = (
+    "total_users",
+    "total_students",
+    "total_teachers",
+    "total_subjects",
+    "inactive_subjects",
+    "active_periods",
+)
+# Roles que cuentan por nombre en total_students y total_teachers.
+COUNTED_ROLE_NAMES = frozenset({"Estudiante", "Docente"})
+
 #===========================
 # DASHBOARD  ADMINISTRADOR
 #===========================
-def get_admin_dashboard(db: Session):
+def _count_admin_dashboard(db: Session) -> dict[str, int]:
+    """Recalcula desde cero los contadores del dashboard administrador."""
 
     # Total usuarios activos
     total_users = (
@@ -66,6 +88,94 @@ def get_admin_dashboard(db: Session):
         "active_periods": active_periods,
     }
 
+
+def ensure_admin_counters(db: Session) -> None:
+    """Crea la fila de contadores si falta (la migración 004 ya la siembra)."""
+    if db.get(AdminDashboardCounters, ADMIN_COUNTERS_ID) is not None:
+        return
+    try:
+        reconcile_admin_counters(db)
+    except IntegrityError:
+        # Otra petición o worker insertó la fila al mismo tiempo.
+        db.rollback()
+
+
+def get_admin_dashboard(db: Session):
+    """Lee los contadores mantenidos; los inicializa si aún no existen."""
+    counters = db.get(AdminDashboardCounters, ADMIN_COUNTERS_ID)
+    if counters is None:
+        ensure_admin_counters(db)
+        counters = db.get(AdminDashboardCounters, ADMIN_COUNTERS_ID)
+    return {field: getattr(counters, field) for field in ADMIN_COUNTER_FIELDS}
+
+
+def reconcile_admin_counters(db: Session) -> dict[str, int]:
+    """Recalcula los contadores, los persiste y retorna la deriva encontrada (real - almacenado)."""
+    drift = recount_admin_counters(db)
+    db.commit()
+    if drift:
+        logger.warning("Deriva en contadores del dashboard administrador: %s", drift)
+    return drift
+
+
+def recount_admin_counters(db: Session) -> dict[str, int]:
+    """Recalcula los contadores dentro de la transacción del servicio que llama, sin confirmar.
+
+    La fila se bloquea antes de contar para no pisar deltas confirmados en paralelo. Las
+    sesiones no hacen autoflush: se envían antes los cambios pendientes del servicio.
+    """
+    db.flush()
+    counters = db.get(AdminDashboardCounters, ADMIN_COUNTERS_ID, with_for_update=True)
+    actual = _count_admin_dashboard(db)
+    if counters is None:
+        counters = AdminDashboardCounters(id=ADMIN_COUNTERS_ID)
+        db.add(counters)
+        stored = {field: 0 for field in ADMIN_COUNTER_FIELDS}
+    else:
+        stored = {field: getattr(counters, field) for field in ADMIN_COUNTER_FIELDS}
+    drift = {
+        field: actual[field] - stored[field]
+        for field in ADMIN_COUNTER_FIELDS
+        if actual[field] != stored[field]
+    }
+    for field, value in actual.items():
+        setattr(counters, field, value)
+    counters.reconciled_at = datetime.now(timezone.utc)
+    return drift
+
+
+def bump_admin_counters(db: Session, **deltas: int) -> None:
+    """Aplica deltas a los contadores dentro de la transacción del servicio que llama."""
+    values = {
+        field: getattr(AdminDashboardCounters, field) + delta
+        for field, delta in deltas.items()
+        if delta
+    }
+    if not values:
+        return
+    db.execute(
+        update(AdminDashboardCounters)
+        .where(AdminDashboardCounters.id == ADMIN_COUNTERS_ID)
+        .values(values)
+    )
+
+
+def user_counter_state(user: User | None) -> dict[str, int]:
+    """Aporte de un usuario a total_users, total_students y total_teachers."""
+    if user is None or not user.is_active:
+        return {"total_users": 0, "total_students": 0, "total_teachers": 0}
+    role_names = {role.name for role in user.roles}
+    return {
+        "total_users": 1,
+        "total_students": int("Estudiante" in role_names),
+        "total_teachers": int("Docente" in role_names),
+    }
+
+
+def bump_user_counters(db: Session, before: dict[str, int], after: dict[str, int]) -> None:
+    """Aplica la diferencia entre dos estados de usuario a los contadores."""
+    bump_admin_counters(db, **{field: after[field] - before[field] for field in after})
+
 #===========================
 # DASHBOARD  DOCENTE
 #===========================
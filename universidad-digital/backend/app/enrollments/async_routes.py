@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.deps import get_async_db, get_current_user_async_dep, require_roles_async_dep
+from app.core.pagination import PageParams, page_params_dep, set_next_cursor
+from app.core.responses import list_response
+from app.enrollments.async_services import get_enrollment, list_enrollments
+from app.enrollments.schemas import EnrollmentResponse
+
+
+router = APIRouter(prefix="/enrollments", tags=["enrollments"])
+
+
+@router.get("/", response_model=list[EnrollmentResponse])
+async def list_enrollments_async_endpoint(
+    response: Response,
+    period_id: int | None = Query(default=None, ge=1),
+    subject_id: int | None = Query(default=None, ge=1),
+    teacher_id: int | None = Query(default=None, ge=1),
+    user_id: int | None = Query(default=None, ge=1),
+    is_active: bool | None = Query(default=None),
+    page: PageParams = Depends(page_params_dep),
+    db: AsyncSession = Depends(get_async_db),
+    user=Depends(get_current_user_async_dep),
+    _user=Depends(require_roles_async_dep("Administrador", "Docente", "Estudiante")),
+) -> list[EnrollmentResponse]:
+    enrollments = await list_enrollments(
+        db,
+        user,
+        page,
+        period_id=period_id,
+        subject_id=subject_id,
+        teacher_id=teacher_id,
+        user_id=user_id,
+        is_active=is_active,
+    )
+    set_next_cursor(response, enrollments, page)
+    return list_response(response, enrollments)
+
+
+# El convertidor `:int` deja pasar /enrollments/export a la ruta síncrona.
+@router.get("/{enrollment_id:int}", response_model=EnrollmentResponse)
+async def get_enrollment_async_endpoint(
+    enrollment_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    user=Depends(get_current_user_async_dep),
+    _user=Depends(require_roles_async_dep("Administrador", "Docente", "Estudiante")),
+) -> EnrollmentResponse:
+    return await get_enrollment(db, enrollment_id, user)
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth.principal import Principal
+from app.core.errors import NotFoundError
+from app.core.names import resolve_names_in_threadpool
+from app.core.pagination import PageParams
+from app.enrollments.schemas import EnrollmentResponse
+from app.enrollments.services import (
+    build_enrollment_responses,
+    enrollment_rows,
+    get_enrollment_stmt,
+    list_enrollments_stmt,
+    resolve_enrollment_names,
+)
+
+
+async def list_enrollments(
+    db: AsyncSession, user: Principal, page: PageParams | None = None, **filters: int | bool | None
+) -> list[dict[str, Any]]:
+    """Lista inscripciones respetando ownership, con filtros y paginación por cursor."""
+    rows = (await db.execute(list_enrollments_stmt(user, page, **filters))).all()
+    names = await resolve_names_in_threadpool(resolve_enrollment_names, rows)
+    return enrollment_rows(rows, names)
+
+
+async def get_enrollment(db: AsyncSession, enrollment_id: int, user: Principal) -> EnrollmentResponse:
+    row = (await db.execute(get_enrollment_stmt(enrollment_id))).one_or_none()
+    if not row:
+        raise NotFoundError("Inscripción no encontrada.")
+    names = await resolve_names_in_threadpool(resolve_enrollment_names, [row])
+    return build_enrollment_responses([row], names)[0]
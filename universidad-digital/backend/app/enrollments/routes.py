@@ -1,14 +1,27 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, status
+import io
+from tempfile import SpooledTemporaryFile
+
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
+from starlette.background import BackgroundTask
 
+from app.core.config import settings
 from app.core.deps import get_current_user_dep, get_db, require_roles_dep
+from app.core.export import ExportFormat, export_format_dep, export_response
+from app.core.pagination import PageParams, page_params_dep, set_next_cursor
+from app.core.responses import list_response
 from app.enrollments.schemas import EnrollmentCreate, EnrollmentResponse, EnrollmentUpdate
 from app.enrollments.services import (
+    ENROLLMENT_EXPORT_COLUMNS,
     create_enrollment,
     deactivate_enrollment,
+    export_enrollments_stmt,
     get_enrollment,
+    import_enrollments_csv,
     list_enrollments,
     update_enrollment,
 )
@@ -16,6 +29,9 @@ from app.enrollments.services import (
 
 router = APIRouter(prefix="/enrollments", tags=["enrollments"])
 
+_SPOOL_MAX_BYTES = 1024 * 1024
+_REPORT_CHUNK_CHARS = 64 * 1024
+
 
 @router.post("/", response_model=EnrollmentResponse, status_code=status.HTTP_201_CREATED)
 def create_enrollment_endpoint(
@@ -27,13 +43,86 @@ def create_enrollment_endpoint(
     return create_enrollment(db, payload, user)
 
 
+@router.post("/import")
+async def import_enrollments_endpoint(
+    request: Request,
+    db: Session = Depends(get_db),
+    _admin=Depends(require_roles_dep("Administrador")),
+) -> StreamingResponse:
+    """Importa un CSV (cuerpo text/csv) y responde con un reporte CSV por fila."""
+    source = SpooledTemporaryFile(max_size=_SPOOL_MAX_BYTES)
+    report = SpooledTemporaryFile(max_size=_SPOOL_MAX_BYTES, mode="w+", encoding="utf-8", newline="")
+    try:
+        async for chunk in request.stream():
+            source.write(chunk)
+        source.seek(0)
+        # surrogateescape: una línea con bytes que no son UTF-8 se reporta como error
+        # (import_enrollments_csv) en lugar de abortar la importación a mitad de camino.
+        with io.TextIOWrapper(
+            source, encoding="utf-8-sig", errors="surrogateescape", newline=""
+        ) as text:
+            summary = await run_in_threadpool(
+                import_enrollments_csv, db, text, report, settings.enrollment_import_batch_size
+            )
+    except BaseException:
+        report.close()
+        raise
+    finally:
+        source.close()
+    report.seek(0)
+    return StreamingResponse(
+        iter(lambda: report.read(_REPORT_CHUNK_CHARS), ""),
+        media_type="text/csv",
+        headers={
+            "Content-Disposition": 'attachment; filename="enrollments_import_report.csv"',
+            "X-Import-Created": str(summary["created"]),
+            "X-Import-Duplicates": str(summary["duplicate"]),
+            "X-Import-Errors": str(summary["error"]),
+        },
+        background=BackgroundTask(report.close),
+    )
+
+
 @router.get("/", response_model=list[EnrollmentResponse])
 def list_enrollments_endpoint(
+    response: Response,
+    period_id: int | None = Query(default=None, ge=1),
+    subject_id: int | None = Query(default=None, ge=1),
+    teacher_id: int | None = Query(default=None, ge=1),
+    user_id: int | None = Query(default=None, ge=1),
+    is_active: bool | None = Query(default=None),
+    page: PageParams = Depends(page_params_dep),
     db: Session = Depends(get_db),
     user=Depends(get_current_user_dep),
     _user=Depends(require_roles_dep("Administrador", "Docente", "Estudiante")),
 ) -> list[EnrollmentResponse]:
-    return list_enrollments(db, user)
+    enrollments = list_enrollments(
+        db,
+        user,
+        page,
+        period_id=period_id,
+        subject_id=subject_id,
+        teacher_id=teacher_id,
+        user_id=user_id,
+        is_active=is_active,
+    )
+    set_next_cursor(response, enrollments, page)
+    return list_response(response, enrollments)
+
+
+@router.get("/export")
+def export_enrollments_endpoint(
+    period_id: int | None = Query(default=None, ge=1),
+    subject_id: int | None = Query(default=None, ge=1),
+    teacher_id: int | None = Query(default=None, ge=1),
+    export_format: ExportFormat = Depends(export_format_dep),
+    user=Depends(get_current_user_dep),
+    _user=Depends(require_roles_dep("Administrador", "Docente")),
+) -> StreamingResponse:
+    stmt = export_enrollments_stmt(
+        user, period_id=period_id, subject_id=subject_id, teacher_id=teacher_id
+    )
+    return export_response(stmt, ENROLLMENT_EXPORT_COLUMNS, export_format, "inscripciones")
 
 
 @router.get("/{enrollment_id}", response_model=EnrollmentResponse)
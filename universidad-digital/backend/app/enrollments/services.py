@@ -1,38 +1,108 @@
 from __future__ import annotations
 
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+import csv
+from collections.abc import Sequence
+from typing import Any, TextIO
 
+from pydantic import ValidationError
+from sqlalchemy import Select, insert, select, tuple_
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, aliased
+
+from app.auth.permissions import Permission
+from app.auth.principal import Principal
 from app.core.errors import ConflictError, NotFoundError
+from app.core.metrics import enrollments_created_total
+from app.core.names import ResolvedNames, name_cache
+from app.core.pagination import PageParams, apply_page
 from app.enrollments.models import Enrollment
 from app.enrollments.schemas import EnrollmentCreate, EnrollmentUpdate,EnrollmentResponse
 from app.periods.models import AcademicPeriod
+from app.reports.services import invalidate_period_snapshot
 from app.subjects.models import Subject
+from app.transcripts.services import transcript_cache
 from app.users.models import User
 
 
-def _enrollment_to_response(db: Session, e: Enrollment) -> EnrollmentResponse:
-    """Construye EnrollmentResponse con nombres desde relaciones."""
-    subject = db.get(Subject, e.subject_id) if e.subject_id else None
-    period = db.get(AcademicPeriod, e.period_id) if e.period_id else None
-    user = db.get(User, e.user_id) if e.user_id else None
-    teacher = db.get(User, e.teacher_id) if e.teacher_id else None
-    return EnrollmentResponse(
-        id=e.id,
-        user_id=e.user_id,
-        subject_id=e.subject_id,
-        period_id=e.period_id,
-        teacher_id=e.teacher_id,
-        is_active=e.is_active,
-        enrolled_at=e.enrolled_at,
-        subject_name=subject.name if subject else None,
-        period_name=period.name if period else None,
-        user_name=user.full_name if user else None,
-        teacher_name=teacher.full_name if teacher else None,
+_ENROLLMENT_COLUMNS = (
+    Enrollment.id,
+    Enrollment.user_id,
+    Enrollment.subject_id,
+    Enrollment.period_id,
+    Enrollment.teacher_id,
+    Enrollment.is_active,
+    Enrollment.enrolled_at,
+)
+
+
+def _enrollment_rows_stmt() -> Select:
+    """Columnas de inscripciones; los nombres se resuelven con la caché en proceso."""
+    return select(*_ENROLLMENT_COLUMNS)
+
+
+def _enrollment_named_rows_stmt() -> Select:
+    """Inscripciones con nombres por JOIN, para la exportación en streaming."""
+    student = aliased(User, name="student")
+    teacher = aliased(User, name="teacher")
+    return (
+        select(
+            *_ENROLLMENT_COLUMNS,
+            Subject.name.label("subject_name"),
+            AcademicPeriod.name.label("period_name"),
+            student.full_name.label("user_name"),
+            teacher.full_name.label("teacher_name"),
+        )
+        .select_from(Enrollment)
+        .outerjoin(Subject, Subject.id == Enrollment.subject_id)
+        .outerjoin(AcademicPeriod, AcademicPeriod.id == Enrollment.period_id)
+        .outerjoin(student, student.id == Enrollment.user_id)
+        .outerjoin(teacher, teacher.id == Enrollment.teacher_id)
+    )
+
+
+def resolve_enrollment_names(db: Session, rows: Sequence[Row | Enrollment]) -> ResolvedNames:
+    return name_cache.resolve(
+        db,
+        subject_ids=(row.subject_id for row in rows),
+        period_ids=(row.period_id for row in rows),
+        user_ids=[*(row.user_id for row in rows), *(row.teacher_id for row in rows)],
     )
 
 
-def create_enrollment(db: Session, data: EnrollmentCreate, actor: User) -> EnrollmentResponse:
+def enrollment_rows(rows: Sequence[Row | Enrollment], names: ResolvedNames) -> list[dict[str, Any]]:
+    """Arma los dicts con la forma de EnrollmentResponse y los nombres ya resueltos."""
+    subjects, periods, users = names.subjects, names.periods, names.users
+    return [
+        {
+            "id": row.id,
+            "user_id": row.user_id,
+            "subject_id": row.subject_id,
+            "period_id": row.period_id,
+            "teacher_id": row.teacher_id,
+            "is_active": row.is_active,
+            "enrolled_at": row.enrolled_at,
+            "subject_name": subjects.get(row.subject_id),
+            "period_name": periods.get(row.period_id),
+            "user_name": users.get(row.user_id),
+            "teacher_name": users.get(row.teacher_id) if row.teacher_id else None,
+        }
+        for row in rows
+    ]
+
+
+def build_enrollment_responses(
+    rows: Sequence[Row | Enrollment], names: ResolvedNames
+) -> list[EnrollmentResponse]:
+    """Construye EnrollmentResponse desde filas o modelos con los nombres ya resueltos."""
+    return [EnrollmentResponse(**item) for item in enrollment_rows(rows, names)]
+
+
+def _enrollment_to_response(db: Session, e: Enrollment) -> EnrollmentResponse:
+    return build_enrollment_responses([e], resolve_enrollment_names(db, [e]))[0]
+
+
+def create_enrollment(db: Session, data: EnrollmentCreate, actor: Principal) -> EnrollmentResponse:
     existing = db.scalar(
         select(Enrollment).where(
             Enrollment.user_id == data.user_id,
@@ -55,37 +125,97 @@ def create_enrollment(db: Session, data: EnrollmentCreate, actor: User) -> Enrol
         teacher_id=data.teacher_id,
     )
     db.add(enrollment)
+    invalidate_period_snapshot(db, data.period_id)
     db.commit()
+    enrollments_created_total.inc("api")
+    transcript_cache.invalidate_period(data.period_id)
     db.refresh(enrollment)
     return _enrollment_to_response(db, enrollment)
 
 
-from sqlalchemy import select
-from app.enrollments.schemas import EnrollmentResponse
+def list_enrollments_stmt(
+    user: Principal, page: PageParams | None = None, **filters: int | bool | None
+) -> Select:
+    """Consulta del listado respetando ownership, filtros y paginación por cursor."""
+    stmt = _filter_enrollments(_enrollment_rows_stmt(), user, **filters)
+    return apply_page(stmt, Enrollment.id, page)
+
 
-def list_enrollments(db: Session, user: User) -> list[EnrollmentResponse]:
-    """Lista inscripciones respetando ownership."""
-    stmt = select(Enrollment).order_by(Enrollment.id)
+def export_enrollments_stmt(user: Principal, **filters: int | bool | None) -> Select:
+    """Consulta de exportación: el listado con nombres por JOIN y sin paginar."""
+    stmt = _filter_enrollments(_enrollment_named_rows_stmt(), user, **filters)
+    return apply_page(stmt, Enrollment.id, None)
 
-    if any(role.name == "Estudiante" for role in user.roles):
+
+def _filter_enrollments(
+    stmt: Select,
+    user: Principal,
+    *,
+    period_id: int | None = None,
+    subject_id: int | None = None,
+    teacher_id: int | None = None,
+    user_id: int | None = None,
+    is_active: bool | None = None,
+) -> Select:
+    if user.has(Permission.STUDENT):
         stmt = stmt.where(Enrollment.user_id == user.id)
-    elif any(role.name == "Docente" for role in user.roles):
+    elif user.has(Permission.TEACHER):
         stmt = stmt.where(Enrollment.teacher_id == user.id)
 
-    enrollments = db.scalars(stmt).all()
-    return [_enrollment_to_response(db, e) for e in enrollments]
+    if period_id is not None:
+        stmt = stmt.where(Enrollment.period_id == period_id)
+    if subject_id is not None:
+        stmt = stmt.where(Enrollment.subject_id == subject_id)
+    if teacher_id is not None:
+        stmt = stmt.where(Enrollment.teacher_id == teacher_id)
+    if user_id is not None:
+        stmt = stmt.where(Enrollment.user_id == user_id)
+    if is_active is not None:
+        stmt = stmt.where(Enrollment.is_active == is_active)
+    return stmt
 
 
-def get_enrollment(db: Session, enrollment_id: int, user: User) -> EnrollmentResponse:
-    enrollment = db.get(Enrollment, enrollment_id)
-    if not enrollment:
+def list_enrollments(
+    db: Session, user: Principal, page: PageParams | None = None, **filters: int | bool | None
+) -> list[dict[str, Any]]:
+    """Lista inscripciones respetando ownership, con filtros y paginación por cursor.
+
+    Retorna filas con la forma de EnrollmentResponse; la ruta decide si se validan
+    con response_model o se serializan directo (APP_FAST_JSON).
+    """
+    rows = db.execute(list_enrollments_stmt(user, page, **filters)).all()
+    return enrollment_rows(rows, resolve_enrollment_names(db, rows))
+
+
+ENROLLMENT_EXPORT_COLUMNS = (
+    "id",
+    "user_id",
+    "user_name",
+    "subject_id",
+    "subject_name",
+    "period_id",
+    "period_name",
+    "teacher_id",
+    "teacher_name",
+    "is_active",
+    "enrolled_at",
+)
+
+
+def get_enrollment_stmt(enrollment_id: int) -> Select:
+    return _enrollment_rows_stmt().where(Enrollment.id == enrollment_id)
+
+
+def get_enrollment(db: Session, enrollment_id: int, user: Principal) -> EnrollmentResponse:
+    row = db.execute(get_enrollment_stmt(enrollment_id)).one_or_none()
+    if not row:
         raise NotFoundError("Inscripción no encontrada.")
-    return _enrollment_to_response(db, enrollment)
+    return build_enrollment_responses([row], resolve_enrollment_names(db, [row]))[0]
 
 
 
 def update_enrollment(
-    db: Session, enrollment_id: int, data: EnrollmentUpdate, user: User
+    db: Session, enrollment_id: int, data: EnrollmentUpdate, user: Principal
 ) -> EnrollmentResponse:
     """Actualiza una inscripción y devuelve un Pydantic model."""
     # Obtiene la inscripción respetando ownership
@@ -93,7 +223,7 @@ def update_enrollment(
     if not enrollment:
         raise NotFoundError("Inscripción no encontrada.")
 
-    if any(role.name == "Estudiante" for role in user.roles):
+    if user.has(Permission.STUDENT):
         if enrollment.user_id != user.id:
             raise ConflictError("Acceso no permitido.")
 
@@ -103,27 +233,175 @@ def update_enrollment(
     if data.teacher_id is not None:
         enrollment.teacher_id = data.teacher_id
 
+    invalidate_period_snapshot(db, enrollment.period_id)
     db.commit()
+    transcript_cache.invalidate_period(enrollment.period_id)
     db.refresh(enrollment)
 
     return _enrollment_to_response(db, enrollment)
 
 
 def deactivate_enrollment(
-    db: Session, enrollment_id: int, user: User
+    db: Session, enrollment_id: int, user: Principal
 ) -> EnrollmentResponse:
     """Desactiva una inscripción (eliminación lógica) y devuelve un Pydantic model."""
     enrollment = db.get(Enrollment, enrollment_id)
     if not enrollment:
         raise NotFoundError("Inscripción no encontrada.")
 
-    if any(role.name == "Estudiante" for role in user.roles):
+    if user.has(Permission.STUDENT):
         if enrollment.user_id != user.id:
             raise ConflictError("Acceso no permitido.")
 
     # Eliminación lógica
     enrollment.is_active = False
+    invalidate_period_snapshot(db, enrollment.period_id)
     db.commit()
+    transcript_cache.invalidate_period(enrollment.period_id)
     db.refresh(enrollment)
 
-    return _enrollment_to_response(db, enrollment)
\ No newline at end of file
+    return _enrollment_to_response(db, enrollment)
+
+
+IMPORT_COLUMNS = ("user_id", "subject_id", "period_id", "teacher_id")
+IMPORT_REPORT_COLUMNS = ("line", "status", "enrollment_id", "detail")
+
+
+def import_enrollments_csv(
+    db: Session, source: TextIO, report: TextIO, batch_size: int
+) -> dict[str, int]:
+    """Importa inscripciones desde CSV por lotes y escribe un reporte por fila.
+
+    Cada lote valida usuarios, materias, periodos y duplicados con consultas por
+    conjunto y se inserta con un único executemany; la memoria depende solo del
+    tamaño de lote.
+    """
+    reader = csv.DictReader(source)
+    missing = {"user_id", "subject_id", "period_id"} - set(reader.fieldnames or ())
+    if missing:
+        raise ConflictError(f"Columnas faltantes en el CSV: {', '.join(sorted(missing))}.")
+    writer = csv.writer(report)
+    writer.writerow(IMPORT_REPORT_COLUMNS)
+    summary = {"created": 0, "duplicate": 0, "error": 0}
+    batch: list[tuple[int, dict[str, str | None]]] = []
+    for line, raw in enumerate(reader, start=2):
+        batch.append((line, raw))
+        if len(batch) >= batch_size:
+            _import_batch(db, batch, writer, summary)
+            batch = []
+    if batch:
+        _import_batch(db, batch, writer, summary)
+    return summary
+
+
+def _is_utf8(raw: dict[str | None, Any]) -> bool:
+    """False si la línea trae bytes inválidos (sustitutos sueltos de surrogateescape)."""
+    values: list[str] = []
+    for value in raw.values():
+        if isinstance(value, list):
+            values.extend(value)
+        elif value is not None:
+            values.append(value)
+    try:
+        "".join(values).encode("utf-8")
+    except UnicodeEncodeError:
+        return False
+    return True
+
+
+def _import_batch(
+    db: Session,
+    batch: Sequence[tuple[int, dict[str, str | None]]],
+    writer: Any,
+    summary: dict[str, int],
+) -> None:
+    results: dict[int, tuple[str, int | None, str]] = {}
+    parsed: list[tuple[int, EnrollmentCreate]] = []
+    for line, raw in batch:
+        if not _is_utf8(raw):
+            results[line] = ("error", None, "La línea no está codificada en UTF-8.")
+            continue
+        try:
+            data = EnrollmentCreate.model_validate(
+                {key: (raw.get(key) or "").strip() or None for key in IMPORT_COLUMNS}
+            )
+        except ValidationError as exc:
+            detail = "; ".join(f"{'.'.join(map(str, e['loc']))}: {e['msg']}" for e in exc.errors())
+            results[line] = ("error", None, detail)
+            continue
+        parsed.append((line, data))
+
+    user_ids = {d.user_id for _, d in parsed} | {d.teacher_id for _, d in parsed if d.teacher_id}
+    subject_ids = {d.subject_id for _, d in parsed}
+    period_ids = {d.period_id for _, d in parsed}
+    known_users = set(db.scalars(select(User.id).where(User.id.in_(user_ids)))) if user_ids else set()
+    known_subjects = (
+        set(db.scalars(select(Subject.id).where(Subject.id.in_(subject_ids)))) if subject_ids else set()
+    )
+    known_periods = (
+        set(db.scalars(select(AcademicPeriod.id).where(AcademicPeriod.id.in_(period_ids))))
+        if period_ids
+        else set()
+    )
+
+    candidates: list[tuple[int, EnrollmentCreate]] = []
+    for line, data in parsed:
+        if data.user_id not in known_users:
+            results[line] = ("error", None, "Usuario no encontrado.")
+        elif data.subject_id not in known_subjects:
+            results[line] = ("error", None, "Materia no encontrada.")
+        elif data.period_id not in known_periods:
+            results[line] = ("error", None, "Periodo académico no encontrado.")
+        elif data.teacher_id and data.teacher_id not in known_users:
+            results[line] = ("error", None, "Docente no encontrado.")
+        else:
+            candidates.append((line, data))
+
+    for attempt in range(2):
+        existing = _existing_enrollment_keys(db, candidates)
+        to_insert: list[tuple[int, EnrollmentCreate]] = []
+        seen: set[tuple[int, int, int]] = set()
+        for line, data in candidates:
+            key = (data.user_id, data.subject_id, data.period_id)
+            if key in existing or key in seen:
+                results[line] = ("duplicate", None, "uq_enrollment")
+            else:
+                seen.add(key)
+                to_insert.append((line, data))
+        if not to_insert:
+            break
+        try:
+            ids = db.scalars(
+                insert(Enrollment).returning(Enrollment.id, sort_by_parameter_order=True),
+                [data.model_dump() for _, data in to_insert],
+            ).all()
+            for period_id in {data.period_id for _, data in to_insert}:
+                invalidate_period_snapshot(db, period_id)
+            db.commit()
+        except IntegrityError:
+            # Otra importación concurrente insertó alguna fila; se recalculan duplicados.
+            db.rollback()
+            if attempt:
+                raise
+            continue
+        enrollments_created_total.inc("import", amount=len(ids))
+        for period_id in {data.period_id for _, data in to_insert}:
+            transcript_cache.invalidate_period(period_id)
+        for (line, _), enrollment_id in zip(to_insert, ids):
+            results[line] = ("created", enrollment_id, "")
+        break
+
+    for line, _ in batch:
+        status, enrollment_id, detail = results[line]
+        summary[status] += 1
+        writer.writerow((line, status, enrollment_id or "", detail))
+
+
+def _existing_enrollment_keys(
+    db: Session, candidates: Sequence[tuple[int, EnrollmentCreate]]
+) -> set[tuple[int, int, int]]:
+    keys = {(d.user_id, d.subject_id, d.period_id) for _, d in candidates}
+    if not keys:
+        return set()
+    columns = (Enrollment.user_id, Enrollment.subject_id, Enrollment.period_id)
+    return set(db.execute(select(*columns).where(tuple_(*columns).in_(keys))).tuples())
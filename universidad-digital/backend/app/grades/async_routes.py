@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.deps import get_async_db, get_current_user_async_dep, require_roles_async_dep
+from app.core.names import resolve_names_in_threadpool
+from app.core.pagination import PageParams, page_params_dep, set_next_cursor
+from app.core.responses import list_response
+from app.grades.async_services import get_grade, list_grades
+from app.grades.schemas import GradeResponse
+from app.grades.services import grade_detail_response
+
+
+router = APIRouter(prefix="/grades", tags=["grades"])
+
+
+@router.get("/", response_model=list[GradeResponse])
+async def list_grades_async_endpoint(
+    response: Response,
+    period_id: int | None = Query(default=None, ge=1),
+    subject_id: int | None = Query(default=None, ge=1),
+    teacher_id: int | None = Query(default=None, ge=1),
+    user_id: int | None = Query(default=None, ge=1),
+    page: PageParams = Depends(page_params_dep),
+    db: AsyncSession = Depends(get_async_db),
+    user=Depends(get_current_user_async_dep),
+    _user=Depends(require_roles_async_dep("Administrador", "Docente", "Estudiante")),
+) -> list[GradeResponse]:
+    grades = await list_grades(
+        db,
+        user,
+        page,
+        period_id=period_id,
+        subject_id=subject_id,
+        teacher_id=teacher_id,
+        user_id=user_id,
+    )
+    set_next_cursor(response, grades, page)
+    return list_response(response, grades)
+
+
+# El convertidor `:int` deja pasar /grades/export a la ruta síncrona.
+@router.get("/{grade_id:int}", response_model=GradeResponse)
+async def get_grade_async_endpoint(
+    grade_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    user=Depends(get_current_user_async_dep),
+    _user=Depends(require_roles_async_dep("Administrador", "Docente", "Estudiante")),
+) -> GradeResponse:
+    grade, enrollment = await get_grade(db, grade_id, user)
+    return await resolve_names_in_threadpool(grade_detail_response, grade, enrollment, user)
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.auth.principal import Principal
+from app.core.errors import NotFoundError
+from app.core.names import resolve_names_in_threadpool
+from app.core.pagination import PageParams
+from app.enrollments.models import Enrollment
+from app.grades.models import Grade
+from app.grades.services import (
+    check_grade_access,
+    get_grade_stmt,
+    grade_rows,
+    list_grades_stmt,
+    resolve_grade_user_names,
+)
+
+
+async def list_grades(
+    db: AsyncSession, user: Principal, page: PageParams | None = None, **filters: int | None
+) -> list[dict[str, Any]]:
+    """Lista calificaciones respetando ownership. Admin no ve el valor de la nota."""
+    rows = (await db.execute(list_grades_stmt(user, page, **filters))).all()
+    user_names = await resolve_names_in_threadpool(resolve_grade_user_names, rows)
+    return grade_rows(rows, user_names, user)
+
+
+async def get_grade(db: AsyncSession, grade_id: int, user: Principal) -> tuple[Grade, Enrollment]:
+    """Obtiene una calificación y su inscripción por ID respetando ownership."""
+    row = (await db.execute(get_grade_stmt(grade_id))).one_or_none()
+    if not row:
+        raise NotFoundError("Calificación no encontrada.")
+    grade, enrollment = row
+    check_grade_access(user, enrollment)
+    return grade, enrollment
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import DateTime, ForeignKey, Numeric, String, func
+from sqlalchemy import DateTime, ForeignKey, Index, Numeric, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -11,6 +11,11 @@ from app.core.database import Base
 
 class Grade(Base):
     __tablename__ = "grades"
+    __table_args__ = (
+        # Conteos, listados por inscripción en orden de id y promedios del historial
+        # se resuelven solo con el índice (value va incluido en PostgreSQL).
+        Index("ix_grades_enrollment_id_id", "enrollment_id", "id", postgresql_include=["value"]),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     enrollment_id: Mapped[int] = mapped_column(
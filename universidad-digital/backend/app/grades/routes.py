@@ -1,12 +1,32 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, Response, status
+from fastapi import APIRouter, Depends, Query, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.core.deps import get_current_user_dep, get_db, require_roles_dep
-from app.enrollments.models import Enrollment
-from app.grades.schemas import GradeCreate, GradeResponse, GradeUpdate
-from app.grades.services import create_grade, delete_grade, get_grade, list_grades, update_grade
+from app.core.export import ExportFormat, export_format_dep, export_response
+from app.core.pagination import PageParams, page_params_dep, set_next_cursor
+from app.core.responses import list_response
+from app.grades.schemas import (
+    GradeBulkCreate,
+    GradeBulkResponse,
+    GradeCreate,
+    GradeResponse,
+    GradeUpdate,
+)
+from app.grades.services import (
+    GRADE_EXPORT_COLUMNS,
+    create_grade,
+    create_grades_bulk,
+    delete_grade,
+    export_grades_stmt,
+    get_grade,
+    grade_detail_response,
+    grade_export_transform,
+    list_grades,
+    update_grade,
+)
 
 
 router = APIRouter(prefix="/grades", tags=["grades"])
@@ -22,13 +42,56 @@ def create_grade_endpoint(
     return create_grade(db, payload, user)
 
 
+@router.post("/bulk", response_model=GradeBulkResponse)
+def create_grades_bulk_endpoint(
+    payload: GradeBulkCreate,
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user_dep),
+    _teacher=Depends(require_roles_dep("Docente")),
+) -> GradeBulkResponse:
+    return create_grades_bulk(db, payload.items, user)
+
+
 @router.get("/", response_model=list[GradeResponse])
 def list_grades_endpoint(
+    response: Response,
+    period_id: int | None = Query(default=None, ge=1),
+    subject_id: int | None = Query(default=None, ge=1),
+    teacher_id: int | None = Query(default=None, ge=1),
+    user_id: int | None = Query(default=None, ge=1),
+    page: PageParams = Depends(page_params_dep),
     db: Session = Depends(get_db),
     user=Depends(get_current_user_dep),
     _user=Depends(require_roles_dep("Administrador", "Docente", "Estudiante")),
 ) -> list[GradeResponse]:
-    return list_grades(db, user)
+    grades = list_grades(
+        db,
+        user,
+        page,
+        period_id=period_id,
+        subject_id=subject_id,
+        teacher_id=teacher_id,
+        user_id=user_id,
+    )
+    set_next_cursor(response, grades, page)
+    return list_response(response, grades)
+
+
+@router.get("/export")
+def export_grades_endpoint(
+    period_id: int | None = Query(default=None, ge=1),
+    subject_id: int | None = Query(default=None, ge=1),
+    teacher_id: int | None = Query(default=None, ge=1),
+    export_format: ExportFormat = Depends(export_format_dep),
+    user=Depends(get_current_user_dep),
+    _user=Depends(require_roles_dep("Administrador", "Docente")),
+) -> StreamingResponse:
+    stmt = export_grades_stmt(
+        user, period_id=period_id, subject_id=subject_id, teacher_id=teacher_id
+    )
+    return export_response(
+        stmt, GRADE_EXPORT_COLUMNS, export_format, "calificaciones", grade_export_transform(user)
+    )
 
 
 @router.get("/{grade_id}", response_model=GradeResponse)
@@ -38,28 +101,8 @@ def get_grade_endpoint(
     user=Depends(get_current_user_dep),
     _user=Depends(require_roles_dep("Administrador", "Docente", "Estudiante")),
 ) -> GradeResponse:
-    grade = get_grade(db, grade_id, user)
-    if any(r.name == "Administrador" for r in user.roles):
-        enrollment = db.get(Enrollment, grade.enrollment_id)
-        user_name = enrollment.user.full_name if enrollment and enrollment.user else None
-        return GradeResponse(
-            id=grade.id,
-            enrollment_id=grade.enrollment_id,
-            value=None,
-            notes=grade.notes,
-            created_at=grade.created_at,
-            user_name=user_name,
-        )
-    enrollment = db.get(Enrollment, grade.enrollment_id)
-    user_name = enrollment.user.full_name if enrollment and enrollment.user else None
-    return GradeResponse(
-        id=grade.id,
-        enrollment_id=grade.enrollment_id,
-        value=grade.value,
-        notes=grade.notes,
-        created_at=grade.created_at,
-        user_name=user_name,
-    )
+    grade, enrollment = get_grade(db, grade_id, user)
+    return grade_detail_response(db, grade, enrollment, user)
 
 
 @router.put("/{grade_id}", response_model=GradeResponse)
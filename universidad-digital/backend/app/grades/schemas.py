@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime
 from decimal import Decimal
+from typing import Literal
 
 from pydantic import BaseModel, ConfigDict, Field, condecimal
 
@@ -32,3 +33,27 @@ class GradeResponse(BaseModel):
     notes: str | None = None
     created_at: datetime
     user_name: str | None = None
+
+
+class GradeBulkCreate(BaseModel):
+    """Lote de calificaciones de una sección enviado en una sola petición."""
+
+    items: list[GradeCreate] = Field(min_length=1, max_length=5000)
+
+
+class GradeBulkItemResult(BaseModel):
+    """Resultado de un elemento del lote, en el mismo orden de entrada."""
+
+    index: int
+    enrollment_id: int
+    status: Literal["created", "error"]
+    grade_id: int | None = None
+    detail: str | None = None
+
+
+class GradeBulkResponse(BaseModel):
+    """Resumen y resultados por elemento de un registro masivo de calificaciones."""
+
+    created: int
+    errors: int
+    results: list[GradeBulkItemResult]
@@ -1,24 +1,41 @@
 from __future__ import annotations
 
-from sqlalchemy import select
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any
+
+from sqlalchemy import Select, insert, select
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 
+from app.auth.permissions import Permission
+from app.auth.principal import Principal
 from app.core.errors import ConflictError, NotFoundError
+from app.core.metrics import grades_written_total
+from app.core.names import name_cache
+from app.core.pagination import PageParams, apply_page
 from app.enrollments.models import Enrollment
 from app.grades.models import Grade
-from app.grades.schemas import GradeCreate, GradeResponse, GradeUpdate
+from app.grades.schemas import (
+    GradeBulkItemResult,
+    GradeBulkResponse,
+    GradeCreate,
+    GradeResponse,
+    GradeUpdate,
+)
 from app.users.models import User
+from app.reports.services import invalidate_period_snapshot
 from app.subjects.services import get_subject
+from app.transcripts.services import transcript_cache
 
 
-def create_grade(db: Session, data: GradeCreate, user: User | None = None) -> Grade:
+def create_grade(db: Session, data: GradeCreate, user: Principal | None = None) -> Grade:
     """Registra una calificación. Si user es Docente, solo puede calificar sus asignaciones."""
     enrollment = db.get(Enrollment, data.enrollment_id)
     if not enrollment:
         raise NotFoundError("Inscripción no encontrada.")
     if not enrollment.is_active:
         raise ConflictError("Inscripción inactiva.")
-    if user and any(role.name == "Docente" for role in user.roles):
+    if user and user.has(Permission.TEACHER):
         if enrollment.teacher_id != user.id:
             raise ConflictError("Solo puedes calificar estudiantes de tus materias asignadas.")
     grade = Grade(
@@ -27,69 +44,249 @@ def create_grade(db: Session, data: GradeCreate, user: User | None = None) -> Gr
         notes=data.notes,
     )
     db.add(grade)
+    invalidate_period_snapshot(db, enrollment.period_id)
     db.commit()
+    grades_written_total.inc("create")
+    transcript_cache.invalidate_period(enrollment.period_id)
     db.refresh(grade)
     return grade
 
 
-def list_grades(db: Session, user: User) -> list[GradeResponse]:
-    """Lista calificaciones respetando ownership. Admin no ve el valor de la nota."""
-    stmt = select(Grade).join(Enrollment).order_by(Grade.id)
-    if any(role.name == "Estudiante" for role in user.roles):
+def create_grades_bulk(db: Session, items: list[GradeCreate], user: Principal) -> GradeBulkResponse:
+    """Registra un lote de calificaciones en una sola transacción.
+
+    La existencia, el estado y la asignación docente de todas las inscripciones se
+    validan con una única consulta; los elementos válidos se insertan con un solo
+    executemany y los inválidos se informan sin abortar el resto del lote.
+    """
+    enrollment_ids = {item.enrollment_id for item in items}
+    enrollments = {
+        row.id: row
+        for row in db.execute(
+            select(
+                Enrollment.id, Enrollment.period_id, Enrollment.teacher_id, Enrollment.is_active
+            ).where(
+                Enrollment.id.in_(enrollment_ids)
+            )
+        )
+    }
+    is_teacher = user.has(Permission.TEACHER)
+
+    results: list[GradeBulkItemResult] = []
+    valid: list[tuple[int, GradeCreate]] = []
+    for index, item in enumerate(items):
+        enrollment = enrollments.get(item.enrollment_id)
+        if enrollment is None:
+            detail = "Inscripción no encontrada."
+        elif not enrollment.is_active:
+            detail = "Inscripción inactiva."
+        elif is_teacher and enrollment.teacher_id != user.id:
+            detail = "Solo puedes calificar estudiantes de tus materias asignadas."
+        else:
+            valid.append((index, item))
+            detail = None
+        results.append(
+            GradeBulkItemResult(
+                index=index,
+                enrollment_id=item.enrollment_id,
+                status="error" if detail else "created",
+                detail=detail,
+            )
+        )
+
+    if valid:
+        grade_ids = db.scalars(
+            insert(Grade).returning(Grade.id, sort_by_parameter_order=True),
+            [item.model_dump() for _, item in valid],
+        ).all()
+        period_ids = {enrollments[item.enrollment_id].period_id for _, item in valid}
+        for period_id in period_ids:
+            invalidate_period_snapshot(db, period_id)
+        db.commit()
+        grades_written_total.inc("bulk", amount=len(grade_ids))
+        for period_id in period_ids:
+            transcript_cache.invalidate_period(period_id)
+        for (index, _), grade_id in zip(valid, grade_ids):
+            results[index].grade_id = grade_id
+
+    return GradeBulkResponse(
+        created=len(valid),
+        errors=len(items) - len(valid),
+        results=results,
+    )
+
+
+def list_grades_stmt(
+    user: Principal,
+    page: PageParams | None = None,
+    *,
+    period_id: int | None = None,
+    subject_id: int | None = None,
+    teacher_id: int | None = None,
+    user_id: int | None = None,
+) -> Select:
+    """Consulta del listado de calificaciones con el id del estudiante."""
+    stmt = select(
+        Grade.id,
+        Grade.enrollment_id,
+        Grade.value,
+        Grade.notes,
+        Grade.created_at,
+        Enrollment.user_id,
+    ).join(Enrollment, Enrollment.id == Grade.enrollment_id)
+    if user.has(Permission.STUDENT):
         stmt = stmt.where(Enrollment.user_id == user.id)
-    elif any(role.name == "Docente" for role in user.roles):
+    elif user.has(Permission.TEACHER):
         stmt = stmt.where(Enrollment.teacher_id == user.id)
-    grades = list(db.scalars(stmt).all())
-    is_admin = any(role.name == "Administrador" for role in user.roles)
-    
-    
-    result = []
-    for g in grades:
-        enrollment = db.get(Enrollment, g.enrollment_id)
-        user_name = enrollment.user.full_name if enrollment and enrollment.user else None
-        result.append(
-            GradeResponse(
-                id=g.id,
-                enrollment_id=g.enrollment_id,
-                value=None if is_admin else g.value,
-                notes=g.notes,
-                created_at=g.created_at,
-                user_name=user_name,
-               
-            )
+    if period_id is not None:
+        stmt = stmt.where(Enrollment.period_id == period_id)
+    if subject_id is not None:
+        stmt = stmt.where(Enrollment.subject_id == subject_id)
+    if teacher_id is not None:
+        stmt = stmt.where(Enrollment.teacher_id == teacher_id)
+    if user_id is not None:
+        stmt = stmt.where(Enrollment.user_id == user_id)
+    return apply_page(stmt, Grade.id, page)
+
+
+def list_grades(
+    db: Session, user: Principal, page: PageParams | None = None, **filters: int | None
+) -> list[dict[str, Any]]:
+    """Lista calificaciones respetando ownership. Admin no ve el valor de la nota.
+
+    Retorna filas con la forma de GradeResponse; la ruta decide si se validan con
+    response_model o se serializan directo (APP_FAST_JSON).
+    """
+    rows = db.execute(list_grades_stmt(user, page, **filters)).all()
+    return grade_rows(rows, resolve_grade_user_names(db, rows), user)
+
+
+def resolve_grade_user_names(db: Session, rows: Sequence[Row]) -> dict[int, str]:
+    return name_cache.resolve(db, user_ids=(row.user_id for row in rows)).users
+
+
+def grade_rows(
+    rows: Sequence[Row], user_names: dict[int, str], user: Principal
+) -> list[dict[str, Any]]:
+    """Arma los dicts con la forma de GradeResponse; Admin recibe value=None."""
+    is_admin = user.has(Permission.ADMIN)
+    return [
+        {
+            "id": row.id,
+            "enrollment_id": row.enrollment_id,
+            "value": None if is_admin else row.value,
+            "notes": row.notes,
+            "created_at": row.created_at,
+            "user_name": user_names.get(row.user_id),
+        }
+        for row in rows
+    ]
+
+
+GRADE_EXPORT_COLUMNS = (
+    "id",
+    "enrollment_id",
+    "user_id",
+    "user_name",
+    "subject_id",
+    "period_id",
+    "teacher_id",
+    "value",
+    "notes",
+    "created_at",
+)
+
+
+def export_grades_stmt(user: Principal, **filters: int | None) -> Select:
+    """Consulta de exportación: el listado con ownership, el nombre por JOIN y las claves."""
+    return (
+        list_grades_stmt(user, None, **filters)
+        .add_columns(
+            User.full_name.label("user_name"),
+            Enrollment.subject_id,
+            Enrollment.period_id,
+            Enrollment.teacher_id,
         )
-    return result
+        .outerjoin(User, User.id == Enrollment.user_id)
+    )
 
 
-def get_grade(db: Session, grade_id: int, user: User) -> Grade:
-    """Obtiene una calificación por ID respetando ownership."""
-    grade = db.get(Grade, grade_id)
-    if not grade:
-        raise NotFoundError("Calificación no encontrada.")
-    enrollment = db.get(Enrollment, grade.enrollment_id)
-    if any(role.name == "Estudiante" for role in user.roles):
+def grade_export_transform(user: Principal) -> Callable[[Mapping[str, Any]], Mapping[str, Any]] | None:
+    """Oculta el valor de la nota al Administrador, igual que el listado."""
+    if not user.has(Permission.ADMIN):
+        return None
+    return lambda row: {**row, "value": None}
+
+
+def build_grade_response(grade: Grade | Row, user_name: str | None, masked: bool) -> GradeResponse:
+    """Construye GradeResponse; masked=True oculta el valor (vista de Administrador)."""
+    return GradeResponse(
+        id=grade.id,
+        enrollment_id=grade.enrollment_id,
+        value=None if masked else grade.value,
+        notes=grade.notes,
+        created_at=grade.created_at,
+        user_name=user_name,
+    )
+
+
+def get_grade_stmt(grade_id: int) -> Select:
+    return (
+        select(Grade, Enrollment)
+        .join(Enrollment, Enrollment.id == Grade.enrollment_id)
+        .where(Grade.id == grade_id)
+    )
+
+
+def grade_detail_response(
+    db: Session, grade: Grade, enrollment: Enrollment, user: Principal
+) -> GradeResponse:
+    """GradeResponse de una calificación con el nombre del estudiante desde la caché."""
+    user_names = name_cache.resolve(db, user_ids=[enrollment.user_id]).users
+    return build_grade_response(
+        grade, user_names.get(enrollment.user_id), masked=user.has(Permission.ADMIN)
+    )
+
+
+def check_grade_access(user: Principal, enrollment: Enrollment) -> None:
+    """Valida ownership de Estudiante y Docente sobre la inscripción de una calificación."""
+    if user.has(Permission.STUDENT):
         if not enrollment or enrollment.user_id != user.id:
             raise ConflictError("Acceso no permitido.")
-    elif any(role.name == "Docente" for role in user.roles):
+    elif user.has(Permission.TEACHER):
         if not enrollment or enrollment.teacher_id != user.id:
             raise ConflictError("Solo puedes ver o editar calificaciones de tus materias.")
-    return grade
 
 
-def update_grade(db: Session, grade_id: int, data: GradeUpdate, user: User) -> Grade:
+def get_grade(db: Session, grade_id: int, user: Principal) -> tuple[Grade, Enrollment]:
+    """Obtiene una calificación y su inscripción por ID respetando ownership."""
+    row = db.execute(get_grade_stmt(grade_id)).one_or_none()
+    if not row:
+        raise NotFoundError("Calificación no encontrada.")
+    grade, enrollment = row
+    check_grade_access(user, enrollment)
+    return grade, enrollment
+
+
+def update_grade(db: Session, grade_id: int, data: GradeUpdate, user: Principal) -> Grade:
     """Actualiza una calificación."""
-    grade = get_grade(db, grade_id, user)
+    grade, enrollment = get_grade(db, grade_id, user)
     if data.value is not None:
         grade.value = data.value
     if data.notes is not None:
         grade.notes = data.notes
+    invalidate_period_snapshot(db, enrollment.period_id)
     db.commit()
+    grades_written_total.inc("update")
+    transcript_cache.invalidate_period(enrollment.period_id)
     db.refresh(grade)
     return grade
 
 
-def delete_grade(db: Session, grade_id: int, user: User) -> None:
+def delete_grade(db: Session, grade_id: int, user: Principal) -> None:
     """Elimina una calificación."""
-    grade = get_grade(db, grade_id, user)
+    grade, enrollment = get_grade(db, grade_id, user)
     db.delete(grade)
+    invalidate_period_snapshot(db, enrollment.period_id)
     db.commit()
+    transcript_cache.invalidate_period(enrollment.period_id)
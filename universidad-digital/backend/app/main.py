@@ -5,18 +5,41 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
-from app.core.database import SessionLocal, init_db
-from app.core.errors import AppError, ConflictError, ForbiddenError, NotFoundError, UnauthorizedError
-from app.roles.services import ensure_default_roles
+from app.core.bootstrap import seed_defaults, verify_schema_version
+from app.core.database import SessionLocal, async_engine, engine, init_db
+from app.core.errors import (
+    AppError,
+    ConflictError,
+    ForbiddenError,
+    NotFoundError,
+    ServiceUnavailableError,
+    UnauthorizedError,
+)
+from app.core.metrics import MetricsMiddleware
+from app.core.names import name_cache
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.core.pool import warm_up_pool
+from app.core.query_stats import (
+    DB_QUERIES_HEADER,
+    SERVER_TIMING_HEADER,
+    QueryStatsMiddleware,
+    install_query_listeners,
+)
+from app.core.security import shutdown_password_pool
+from app.auth.revocation import purge_scheduler, revocation_filter
 from app.auth.routes import router as auth_router
 from app.enrollments.routes import router as enrollments_router
 from app.grades.routes import router as grades_router
 from app.periods.routes import router as periods_router
+from app.reports.routes import router as reports_router
 from app.roles.routes import router as roles_router
 from app.subjects.routes import router as subjects_router
+from app.transcripts.routes import router as transcripts_router
 from app.users.routes import router as users_router
 from app.dashboard.router import router as dashboard_router
+from app.metrics.routes import router as metrics_router
 
 
 
@@ -37,16 +60,46 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
     allow_headers=["Authorization", "Content-Type"],
+    expose_headers=[NEXT_CURSOR_HEADER, DB_QUERIES_HEADER, SERVER_TIMING_HEADER],
 )
+if settings.compression_enabled:
+    app.add_middleware(CompressionMiddleware)
+if settings.sql_instrumentation and not settings.is_production:
+    install_query_listeners(engine, async_engine.sync_engine if async_engine is not None else None)
+    app.add_middleware(QueryStatsMiddleware)
+if settings.metrics_active:
+    # Último en registrarse: envuelve al resto y mide la latencia completa.
+    app.add_middleware(MetricsMiddleware)
 
 @app.on_event("startup")
 def on_startup() -> None:
-    init_db()
+    if settings.startup_bootstrap:
+        init_db()
+    else:
+        verify_schema_version()
     db = SessionLocal()
     try:
-        ensure_default_roles(db)
+        if settings.startup_bootstrap:
+            seed_defaults(db)
+        name_cache.warm(db)
+        revocation_filter.load(db)
     finally:
         db.close()
+    if settings.db_pool_warmup:
+        warm_up_pool(engine, min(settings.db_pool_warmup, settings.db_pool_size))
+    purge_scheduler.start()
+
+
+@app.on_event("shutdown")
+def on_shutdown() -> None:
+    purge_scheduler.stop()
+    shutdown_password_pool()
+
+
+@app.on_event("shutdown")
+async def on_shutdown_async() -> None:
+    if async_engine is not None:
+        await async_engine.dispose()
 
 
 @app.exception_handler(NotFoundError)
@@ -69,6 +122,15 @@ def forbidden_handler(request: Request, exc: ForbiddenError) -> JSONResponse:
     return JSONResponse(status_code=403, content={"detail": exc.message})
 
 
+@app.exception_handler(ServiceUnavailableError)
+def service_unavailable_handler(request: Request, exc: ServiceUnavailableError) -> JSONResponse:
+    return JSONResponse(
+        status_code=503,
+        content={"detail": exc.message},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
 @app.exception_handler(AppError)
 def app_error_handler(request: Request, exc: AppError) -> JSONResponse:
     return JSONResponse(status_code=400, content={"detail": exc.message})
@@ -79,6 +141,18 @@ def validation_error_handler(request: Request, exc: RequestValidationError) -> J
     return JSONResponse(status_code=422, content={"detail": exc.errors()})
 
 
+if settings.database_async:
+    # Las lecturas asíncronas se registran primero y prevalecen sobre las síncronas.
+    from app.enrollments.async_routes import router as enrollments_async_router
+    from app.grades.async_routes import router as grades_async_router
+    from app.periods.async_routes import router as periods_async_router
+    from app.subjects.async_routes import router as subjects_async_router
+
+    app.include_router(subjects_async_router)
+    app.include_router(periods_async_router)
+    app.include_router(enrollments_async_router)
+    app.include_router(grades_async_router)
+
 app.include_router(auth_router)
 app.include_router(users_router)
 app.include_router(roles_router)
@@ -86,4 +160,8 @@ app.include_router(subjects_router)
 app.include_router(periods_router)
 app.include_router(enrollments_router)
 app.include_router(grades_router)
+app.include_router(transcripts_router)
+app.include_router(reports_router)
 app.include_router(dashboard_router)
+if settings.metrics_active:
+    app.include_router(metrics_router)
@@ -0,0 +1 @@
+"""Módulo de métricas de Prometheus."""
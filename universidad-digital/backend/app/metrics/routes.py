@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+import anyio.to_thread
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from sqlalchemy.pool import QueuePool
+
+from app.auth.revocation import revocation_filter
+from app.core.database import engine
+from app.core.metrics import MetricsMiddleware, histogram_lines, render_registry, sample_lines
+from app.core.pool import CHECKOUT_BUCKETS_MS, pool_metrics
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+router = APIRouter(tags=["metrics"])
+
+
+def _runtime_lines() -> Iterable[str]:
+    """Estado leído en el momento del scrape: no agrega trabajo a las peticiones."""
+    yield from sample_lines(
+        "http_requests_in_flight", "Peticiones HTTP en curso.", MetricsMiddleware.in_flight
+    )
+
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    yield from sample_lines(
+        "threadpool_tokens_total", "Hilos disponibles del threadpool de AnyIO.", limiter.total_tokens
+    )
+    yield from sample_lines(
+        "threadpool_tokens_borrowed", "Hilos del threadpool de AnyIO en uso.", limiter.borrowed_tokens
+    )
+
+    pool = engine.pool
+    if isinstance(pool, QueuePool):
+        yield from sample_lines("db_pool_size", "Tamaño configurado del pool de conexiones.", pool.size())
+        yield from sample_lines("db_pool_checked_out", "Conexiones prestadas.", pool.checkedout())
+        yield from sample_lines("db_pool_checked_in", "Conexiones libres en el pool.", pool.checkedin())
+        yield from sample_lines("db_pool_overflow", "Conexiones de overflow abiertas.", pool.overflow())
+    yield from sample_lines(
+        "db_pool_checkout_timeouts_total",
+        "Checkouts que fallaron por timeout.",
+        pool_metrics.timeouts,
+        kind="counter",
+    )
+    yield from sample_lines(
+        "db_pool_connect_errors_total",
+        "Checkouts que fallaron al abrir la conexión (rechazo, autenticación).",
+        pool_metrics.connect_errors,
+        kind="counter",
+    )
+    name = "db_pool_checkout_seconds"
+    yield f"# HELP {name} Latencia de checkout de conexiones (espera + conexión)."
+    yield f"# TYPE {name} histogram"
+    yield from histogram_lines(
+        name,
+        (),
+        (),
+        [bound / 1000 for bound in CHECKOUT_BUCKETS_MS],
+        list(pool_metrics.bucket_counts),
+        pool_metrics.wait_total_ms / 1000,
+        pool_metrics.checkouts,
+    )
+
+    yield from sample_lines(
+        "token_revocation_checks_total",
+        "Consultas al filtro de tokens revocados.",
+        revocation_filter.checks,
+        kind="counter",
+    )
+    yield from sample_lines(
+        "token_revocation_positives_total",
+        "Consultas que encontraron el token revocado.",
+        revocation_filter.positives,
+        kind="counter",
+    )
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics_endpoint() -> PlainTextResponse:
+    # async: el limitador del threadpool solo es accesible desde el event loop.
+    lines = render_registry()
+    lines.extend(_runtime_lines())
+    return PlainTextResponse("\n".join(lines) + "\n", media_type=CONTENT_TYPE)
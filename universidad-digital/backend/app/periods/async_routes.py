@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.catalog import catalog_cache_headers, catalog_etag, not_modified
+from app.core.deps import get_async_db, require_roles_async_dep
+from app.core.pagination import PageParams, page_params_dep, set_next_cursor
+from app.periods.async_services import get_period, list_periods
+from app.periods.schemas import AcademicPeriodResponse
+
+
+router = APIRouter(prefix="/periods", tags=["periods"])
+
+
+@router.get("/", response_model=list[AcademicPeriodResponse])
+async def list_periods_async_endpoint(
+    request: Request,
+    response: Response,
+    is_active: bool | None = Query(default=None),
+    page: PageParams = Depends(page_params_dep),
+    db: AsyncSession = Depends(get_async_db),
+    _user=Depends(require_roles_async_dep("Administrador", "Docente", "Estudiante")),
+) -> list[AcademicPeriodResponse]:
+    etag = await db.run_sync(catalog_etag, "periods", request)
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
+    periods = await list_periods(db, page, is_active=is_active)
+    set_next_cursor(response, periods, page)
+    response.headers.update(catalog_cache_headers(etag))
+    return periods
+
+
+@router.get("/{period_id}", response_model=AcademicPeriodResponse)
+async def get_period_async_endpoint(
+    period_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    _user=Depends(require_roles_async_dep("Administrador", "Docente", "Estudiante")),
+) -> AcademicPeriodResponse:
+    return await get_period(db, period_id)
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.errors import NotFoundError
+from app.core.pagination import PageParams
+from app.periods.models import AcademicPeriod
+from app.periods.services import list_periods_stmt
+
+
+async def list_periods(
+    db: AsyncSession, page: PageParams | None = None, *, is_active: bool | None = None
+) -> list[AcademicPeriod]:
+    """Lista periodos académicos."""
+    return list((await db.scalars(list_periods_stmt(page, is_active=is_active))).all())
+
+
+async def get_period(db: AsyncSession, period_id: int) -> AcademicPeriod:
+    """Obtiene un periodo académico por ID."""
+    period = await db.get(AcademicPeriod, period_id)
+    if not period:
+        raise NotFoundError("Periodo académico no encontrado.")
+    return period
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
-from sqlalchemy import select
+from sqlalchemy import Select, select
 from sqlalchemy.orm import Session
 
+from app.core.catalog import bump_catalog_version
 from app.core.errors import ConflictError, NotFoundError
+from app.core.pagination import PageParams, apply_page
+from app.dashboard.services import bump_admin_counters
 from app.periods.models import AcademicPeriod
 from app.periods.schemas import AcademicPeriodCreate, AcademicPeriodUpdate
+from app.reports.services import build_period_snapshot, drop_period_snapshot
+from app.transcripts.services import transcript_cache
 
 
 def create_period(db: Session, data: AcademicPeriodCreate) -> AcademicPeriod:
@@ -21,14 +26,25 @@ def create_period(db: Session, data: AcademicPeriodCreate) -> AcademicPeriod:
         end_date=data.end_date,
     )
     db.add(period)
+    bump_admin_counters(db, active_periods=1)
+    bump_catalog_version(db, "periods")
     db.commit()
     db.refresh(period)
     return period
 
 
-def list_periods(db: Session) -> list[AcademicPeriod]:
+def list_periods_stmt(page: PageParams | None = None, *, is_active: bool | None = None) -> Select:
+    stmt = select(AcademicPeriod)
+    if is_active is not None:
+        stmt = stmt.where(AcademicPeriod.is_active == is_active)
+    return apply_page(stmt, AcademicPeriod.id, page)
+
+
+def list_periods(
+    db: Session, page: PageParams | None = None, *, is_active: bool | None = None
+) -> list[AcademicPeriod]:
     """Lista periodos académicos."""
-    return list(db.scalars(select(AcademicPeriod).order_by(AcademicPeriod.id)).all())
+    return list(db.scalars(list_periods_stmt(page, is_active=is_active)).all())
 
 
 def get_period(db: Session, period_id: int) -> AcademicPeriod:
@@ -57,9 +73,16 @@ def update_period(db: Session, period_id: int, data: AcademicPeriodUpdate) -> Ac
         period.start_date = data.start_date
     if data.end_date is not None:
         period.end_date = data.end_date
-    if data.is_active is not None:
+    if data.is_active is not None and data.is_active != period.is_active:
         period.is_active = data.is_active
+        bump_admin_counters(db, active_periods=1 if data.is_active else -1)
+        if data.is_active:
+            drop_period_snapshot(db, period.id)
+        else:
+            build_period_snapshot(db, period.id)
+    bump_catalog_version(db, "periods")
     db.commit()
+    transcript_cache.invalidate_period(period.id)
     db.refresh(period)
     return period
 
@@ -67,7 +90,11 @@ def update_period(db: Session, period_id: int, data: AcademicPeriodUpdate) -> Ac
 def deactivate_period(db: Session, period_id: int) -> AcademicPeriod:
     """Desactiva un periodo académico (eliminación lógica)."""
     period = get_period(db, period_id)
-    period.is_active = False
+    if period.is_active:
+        period.is_active = False
+        bump_admin_counters(db, active_periods=-1)
+        build_period_snapshot(db, period.id)
+    bump_catalog_version(db, "periods")
     db.commit()
     db.refresh(period)
     return period
\ No newline at end of file
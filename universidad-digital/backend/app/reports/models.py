@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy import DateTime, ForeignKey, Integer, Numeric, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class PeriodSnapshot(Base):
+    """Marca de que los resúmenes de un periodo cerrado están materializados."""
+
+    __tablename__ = "period_snapshots"
+
+    period_id: Mapped[int] = mapped_column(ForeignKey("academic_periods.id"), primary_key=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+
+class PeriodStudentSummary(Base):
+    """Resumen por estudiante de un periodo cerrado."""
+
+    __tablename__ = "period_student_summaries"
+
+    period_id: Mapped[int] = mapped_column(ForeignKey("academic_periods.id"), primary_key=True)
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id"), primary_key=True)
+    subjects_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    credits_attempted: Mapped[int] = mapped_column(Integer, nullable=False)
+    credits_graded: Mapped[int] = mapped_column(Integer, nullable=False)
+    weighted_average: Mapped[Decimal | None] = mapped_column(Numeric(5, 2))
+
+
+class PeriodSubjectSummary(Base):
+    """Resumen por materia de un periodo cerrado."""
+
+    __tablename__ = "period_subject_summaries"
+
+    period_id: Mapped[int] = mapped_column(ForeignKey("academic_periods.id"), primary_key=True)
+    subject_id: Mapped[int] = mapped_column(ForeignKey("subjects.id"), primary_key=True)
+    enrollments_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    graded_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    average: Mapped[Decimal | None] = mapped_column(Numeric(5, 2))
+    min_grade: Mapped[Decimal | None] = mapped_column(Numeric(5, 2))
+    max_grade: Mapped[Decimal | None] = mapped_column(Numeric(5, 2))
+
+
+class PeriodTeacherSummary(Base):
+    """Resumen por docente de un periodo cerrado."""
+
+    __tablename__ = "period_teacher_summaries"
+
+    period_id: Mapped[int] = mapped_column(ForeignKey("academic_periods.id"), primary_key=True)
+    teacher_id: Mapped[int] = mapped_column(ForeignKey("users.id"), primary_key=True)
+    subjects_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    students_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    enrollments_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    average: Mapped[Decimal | None] = mapped_column(Numeric(5, 2))
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from app.core.deps import get_db, require_roles_dep
+from app.reports.schemas import (
+    PeriodSnapshotResponse,
+    PeriodStudentSummaryResponse,
+    PeriodSubjectSummaryResponse,
+    PeriodTeacherSummaryResponse,
+)
+from app.reports.services import (
+    list_student_summaries,
+    list_subject_summaries,
+    list_teacher_summaries,
+    rebuild_period_snapshot,
+)
+
+
+router = APIRouter(prefix="/reports", tags=["reports"])
+
+
+@router.get("/periods/{period_id}/students", response_model=list[PeriodStudentSummaryResponse])
+def period_students_report(
+    period_id: int,
+    db: Session = Depends(get_db),
+    _admin=Depends(require_roles_dep("Administrador")),
+):
+    return list_student_summaries(db, period_id)
+
+
+@router.get("/periods/{period_id}/subjects", response_model=list[PeriodSubjectSummaryResponse])
+def period_subjects_report(
+    period_id: int,
+    db: Session = Depends(get_db),
+    _admin=Depends(require_roles_dep("Administrador")),
+):
+    return list_subject_summaries(db, period_id)
+
+
+@router.get("/periods/{period_id}/teachers", response_model=list[PeriodTeacherSummaryResponse])
+def period_teachers_report(
+    period_id: int,
+    db: Session = Depends(get_db),
+    _admin=Depends(require_roles_dep("Administrador")),
+):
+    return list_teacher_summaries(db, period_id)
+
+
+@router.post("/periods/{period_id}/snapshot", response_model=PeriodSnapshotResponse)
+def rebuild_period_snapshot_endpoint(
+    period_id: int,
+    db: Session = Depends(get_db),
+    _admin=Depends(require_roles_dep("Administrador")),
+):
+    return rebuild_period_snapshot(db, period_id)
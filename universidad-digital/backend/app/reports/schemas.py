@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from datetime import datetime
+from decimal import Decimal
+
+from pydantic import BaseModel, ConfigDict
+
+
+class PeriodSnapshotResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    period_id: int
+    created_at: datetime
+
+
+class PeriodStudentSummaryResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    period_id: int
+    user_id: int
+    subjects_count: int
+    credits_attempted: int
+    credits_graded: int
+    weighted_average: Decimal | None = None
+
+
+class PeriodSubjectSummaryResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    period_id: int
+    subject_id: int
+    enrollments_count: int
+    graded_count: int
+    average: Decimal | None = None
+    min_grade: Decimal | None = None
+    max_grade: Decimal | None = None
+
+
+class PeriodTeacherSummaryResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    period_id: int
+    teacher_id: int
+    subjects_count: int
+    students_count: int
+    enrollments_count: int
+    average: Decimal | None = None
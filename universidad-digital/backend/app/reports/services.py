@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+from sqlalchemy import case, delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.core.errors import ConflictError, NotFoundError
+from app.enrollments.models import Enrollment
+from app.grades.models import Grade
+from app.periods.models import AcademicPeriod
+from app.reports.models import (
+    PeriodSnapshot,
+    PeriodStudentSummary,
+    PeriodSubjectSummary,
+    PeriodTeacherSummary,
+)
+from app.subjects.models import Subject
+
+
+_SUMMARY_MODELS = (PeriodStudentSummary, PeriodSubjectSummary, PeriodTeacherSummary)
+
+
+def build_period_snapshot(db: Session, period_id: int) -> None:
+    """Materializa los resúmenes de un periodo con INSERT ... SELECT (sin commit).
+
+    Se ejecuta en la misma transacción que cierra el periodo, de modo que un periodo
+    cerrado y su snapshot se confirman juntos.
+    """
+    for model in (*_SUMMARY_MODELS, PeriodSnapshot):
+        db.execute(delete(model).where(model.period_id == period_id))
+
+    finals = (
+        select(
+            Enrollment.period_id,
+            Enrollment.user_id,
+            Enrollment.subject_id,
+            Enrollment.teacher_id,
+            func.avg(Grade.value).label("final_grade"),
+        )
+        .select_from(Enrollment)
+        .outerjoin(Grade, Grade.enrollment_id == Enrollment.id)
+        .where(Enrollment.period_id == period_id, Enrollment.is_active.is_(True))
+        .group_by(
+            Enrollment.id,
+            Enrollment.period_id,
+            Enrollment.user_id,
+            Enrollment.subject_id,
+            Enrollment.teacher_id,
+        )
+        .subquery()
+    )
+    graded_credits = case((finals.c.final_grade.is_not(None), Subject.credits), else_=0)
+
+    db.execute(
+        insert(PeriodStudentSummary).from_select(
+            [
+                "period_id",
+                "user_id",
+                "subjects_count",
+                "credits_attempted",
+                "credits_graded",
+                "weighted_average",
+            ],
+            select(
+                finals.c.period_id,
+                finals.c.user_id,
+                func.count(),
+                func.sum(Subject.credits),
+                func.sum(graded_credits),
+                func.sum(finals.c.final_grade * Subject.credits)
+                / func.nullif(func.sum(graded_credits), 0),
+            )
+            .join(Subject, Subject.id == finals.c.subject_id)
+            .group_by(finals.c.period_id, finals.c.user_id),
+        )
+    )
+    db.execute(
+        insert(PeriodSubjectSummary).from_select(
+            ["period_id", "subject_id", "enrollments_count", "graded_count", "average", "min_grade", "max_grade"],
+            select(
+                finals.c.period_id,
+                finals.c.subject_id,
+                func.count(),
+                func.count(finals.c.final_grade),
+                func.avg(finals.c.final_grade),
+                func.min(finals.c.final_grade),
+                func.max(finals.c.final_grade),
+            ).group_by(finals.c.period_id, finals.c.subject_id),
+        )
+    )
+    db.execute(
+        insert(PeriodTeacherSummary).from_select(
+            ["period_id", "teacher_id", "subjects_count", "students_count", "enrollments_count", "average"],
+            select(
+                finals.c.period_id,
+                finals.c.teacher_id,
+                func.count(finals.c.subject_id.distinct()),
+                func.count(finals.c.user_id.distinct()),
+                func.count(),
+                func.avg(finals.c.final_grade),
+            )
+            .where(finals.c.teacher_id.is_not(None))
+            .group_by(finals.c.period_id, finals.c.teacher_id),
+        )
+    )
+    db.add(PeriodSnapshot(period_id=period_id))
+
+
+def drop_period_snapshot(db: Session, period_id: int) -> None:
+    """Elimina el snapshot de un periodo reabierto (sin commit)."""
+    for model in (*_SUMMARY_MODELS, PeriodSnapshot):
+        db.execute(delete(model).where(model.period_id == period_id))
+
+
+def invalidate_period_snapshot(db: Session, period_id: int) -> None:
+    """Marca como obsoleto el snapshot tras escribir inscripciones o notas del periodo.
+
+    Solo borra la marca; los reportes lo reconstruyen en la siguiente lectura.
+    """
+    db.execute(delete(PeriodSnapshot).where(PeriodSnapshot.period_id == period_id))
+
+
+def _lock_closed_period(db: Session, period_id: int) -> None:
+    """Valida que el periodo esté cerrado y bloquea su fila (FOR UPDATE) hasta el commit.
+
+    Serializa las reconstrucciones: dos lecturas concurrentes tras una invalidación
+    no insertan los mismos resúmenes.
+    """
+    period = db.get(AcademicPeriod, period_id, with_for_update=True)
+    if not period:
+        raise NotFoundError("Periodo académico no encontrado.")
+    if period.is_active:
+        raise ConflictError("Los reportes históricos solo están disponibles para periodos cerrados.")
+
+
+def rebuild_period_snapshot(db: Session, period_id: int) -> PeriodSnapshot:
+    """Reconstruye el snapshot de un periodo cerrado."""
+    _lock_closed_period(db, period_id)
+    build_period_snapshot(db, period_id)
+    db.commit()
+    return db.get(PeriodSnapshot, period_id)
+
+
+def ensure_period_snapshot(db: Session, period_id: int) -> PeriodSnapshot:
+    """Devuelve el snapshot de un periodo cerrado, construyéndolo si falta u obsoleto."""
+    snapshot = db.get(PeriodSnapshot, period_id)
+    if snapshot is not None:
+        return snapshot
+    _lock_closed_period(db, period_id)
+    # Otra petición pudo reconstruirlo mientras se esperaba el bloqueo.
+    snapshot = db.get(PeriodSnapshot, period_id)
+    if snapshot is not None:
+        db.commit()
+        return snapshot
+    build_period_snapshot(db, period_id)
+    db.commit()
+    return db.get(PeriodSnapshot, period_id)
+
+
+def list_student_summaries(db: Session, period_id: int) -> list[PeriodStudentSummary]:
+    ensure_period_snapshot(db, period_id)
+    return list(
+        db.scalars(
+            select(PeriodStudentSummary)
+            .where(PeriodStudentSummary.period_id == period_id)
+            .order_by(PeriodStudentSummary.user_id)
+        )
+    )
+
+
+def list_subject_summaries(db: Session, period_id: int) -> list[PeriodSubjectSummary]:
+    ensure_period_snapshot(db, period_id)
+    return list(
+        db.scalars(
+            select(PeriodSubjectSummary)
+            .where(PeriodSubjectSummary.period_id == period_id)
+            .order_by(PeriodSubjectSummary.subject_id)
+        )
+    )
+
+
+def list_teacher_summaries(db: Session, period_id: int) -> list[PeriodTeacherSummary]:
+    ensure_period_snapshot(db, period_id)
+    return list(
+        db.scalars(
+            select(PeriodTeacherSummary)
+            .where(PeriodTeacherSummary.period_id == period_id)
+            .order_by(PeriodTeacherSummary.teacher_id)
+        )
+    )
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, Response, status
+from fastapi import APIRouter, Depends, Request, Response, status
 from sqlalchemy.orm import Session
 
+from app.core.catalog import catalog_cache_headers, catalog_etag, not_modified
 from app.core.deps import get_db, require_roles_dep
 from app.roles.schemas import RoleCreate, RoleResponse, RoleUpdate
 from app.roles.services import create_role, delete_role, get_role, list_roles, update_role
@@ -22,9 +23,16 @@ def create_role_endpoint(
 
 @router.get("/", response_model=list[RoleResponse])
 def list_roles_endpoint(
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     _admin=Depends(require_roles_dep("Administrador")),
 ) -> list[RoleResponse]:
+    etag = catalog_etag(db, "roles", request)
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
+    response.headers.update(catalog_cache_headers(etag))
     return list_roles(db)
 
 
@@ -1,11 +1,25 @@
 from __future__ import annotations
 
-from sqlalchemy import select
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from app.auth.principal import principal_cache
+from app.core.catalog import bump_catalog_version
 from app.core.errors import ConflictError, NotFoundError
-from app.roles.models import Role
+from app.dashboard.services import COUNTED_ROLE_NAMES, recount_admin_counters
+from app.roles.models import Role, UserRole
 from app.roles.schemas import RoleCreate, RoleUpdate
+from app.users.models import User
+
+
+def _bump_role_holders(db: Session, role_id: int) -> None:
+    """Invalida los tokens de quienes tienen el rol (su máscara puede cambiar)."""
+    db.execute(
+        update(User)
+        .where(User.id.in_(select(UserRole.user_id).where(UserRole.role_id == role_id)))
+        .values(token_version=User.token_version + 1)
+    )
 
 
 def create_role(db: Session, data: RoleCreate) -> Role:
@@ -14,6 +28,7 @@ def create_role(db: Session, data: RoleCreate) -> Role:
         raise ConflictError("El nombre del rol ya existe.")
     role = Role(name=data.name, description=data.description)
     db.add(role)
+    bump_catalog_version(db, "roles")
     db.commit()
     db.refresh(role)
     return role
@@ -35,13 +50,21 @@ def get_role(db: Session, role_id: int) -> Role:
 def update_role(db: Session, role_id: int, data: RoleUpdate) -> Role:
     """Actualiza un rol."""
     role = get_role(db, role_id)
+    recount = False
     if data.name is not None and data.name != role.name:
         if db.scalar(select(Role).where(Role.name == data.name)):
             raise ConflictError("El nombre del rol ya existe.")
+        recount = bool({role.name, data.name} & COUNTED_ROLE_NAMES)
         role.name = data.name
+        _bump_role_holders(db, role.id)
     if data.description is not None:
         role.description = data.description
+    bump_catalog_version(db, "roles")
+    if recount:
+        # total_students y total_teachers se cuentan por nombre de rol.
+        recount_admin_counters(db)
     db.commit()
+    principal_cache.clear()
     db.refresh(role)
     return role
 
@@ -49,15 +72,27 @@ def update_role(db: Session, role_id: int, data: RoleUpdate) -> Role:
 def delete_role(db: Session, role_id: int) -> None:
     """Elimina un rol."""
     role = get_role(db, role_id)
+    recount = role.name in COUNTED_ROLE_NAMES
+    _bump_role_holders(db, role.id)
     db.delete(role)
+    bump_catalog_version(db, "roles")
+    if recount:
+        recount_admin_counters(db)
     db.commit()
+    principal_cache.clear()
 
 
 def ensure_default_roles(db: Session) -> None:
     """Crea roles base si no existen."""
     defaults = ["Administrador", "Docente", "Estudiante"]
     existing = {role.name for role in db.scalars(select(Role)).all()}
-    for name in defaults:
-        if name not in existing:
-            db.add(Role(name=name, description=f"Rol {name.lower()}"))
-    db.commit()
+    missing = [name for name in defaults if name not in existing]
+    if not missing:
+        return
+    for name in missing:
+        db.add(Role(name=name, description=f"Rol {name.lower()}"))
+    try:
+        db.commit()
+    except IntegrityError:
+        # Otro worker los creó al mismo tiempo (roles.name es único).
+        db.rollback()
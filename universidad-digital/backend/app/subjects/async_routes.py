@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.catalog import catalog_cache_headers, catalog_etag, not_modified
+from app.core.deps import get_async_db, require_roles_async_dep
+from app.core.pagination import PageParams, page_params_dep, set_next_cursor
+from app.subjects.async_services import get_subject, list_subjects
+from app.subjects.schemas import SubjectResponse
+
+
+router = APIRouter(prefix="/subjects", tags=["subjects"])
+
+
+@router.get("/", response_model=list[SubjectResponse])
+async def list_subjects_async_endpoint(
+    request: Request,
+    response: Response,
+    is_active: bool | None = Query(default=None),
+    page: PageParams = Depends(page_params_dep),
+    db: AsyncSession = Depends(get_async_db),
+    _user=Depends(require_roles_async_dep("Administrador", "Docente", "Estudiante")),
+) -> list[SubjectResponse]:
+    etag = await db.run_sync(catalog_etag, "subjects", request)
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
+    subjects = await list_subjects(db, page, is_active=is_active)
+    set_next_cursor(response, subjects, page)
+    response.headers.update(catalog_cache_headers(etag))
+    return subjects
+
+
+@router.get("/{subject_id}", response_model=SubjectResponse)
+async def get_subject_async_endpoint(
+    subject_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    _user=Depends(require_roles_async_dep("Administrador", "Docente", "Estudiante")),
+) -> SubjectResponse:
+    return await get_subject(db, subject_id)
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.errors import NotFoundError
+from app.core.pagination import PageParams
+from app.subjects.models import Subject
+from app.subjects.services import list_subjects_stmt
+
+
+async def list_subjects(
+    db: AsyncSession, page: PageParams | None = None, *, is_active: bool | None = None
+) -> list[Subject]:
+    """Lista materias."""
+    return list((await db.scalars(list_subjects_stmt(page, is_active=is_active))).all())
+
+
+async def get_subject(db: AsyncSession, subject_id: int) -> Subject:
+    """Obtiene una materia por ID."""
+    subject = await db.get(Subject, subject_id)
+    if not subject:
+        raise NotFoundError("Materia no encontrada.")
+    return subject
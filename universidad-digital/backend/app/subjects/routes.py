@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
 from sqlalchemy.orm import Session
 
+from app.core.catalog import catalog_cache_headers, catalog_etag, not_modified
 from app.core.deps import get_db, require_roles_dep
+from app.core.pagination import PageParams, page_params_dep, set_next_cursor
 from app.subjects.schemas import SubjectCreate, SubjectResponse, SubjectUpdate
 from app.subjects.services import (
     create_subject,
@@ -28,10 +30,21 @@ def create_subject_endpoint(
 
 @router.get("/", response_model=list[SubjectResponse])
 def list_subjects_endpoint(
+    request: Request,
+    response: Response,
+    is_active: bool | None = Query(default=None),
+    page: PageParams = Depends(page_params_dep),
     db: Session = Depends(get_db),
     _user=Depends(require_roles_dep("Administrador", "Docente", "Estudiante")),
 ) -> list[SubjectResponse]:
-    return list_subjects(db)
+    etag = catalog_etag(db, "subjects", request)
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
+    subjects = list_subjects(db, page, is_active=is_active)
+    set_next_cursor(response, subjects, page)
+    response.headers.update(catalog_cache_headers(etag))
+    return subjects
 
 
 @router.get("/{subject_id}", response_model=SubjectResponse)
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-from sqlalchemy import select
+from sqlalchemy import Select, select
 from sqlalchemy.orm import Session
 
+from app.core.catalog import bump_catalog_version
 from app.core.errors import ConflictError, NotFoundError
+from app.core.pagination import PageParams, apply_page
+from app.dashboard.services import bump_admin_counters
 from app.subjects.models import Subject
 from app.subjects.schemas import SubjectCreate, SubjectUpdate
+from app.transcripts.services import transcript_cache
 
 
 def create_subject(db: Session, data: SubjectCreate) -> Subject:
@@ -14,15 +18,25 @@ def create_subject(db: Session, data: SubjectCreate) -> Subject:
         raise ConflictError("El código de materia ya existe.")
     subject = Subject(code=data.code, name=data.name, credits=data.credits)
     db.add(subject)
+    bump_admin_counters(db, total_subjects=1)
+    bump_catalog_version(db, "subjects")
     db.commit()
     db.refresh(subject)
     return subject
 
 
-def list_subjects(db: Session) -> list[Subject]:
-    
+def list_subjects_stmt(page: PageParams | None = None, *, is_active: bool | None = None) -> Select:
+    stmt = select(Subject)
+    if is_active is not None:
+        stmt = stmt.where(Subject.is_active == is_active)
+    return apply_page(stmt, Subject.id, page)
+
+
+def list_subjects(
+    db: Session, page: PageParams | None = None, *, is_active: bool | None = None
+) -> list[Subject]:
     """Lista materias."""
-    return list(db.scalars(select(Subject).order_by(Subject.id)).all())
+    return list(db.scalars(list_subjects_stmt(page, is_active=is_active)).all())
 
 
 def get_subject(db: Session, subject_id: int) -> Subject:
@@ -40,9 +54,13 @@ def update_subject(db: Session, subject_id: int, data: SubjectUpdate) -> Subject
         subject.name = data.name
     if data.credits is not None:
         subject.credits = data.credits
-    if data.is_active is not None:
+    if data.is_active is not None and data.is_active != subject.is_active:
         subject.is_active = data.is_active
+        bump_admin_counters(db, inactive_subjects=-1 if data.is_active else 1)
+    bump_catalog_version(db, "subjects")
     db.commit()
+    # Nombre y créditos forman parte de los historiales cacheados.
+    transcript_cache.clear()
     db.refresh(subject)
     return subject
 
@@ -50,7 +68,10 @@ def update_subject(db: Session, subject_id: int, data: SubjectUpdate) -> Subject
 def deactivate_subject(db: Session, subject_id: int) -> Subject:
     """Desactiva una materia (eliminación lógica)."""
     subject = get_subject(db, subject_id)
-    subject.is_active = False
+    if subject.is_active:
+        subject.is_active = False
+        bump_admin_counters(db, inactive_subjects=1)
+    bump_catalog_version(db, "subjects")
     db.commit()
     db.refresh(subject)
     return subject
\ No newline at end of file
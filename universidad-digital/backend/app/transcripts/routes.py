@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from app.core.deps import get_current_user_dep, get_db, require_roles_dep
+from app.transcripts.schemas import TranscriptResponse
+from app.transcripts.services import get_transcript
+
+
+router = APIRouter(prefix="/transcripts", tags=["transcripts"])
+
+
+@router.get("/me", response_model=TranscriptResponse)
+def my_transcript_endpoint(
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user_dep),
+    _student=Depends(require_roles_dep("Estudiante")),
+) -> TranscriptResponse:
+    return get_transcript(db, user.id)
+
+
+@router.get("/{user_id}", response_model=TranscriptResponse)
+def user_transcript_endpoint(
+    user_id: int,
+    db: Session = Depends(get_db),
+    _admin=Depends(require_roles_dep("Administrador")),
+) -> TranscriptResponse:
+    return get_transcript(db, user_id)
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from decimal import Decimal
+
+from pydantic import BaseModel
+
+
+class TranscriptEnrollment(BaseModel):
+    """Nota final de una inscripción (promedio de sus calificaciones)."""
+
+    enrollment_id: int
+    subject_id: int
+    subject_code: str
+    subject_name: str
+    credits: int
+    final_grade: Decimal | None = None
+    grades_count: int
+
+
+class TranscriptPeriod(BaseModel):
+    """Materias de un periodo con su promedio ponderado por créditos."""
+
+    period_id: int
+    period_code: str
+    period_name: str
+    is_active: bool
+    enrollments: list[TranscriptEnrollment]
+    credits_attempted: int
+    credits_graded: int
+    average: Decimal | None = None
+    cumulative_average: Decimal | None = None
+
+
+class TranscriptResponse(BaseModel):
+    """Historial académico de un estudiante."""
+
+    user_id: int
+    full_name: str
+    periods: list[TranscriptPeriod]
+    credits_graded: int
+    cumulative_average: Decimal | None = None
@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Any
+
+from sqlalchemy import case, func, select
+from sqlalchemy.orm import Session
+
+from app.core.catalog import catalog_versions
+from app.core.config import settings
+from app.core.errors import NotFoundError
+from app.enrollments.models import Enrollment
+from app.grades.models import Grade
+from app.periods.models import AcademicPeriod
+from app.reports.models import PeriodSnapshot
+from app.subjects.models import Subject
+from app.transcripts.schemas import TranscriptEnrollment, TranscriptPeriod, TranscriptResponse
+from app.users.models import User
+
+
+_CENT = Decimal("0.01")
+
+# Marca con la que se guardó una entrada: (created_at del snapshot, versión de materias).
+_Tag = tuple[Any, int]
+
+
+class TranscriptCache:
+    """LRU acotado de periodos cerrados por (usuario, periodo).
+
+    Cada entrada lleva la marca vigente del periodo al calcularla (ver _cache_tags);
+    si la marca cambió, otro proceso escribió en el periodo y la entrada se descarta.
+    Las escrituras de este proceso además la invalidan de inmediato.
+    """
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[tuple[int, int], tuple[TranscriptPeriod, Decimal, _Tag]] = OrderedDict()
+        self._by_period: dict[int, set[int]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: int, period_id: int, tag: _Tag) -> tuple[TranscriptPeriod, Decimal] | None:
+        key = (user_id, period_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[2] != tag:
+                if entry is not None:
+                    self._discard(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0], entry[1]
+
+    def put(self, user_id: int, period: TranscriptPeriod, weighted_sum: Decimal, tag: _Tag) -> None:
+        if settings.transcript_cache_max_entries <= 0:
+            return
+        key = (user_id, period.period_id)
+        with self._lock:
+            self._entries[key] = (period, weighted_sum, tag)
+            self._entries.move_to_end(key)
+            self._by_period.setdefault(period.period_id, set()).add(user_id)
+            while len(self._entries) > settings.transcript_cache_max_entries:
+                self._discard(next(iter(self._entries)))
+
+    def invalidate_period(self, period_id: int) -> None:
+        """Descarta el periodo para todos los estudiantes (reapertura o cambio de notas)."""
+        with self._lock:
+            for user_id in self._by_period.pop(period_id, set()):
+                self._entries.pop((user_id, period_id), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_period.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+    def _discard(self, key: tuple[int, int]) -> None:
+        if self._entries.pop(key, None) is None:
+            return
+        users = self._by_period.get(key[1])
+        if users is not None:
+            users.discard(key[0])
+            if not users:
+                del self._by_period[key[1]]
+
+
+transcript_cache = TranscriptCache()
+
+
+def _round(value: Decimal | float | None) -> Decimal | None:
+    if value is None:
+        return None
+    return Decimal(str(value)).quantize(_CENT, rounding=ROUND_HALF_UP)
+
+
+def _weighted_average(weighted_sum: Decimal, credits: int) -> Decimal | None:
+    return _round(weighted_sum / credits) if credits else None
+
+
+def _cache_tags(db: Session, period_ids: list[int]) -> dict[int, _Tag]:
+    """Marca de los periodos cerrados que pueden servirse desde la caché.
+
+    Toda escritura de inscripciones o notas borra el PeriodSnapshot del periodo, en
+    cualquier worker, y un cambio de nombre o créditos sube la versión de materias.
+    Los periodos sin snapshot se calculan sin caché hasta que un reporte lo reconstruya.
+    """
+    if not period_ids:
+        return {}
+    subjects_version = catalog_versions.get(db, "subjects")
+    rows = db.execute(
+        select(PeriodSnapshot.period_id, PeriodSnapshot.created_at).where(
+            PeriodSnapshot.period_id.in_(period_ids)
+        )
+    )
+    return {period_id: (created_at, subjects_version) for period_id, created_at in rows}
+
+
+def _compute_periods(
+    db: Session, user_id: int, periods: list[AcademicPeriod]
+) -> dict[int, tuple[TranscriptPeriod, Decimal]]:
+    """Calcula notas finales y totales por periodo con agregados y ventanas SQL."""
+    finals = (
+        select(
+            Enrollment.id.label("enrollment_id"),
+            Enrollment.period_id,
+            Enrollment.subject_id,
+            func.avg(Grade.value).label("final_grade"),
+            func.count(Grade.id).label("grades_count"),
+        )
+        .select_from(Enrollment)
+        .outerjoin(Grade, Grade.enrollment_id == Enrollment.id)
+        .where(
+            Enrollment.user_id == user_id,
+            Enrollment.is_active.is_(True),
+            Enrollment.period_id.in_([period.id for period in periods]),
+        )
+        .group_by(Enrollment.id, Enrollment.period_id, Enrollment.subject_id)
+        .subquery()
+    )
+    by_period = {"partition_by": finals.c.period_id}
+    graded_credits = case((finals.c.final_grade.is_not(None), Subject.credits), else_=0)
+    stmt = (
+        select(
+            finals.c.enrollment_id,
+            finals.c.period_id,
+            finals.c.final_grade,
+            finals.c.grades_count,
+            Subject.id.label("subject_id"),
+            Subject.code.label("subject_code"),
+            Subject.name.label("subject_name"),
+            Subject.credits,
+            func.sum(Subject.credits).over(**by_period).label("credits_attempted"),
+            func.sum(graded_credits).over(**by_period).label("credits_graded"),
+            func.sum(finals.c.final_grade * Subject.credits).over(**by_period).label("weighted_sum"),
+        )
+        .join(Subject, Subject.id == finals.c.subject_id)
+        .order_by(finals.c.period_id, Subject.code)
+    )
+
+    rows_by_period: dict[int, list] = {}
+    for row in db.execute(stmt):
+        rows_by_period.setdefault(row.period_id, []).append(row)
+
+    computed: dict[int, tuple[TranscriptPeriod, Decimal]] = {}
+    for period in periods:
+        rows = rows_by_period.get(period.id, [])
+        credits_graded = int(rows[0].credits_graded or 0) if rows else 0
+        weighted_sum = Decimal(str(rows[0].weighted_sum or 0)) if rows else Decimal(0)
+        computed[period.id] = (
+            TranscriptPeriod(
+                period_id=period.id,
+                period_code=period.code,
+                period_name=period.name,
+                is_active=period.is_active,
+                enrollments=[
+                    TranscriptEnrollment(
+                        enrollment_id=row.enrollment_id,
+                        subject_id=row.subject_id,
+                        subject_code=row.subject_code,
+                        subject_name=row.subject_name,
+                        credits=row.credits,
+                        final_grade=_round(row.final_grade),
+                        grades_count=row.grades_count,
+                    )
+                    for row in rows
+                ],
+                credits_attempted=int(rows[0].credits_attempted or 0) if rows else 0,
+                credits_graded=credits_graded,
+                average=_weighted_average(weighted_sum, credits_graded),
+            ),
+            weighted_sum,
+        )
+    return computed
+
+
+def get_transcript(db: Session, user_id: int) -> TranscriptResponse:
+    """Historial con promedios por periodo y acumulados ponderados por créditos."""
+    user = db.get(User, user_id)
+    if not user:
+        raise NotFoundError("Usuario no encontrado.")
+
+    periods = list(
+        db.scalars(
+            select(AcademicPeriod)
+            .where(
+                AcademicPeriod.id.in_(
+                    select(Enrollment.period_id).where(
+                        Enrollment.user_id == user_id, Enrollment.is_active.is_(True)
+                    )
+                )
+            )
+            .order_by(AcademicPeriod.start_date, AcademicPeriod.id)
+        )
+    )
+
+    # Las marcas se leen antes de calcular: lo calculado es al menos tan reciente como ellas.
+    tags = _cache_tags(db, [period.id for period in periods if not period.is_active])
+    results: dict[int, tuple[TranscriptPeriod, Decimal]] = {}
+    pending: list[AcademicPeriod] = []
+    for period in periods:
+        tag = tags.get(period.id)
+        cached = None if tag is None else transcript_cache.get(user_id, period.id, tag)
+        if cached is None:
+            pending.append(period)
+        else:
+            results[period.id] = cached
+    if pending:
+        for period_id, entry in _compute_periods(db, user_id, pending).items():
+            results[period_id] = entry
+            tag = tags.get(period_id)
+            if tag is not None:
+                transcript_cache.put(user_id, entry[0], entry[1], tag)
+
+    transcript_periods: list[TranscriptPeriod] = []
+    cumulative_sum = Decimal(0)
+    cumulative_credits = 0
+    for period in periods:
+        period_result, weighted_sum = results[period.id]
+        cumulative_sum += weighted_sum
+        cumulative_credits += period_result.credits_graded
+        transcript_periods.append(
+            period_result.model_copy(
+                update={"cumulative_average": _weighted_average(cumulative_sum, cumulative_credits)}
+            )
+        )
+
+    return TranscriptResponse(
+        user_id=user.id,
+        full_name=user.full_name,
+        periods=transcript_periods,
+        credits_graded=cumulative_credits,
+        cumulative_average=_weighted_average(cumulative_sum, cumulative_credits),
+    )
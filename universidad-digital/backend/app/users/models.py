@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, String, func
+from sqlalchemy import Boolean, DateTime, Index, Integer, String, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from app.core.database import Base
@@ -11,6 +11,17 @@ from app.enrollments.models import Enrollment
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        # Conteos de usuarios activos y el JOIN con roles del dashboard.
+        Index(
+            "ix_users_id_active",
+            "id",
+            postgresql_where=text("is_active"),
+            sqlite_where=text("is_active"),
+        ),
+        # Refresco incremental de la caché de nombres por updated_at.
+        Index("ix_users_updated_at", "updated_at"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
@@ -21,6 +32,8 @@ class User(Base):
     updated_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), onupdate=func.now()
     )
+    # Se incrementa al cambiar roles o desactivar al usuario: invalida los tokens previos.
+    token_version: Mapped[int] = mapped_column(Integer, default=0, server_default="0", nullable=False)
 
     roles = relationship("Role", secondary="user_roles", back_populates="users")
     enrollments = relationship(
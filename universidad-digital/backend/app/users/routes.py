@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy.orm import Session
 
 from app.core.deps import get_db, require_roles_dep
+from app.core.pagination import PageParams, page_params_dep, set_next_cursor
+from app.core.responses import list_response
 from app.users.schemas import UserCreate, UserResponse, UserUpdate
 from app.users.services import (
     assign_role,
@@ -13,6 +15,7 @@ from app.users.services import (
     list_users,
     remove_role,
     update_user,
+    user_rows,
 )
 
 
@@ -31,14 +34,15 @@ def create_user_endpoint(
 
 @router.get("/", response_model=list[UserResponse])
 def list_users_endpoint(
+    response: Response,
+    is_active: bool | None = Query(default=None),
+    page: PageParams = Depends(page_params_dep),
     db: Session = Depends(get_db),
     _admin=Depends(require_roles_dep("Administrador")),
 ) -> list[UserResponse]:
-    users = list_users(db)
-    return [
-        UserResponse.model_validate(user, from_attributes=True)
-        for user in users
-    ]
+    users = list_users(db, page, is_active=is_active)
+    set_next_cursor(response, users, page)
+    return list_response(response, user_rows(users))
 
 
 @router.get("/{user_id}", response_model=UserResponse)
@@ -40,10 +40,10 @@ class UserResponse(BaseModel):
     def _coerce_roles(cls, value: object) -> list[str]:
         if value is None:
             return []
-        if isinstance(value, list):
+        if isinstance(value, (list, tuple)):
             if not value:
                 return []
             if isinstance(value[0], str):
-                return value
+                return list(value)
             return [getattr(role, "name", str(role)) for role in value]
         return [str(value)]
\ No newline at end of file
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+from typing import Any
+
 from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
+from app.auth.principal import principal_cache
 from app.core.errors import ConflictError, NotFoundError
+from app.core.names import name_cache
+from app.core.pagination import PageParams, apply_page
 from app.core.security import hash_password
+from app.dashboard.services import bump_user_counters, user_counter_state
 from app.roles.models import Role
 from app.users.models import User
 from app.users.schemas import UserCreate, UserUpdate
@@ -39,14 +45,36 @@ def create_user(db: Session, data: UserCreate) -> User:
     if roles:
         user.roles = roles
     db.add(user)
+    db.flush()
+    bump_user_counters(db, user_counter_state(None), user_counter_state(user))
     db.commit()
     db.refresh(user)
     return user
 
 
-def list_users(db: Session) -> list[User]:
-    """Lista usuarios."""
-    return list(db.scalars(select(User).order_by(User.id)).all())
+def list_users(
+    db: Session, page: PageParams | None = None, *, is_active: bool | None = None
+) -> list[User]:
+    """Lista usuarios con sus roles cargados en una sola consulta adicional."""
+    stmt = select(User).options(selectinload(User.roles))
+    if is_active is not None:
+        stmt = stmt.where(User.is_active == is_active)
+    return list(db.scalars(apply_page(stmt, User.id, page)).all())
+
+
+def user_rows(users: list[User]) -> list[dict[str, Any]]:
+    """Arma los dicts con la forma de UserResponse (roles como nombres)."""
+    return [
+        {
+            "id": user.id,
+            "email": user.email,
+            "full_name": user.full_name,
+            "is_active": user.is_active,
+            "created_at": user.created_at,
+            "roles": [role.name for role in user.roles],
+        }
+        for user in users
+    ]
 
 
 def get_user(db: Session, user_id: int) -> User:
@@ -60,6 +88,7 @@ def get_user(db: Session, user_id: int) -> User:
 def update_user(db: Session, user_id: int, data: UserUpdate) -> User:
     """Actualiza un usuario."""
     user = get_user(db, user_id)
+    before = user_counter_state(user)
     if data.full_name is not None:
         user.full_name = data.full_name
     if data.password is not None:
@@ -70,13 +99,19 @@ def update_user(db: Session, user_id: int, data: UserUpdate) -> User:
             raise ConflictError(f"La contraseña debe tener al menos {min_length} caracteres.")
         user.hashed_password = hash_password(data.password)
     if data.is_active is not None:
+        if user.is_active and not data.is_active:
+            user.token_version += 1
         user.is_active = data.is_active
     if data.role_ids is not None:
         roles = list(db.scalars(select(Role).where(Role.id.in_(data.role_ids))).all())
         if len(roles) != len(set(data.role_ids)):
             raise NotFoundError("Rol no encontrado.")
         user.roles = roles
+        user.token_version += 1
+    bump_user_counters(db, before, user_counter_state(user))
     db.commit()
+    principal_cache.invalidate_user(user.id)
+    name_cache.invalidate_user(user.id)
     db.refresh(user)
     return user
 
@@ -84,8 +119,13 @@ def update_user(db: Session, user_id: int, data: UserUpdate) -> User:
 def deactivate_user(db: Session, user_id: int) -> User:
     """Desactiva un usuario (eliminación lógica)."""
     user = get_user(db, user_id)
+    before = user_counter_state(user)
+    if user.is_active:
+        user.token_version += 1
     user.is_active = False
+    bump_user_counters(db, before, user_counter_state(user))
     db.commit()
+    principal_cache.invalidate_user(user.id)
     db.refresh(user)
     return user
 
@@ -97,8 +137,12 @@ def assign_role(db: Session, user_id: int, role_id: int) -> User:
     if not role:
         raise NotFoundError("Rol no encontrado.")
     if role not in user.roles:
+        before = user_counter_state(user)
         user.roles.append(role)
+        user.token_version += 1
+        bump_user_counters(db, before, user_counter_state(user))
         db.commit()
+        principal_cache.invalidate_user(user.id)
         db.refresh(user)
     return user
 
@@ -110,7 +154,11 @@ def remove_role(db: Session, user_id: int, role_id: int) -> User:
     if not role:
         raise NotFoundError("Rol no encontrado.")
     if role in user.roles:
+        before = user_counter_state(user)
         user.roles.remove(role)
+        user.token_version += 1
+        bump_user_counters(db, before, user_counter_state(user))
         db.commit()
+        principal_cache.invalidate_user(user.id)
         db.refresh(user)
     return user
@@ -0,0 +1,114 @@
+"""Bytes transferidos y CPU de compresión para listados grandes.
+
+Genera cuerpos JSON sintéticos con la forma de /users, /enrollments y /grades y los
+comprime con cada codificador disponible (gzip siempre; br y zstd si `brotli` o
+`zstandard` están instalados) usando los niveles de APP_COMPRESSION_*.
+
+Se ejecuta desde backend/ sin base de datos:
+    python benchmarks/compression.py --rows 10000 --repeat 5
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.core.compression import available_encoders  # noqa: E402
+from app.core.config import settings  # noqa: E402
+from app.core.responses import dumps  # noqa: E402
+
+
+def _payloads(count: int) -> dict[str, bytes]:
+    started = datetime(2025, 1, 1, 8, 0, 0)
+    users = [
+        {
+            "id": i,
+            "email": f"estudiante{i}@ud.edu",
+            "full_name": f"Estudiante Número {i}",
+            "is_active": i % 9 != 0,
+            "created_at": started + timedelta(minutes=i),
+            "roles": ["Estudiante"],
+        }
+        for i in range(1, count + 1)
+    ]
+    enrollments = [
+        {
+            "id": i,
+            "user_id": 1000 + i % 5000,
+            "subject_id": 1 + i % 40,
+            "period_id": 1 + i % 6,
+            "teacher_id": 10 + i % 50,
+            "is_active": i % 7 != 0,
+            "enrolled_at": started + timedelta(minutes=i),
+            "subject_name": f"Materia {1 + i % 40}",
+            "period_name": f"Periodo 2025-{1 + i % 6}",
+            "user_name": f"Estudiante Número {1000 + i % 5000}",
+            "teacher_name": f"Docente {10 + i % 50}",
+        }
+        for i in range(1, count + 1)
+    ]
+    grades = [
+        {
+            "id": i,
+            "enrollment_id": 1 + i % (count // 2 or 1),
+            "value": f"{(i * 37) % 10001 / 100:.2f}",
+            "notes": None,
+            "created_at": started + timedelta(minutes=i),
+            "user_name": f"Estudiante Número {1000 + i % 5000}",
+        }
+        for i in range(1, count + 1)
+    ]
+    return {
+        "/users": dumps(users),
+        "/enrollments": dumps(enrollments),
+        "/grades": dumps(grades),
+    }
+
+
+def _measure(encoder, body: bytes, repeat: int) -> dict:
+    compressed = encoder(body)
+    timings = []
+    for _ in range(repeat):
+        started = time.process_time()
+        encoder(body)
+        timings.append(time.process_time() - started)
+    cpu = min(timings)
+    return {
+        "bytes": len(compressed),
+        "ratio": round(len(body) / len(compressed), 2),
+        "cpu_ms": round(cpu * 1000, 2),
+        "cpu_ms_per_mb": round(cpu * 1000 / (len(body) / 1_000_000), 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    encoders = available_encoders()
+    results = {}
+    for path, body in _payloads(args.rows).items():
+        results[path] = {"identity": {"bytes": len(body), "ratio": 1.0, "cpu_ms": 0.0}}
+        for name, encoder in encoders.items():
+            results[path][name] = _measure(encoder, body, args.repeat)
+    print(json.dumps({
+        "rows": args.rows,
+        "levels": {
+            "gzip": settings.compression_gzip_level,
+            "br": settings.compression_brotli_quality,
+            "zstd": settings.compression_zstd_level,
+        },
+        "encoders": list(encoders),
+        "results": results,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
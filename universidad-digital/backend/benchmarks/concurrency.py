@@ -0,0 +1,96 @@
+"""Carga concurrente sobre rutas de lectura de un backend en ejecución.
+
+Pensado para comparar el modo síncrono con el asíncrono (APP_DATABASE_ASYNC):
+levantar el backend en cada modo y ejecutar el mismo comando contra ambos.
+
+Uso:
+    python benchmarks/concurrency.py --base-url http://127.0.0.1:8000 \\
+        --email admin@ud.edu --password AdminPass1234 \\
+        --clients 100,300,500 --duration 20 --path "/enrollments/?limit=50"
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+
+
+def _login(base_url: str, email: str, password: str) -> str:
+    body = json.dumps({"email": email, "password": password}).encode()
+    req = urllib.request.Request(f"{base_url}/auth/login", data=body, method="POST")
+    req.add_header("Content-Type", "application/json")
+    with urllib.request.urlopen(req, timeout=60) as resp:
+        return json.loads(resp.read())["access_token"]
+
+
+def _percentile(ordered: list[float], pct: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def run_level(url: str, token: str, clients: int, duration: float) -> dict:
+    latencies: list[float] = []
+    errors = 0
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def client() -> None:
+        nonlocal errors
+        local: list[float] = []
+        local_errors = 0
+        while time.perf_counter() < deadline:
+            req = urllib.request.Request(url)
+            req.add_header("Authorization", f"Bearer {token}")
+            started = time.perf_counter()
+            try:
+                with urllib.request.urlopen(req, timeout=60) as resp:
+                    resp.read()
+                local.append((time.perf_counter() - started) * 1000)
+            except (urllib.error.URLError, TimeoutError, ConnectionError):
+                local_errors += 1
+        with lock:
+            latencies.extend(local)
+            errors += local_errors
+
+    threads = [threading.Thread(target=client, daemon=True) for _ in range(clients)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "clients": clients,
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": round(len(latencies) / elapsed, 2),
+        "p50_ms": round(_percentile(latencies, 50), 2),
+        "p95_ms": round(_percentile(latencies, 95), 2),
+        "p99_ms": round(_percentile(latencies, 99), 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--email", required=True)
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--path", default="/enrollments/?limit=50")
+    parser.add_argument("--clients", default="100,300,500", help="Niveles de concurrencia separados por coma")
+    parser.add_argument("--duration", type=float, default=20.0, help="Segundos por nivel")
+    args = parser.parse_args()
+
+    token = _login(args.base_url, args.email, args.password)
+    url = f"{args.base_url}{args.path}"
+    levels = [int(value) for value in args.clients.split(",") if value.strip()]
+    results = [run_level(url, token, clients, args.duration) for clients in levels]
+    print(json.dumps({"path": args.path, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
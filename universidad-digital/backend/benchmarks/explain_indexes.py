@@ -0,0 +1,161 @@
+"""Verifica con EXPLAIN que las consultas calientes usan los índices esperados.
+
+Construye las consultas con los mismos builders de los servicios (listados de
+inscripciones, dashboard, refresco de la caché de nombres y del filtro de tokens
+revocados, purga de revoked_tokens) y busca el índice
+esperado en el plan de PostgreSQL. Requiere una base con datos representativos y
+las migraciones 003_query_indexes y 007_revoked_tokens_indexes aplicadas.
+
+El listado de calificaciones del docente no tiene un plan fijo: según la fracción de
+calificaciones del docente, PostgreSQL recorre grades_pkey por el ORDER BY id o parte
+de sus inscripciones; ambos son correctos y por eso no se verifica aquí.
+
+Uso (desde backend/, con APP_DATABASE_URL apuntando a PostgreSQL):
+    python benchmarks/explain_indexes.py --analyze
+Sale con código 1 si algún plan no usa el índice esperado. tests/test_explain_indexes.py
+hace la misma verificación sobre datos sembrados cuando APP_TEST_POSTGRES_URL está definida.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from sqlalchemy import Select, func, select, text  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.auth.models import RevokedToken  # noqa: E402
+from app.auth.permissions import Permission  # noqa: E402
+from app.auth.principal import Principal  # noqa: E402
+from app.core.database import SessionLocal, engine  # noqa: E402
+from app.core.pagination import PageParams  # noqa: E402
+from app.enrollments.models import Enrollment  # noqa: E402
+from app.enrollments.services import list_enrollments_stmt  # noqa: E402
+from app.grades.models import Grade  # noqa: E402
+from app.roles.models import Role  # noqa: E402
+from app.users.models import User  # noqa: E402
+
+
+def _principal(user_id: int, permission: Permission) -> Principal:
+    return Principal(
+        id=user_id,
+        email="",
+        full_name="",
+        is_active=True,
+        created_at=datetime.now(timezone.utc),
+        permissions=int(permission),
+    )
+
+
+def _busiest(db: Session, column) -> int:
+    """Id con más inscripciones activas: el caso que más se beneficia del índice."""
+    row = db.execute(
+        select(column, func.count())
+        .where(Enrollment.is_active.is_(True), column.is_not(None))
+        .group_by(column)
+        .order_by(func.count().desc())
+        .limit(1)
+    ).first()
+    if row is None:
+        raise SystemExit("No hay inscripciones activas; cargar datos antes de ejecutar.")
+    return row[0]
+
+
+def explain_cases(db: Session) -> list[tuple[str, Select, str]]:
+    """(descripción, consulta, índice esperado) para cada consulta caliente."""
+    teacher = _principal(_busiest(db, Enrollment.teacher_id), Permission.TEACHER)
+    student = _principal(_busiest(db, Enrollment.user_id), Permission.STUDENT)
+    page = PageParams(limit=100)
+    enrollment_ids = select(Enrollment.id).where(
+        Enrollment.teacher_id == teacher.id, Enrollment.is_active.is_(True)
+    )
+    return [
+        (
+            "inscripciones activas del docente",
+            list_enrollments_stmt(teacher, page, is_active=True),
+            "ix_enrollments_teacher_id_active",
+        ),
+        (
+            "inscripciones activas del estudiante",
+            list_enrollments_stmt(student, page, is_active=True),
+            "ix_enrollments_user_id_active",
+        ),
+        (
+            "conteo de calificaciones (dashboard docente)",
+            select(func.count(Grade.id)).where(Grade.enrollment_id.in_(enrollment_ids)),
+            "ix_grades_enrollment_id_id",
+        ),
+        (
+            "estudiantes activos (dashboard administrador)",
+            select(func.count(User.id))
+            .join(User.roles)
+            .where(Role.name == "Estudiante", User.is_active.is_(True)),
+            "ix_user_roles_role_id_user_id",
+        ),
+        (
+            "refresco de la caché de nombres",
+            select(User.id, User.full_name, User.updated_at).where(
+                User.updated_at >= datetime.now(timezone.utc) - timedelta(seconds=60)
+            ),
+            "ix_users_updated_at",
+        ),
+        (
+            "refresco del filtro de tokens revocados",
+            select(RevokedToken.jti, RevokedToken.expires_at, RevokedToken.revoked_at).where(
+                RevokedToken.revoked_at >= datetime.now(timezone.utc) - timedelta(seconds=60)
+            ),
+            "ix_revoked_tokens_revoked_at",
+        ),
+        (
+            "purga de tokens revocados expirados",
+            select(func.count(RevokedToken.id)).where(
+                RevokedToken.expires_at <= datetime.now(timezone.utc)
+            ),
+            "ix_revoked_tokens_expires_at",
+        ),
+    ]
+
+
+def _index_names(plan: dict) -> set[str]:
+    names = {plan["Index Name"]} if "Index Name" in plan else set()
+    for child in plan.get("Plans", ()):
+        names |= _index_names(child)
+    return names
+
+
+def used_indexes(db: Session, stmt: Select) -> list[str]:
+    """Índices que aparecen en el plan de PostgreSQL para la consulta."""
+    dialect = db.get_bind().dialect
+    sql = str(stmt.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+    plan = db.execute(text(f"EXPLAIN (FORMAT JSON) {sql}")).scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return sorted(_index_names(plan[0]["Plan"]))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--analyze", action="store_true", help="Ejecuta ANALYZE antes de los planes")
+    args = parser.parse_args()
+
+    if engine.dialect.name != "postgresql":
+        raise SystemExit("Los planes esperados son de PostgreSQL; APP_DATABASE_URL apunta a otro motor.")
+    with SessionLocal() as db:
+        if args.analyze:
+            for table in ("users", "user_roles", "enrollments", "grades", "revoked_tokens"):
+                db.execute(text(f"ANALYZE {table}"))
+        results = []
+        for name, stmt, expected in explain_cases(db):
+            used = used_indexes(db, stmt)
+            results.append({"query": name, "expected": expected, "used": used, "ok": expected in used})
+    print(json.dumps({"results": results}, indent=2, ensure_ascii=False))
+    if not all(result["ok"] for result in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
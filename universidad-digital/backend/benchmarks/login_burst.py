@@ -0,0 +1,99 @@
+"""Ráfaga de logins contra un backend en ejecución.
+
+Mide el throughput de `POST /auth/login` y la latencia (p50/p99) de una ruta
+no relacionada consultada en paralelo durante la ráfaga.
+
+Uso:
+    python benchmarks/login_burst.py --base-url http://127.0.0.1:8000 \\
+        --email admin@ud.edu --password AdminPass1234 --logins 400 --concurrency 64
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+
+def _request(url: str, method: str = "GET", body: dict | None = None, token: str | None = None) -> tuple[int, bytes]:
+    data = json.dumps(body).encode() if body is not None else None
+    req = urllib.request.Request(url, data=data, method=method)
+    req.add_header("Content-Type", "application/json")
+    if token:
+        req.add_header("Authorization", f"Bearer {token}")
+    try:
+        with urllib.request.urlopen(req, timeout=60) as resp:
+            return resp.status, resp.read()
+    except urllib.error.HTTPError as exc:
+        return exc.code, exc.read()
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--email", required=True)
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--logins", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--probe-path", default="/periods/?limit=20")
+    args = parser.parse_args()
+
+    credentials = {"email": args.email, "password": args.password}
+    status, body = _request(f"{args.base_url}/auth/login", "POST", credentials)
+    if status != 200:
+        raise SystemExit(f"Login inicial fallido ({status}): {body[:200]!r}")
+    token = json.loads(body)["access_token"]
+
+    probe_latencies: list[float] = []
+    stop = threading.Event()
+
+    def probe() -> None:
+        while not stop.is_set():
+            started = time.perf_counter()
+            _request(f"{args.base_url}{args.probe_path}", token=token)
+            probe_latencies.append((time.perf_counter() - started) * 1000)
+
+    statuses: dict[int, int] = {}
+    status_lock = threading.Lock()
+
+    def login(_: int) -> None:
+        code, _body = _request(f"{args.base_url}/auth/login", "POST", credentials)
+        with status_lock:
+            statuses[code] = statuses.get(code, 0) + 1
+
+    prober = threading.Thread(target=probe, daemon=True)
+    prober.start()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        list(pool.map(login, range(args.logins)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    prober.join()
+
+    print(json.dumps({
+        "logins": args.logins,
+        "concurrency": args.concurrency,
+        "elapsed_s": round(elapsed, 3),
+        "logins_per_s": round(statuses.get(200, 0) / elapsed, 2),
+        "login_statuses": statuses,
+        "probe_path": args.probe_path,
+        "probe_requests": len(probe_latencies),
+        "probe_p50_ms": round(statistics.median(probe_latencies), 2) if probe_latencies else 0.0,
+        "probe_p99_ms": round(_percentile(probe_latencies, 99), 2),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
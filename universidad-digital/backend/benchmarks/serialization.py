@@ -0,0 +1,120 @@
+"""Costo por fila de serializar un listado de inscripciones.
+
+Compara, sobre filas sintéticas con la forma del SELECT del listado:
+
+- models: un EnrollmentResponse por fila y luego la validación y el volcado de
+  response_model que hace FastAPI (el camino previo).
+- validated: filas ya armadas como dict validadas una sola vez por response_model
+  (el camino por defecto, APP_FAST_JSON=false).
+- fast: filas ya armadas serializadas directo (APP_FAST_JSON=true; orjson si está
+  instalado).
+
+No usa la base de datos; se ejecuta desde backend/:
+    python benchmarks/serialization.py --rows 10000 --repeat 5
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from collections import namedtuple
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from pydantic import TypeAdapter  # noqa: E402
+
+from app.core import responses  # noqa: E402
+from app.core.names import ResolvedNames  # noqa: E402
+from app.enrollments.schemas import EnrollmentResponse  # noqa: E402
+from app.enrollments.services import build_enrollment_responses, enrollment_rows  # noqa: E402
+
+
+_Row = namedtuple(
+    "_Row", "id user_id subject_id period_id teacher_id is_active enrolled_at"
+)
+_ADAPTER = TypeAdapter(list[EnrollmentResponse])
+
+
+def _fixture(count: int) -> tuple[list[_Row], ResolvedNames]:
+    started = datetime(2025, 1, 1, 8, 0, 0)
+    rows = [
+        _Row(i, 1000 + i % 5000, 1 + i % 40, 1 + i % 6, 10 + i % 50, i % 7 != 0, started + timedelta(minutes=i))
+        for i in range(1, count + 1)
+    ]
+    names = ResolvedNames(
+        subjects={i: f"Materia {i}" for i in range(1, 41)},
+        periods={i: f"Periodo {i}" for i in range(1, 7)},
+        users={
+            **{i: f"Estudiante {i}" for i in range(1000, 6000)},
+            **{i: f"Docente {i}" for i in range(10, 60)},
+        },
+    )
+    return rows, names
+
+
+def _stdlib_render(content: object) -> bytes:
+    # Igual que JSONResponse de Starlette.
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode()
+
+
+def _response_model(content: object) -> bytes:
+    # Lo que hace FastAPI con response_model: validar, volcar a JSON-compatible y renderizar.
+    validated = _ADAPTER.validate_python(content)
+    return _stdlib_render(_ADAPTER.dump_python(validated, mode="json"))
+
+
+def run_models(rows: list[_Row], names: ResolvedNames) -> bytes:
+    return _response_model(build_enrollment_responses(rows, names))
+
+
+def run_validated(rows: list[_Row], names: ResolvedNames) -> bytes:
+    return _response_model(enrollment_rows(rows, names))
+
+
+def run_fast(rows: list[_Row], names: ResolvedNames) -> bytes:
+    return responses.dumps(enrollment_rows(rows, names))
+
+
+def _measure(func, rows: list[_Row], names: ResolvedNames, repeat: int) -> dict:
+    func(rows, names)
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        body = func(rows, names)
+        timings.append(time.perf_counter() - started)
+    best = min(timings)
+    return {
+        "best_ms": round(best * 1000, 2),
+        "per_row_us": round(best / len(rows) * 1_000_000, 3),
+        "bytes": len(body),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows, names = _fixture(args.rows)
+    if json.loads(run_fast(rows, names)) != json.loads(run_models(rows, names)):
+        raise SystemExit("La salida del camino rápido difiere de la de response_model.")
+    results = {
+        name: _measure(func, rows, names, args.repeat)
+        for name, func in (("models", run_models), ("validated", run_validated), ("fast", run_fast))
+    }
+    baseline = results["models"]["best_ms"]
+    for result in results.values():
+        result["speedup"] = round(baseline / result["best_ms"], 2) if result["best_ms"] else None
+    print(json.dumps({
+        "rows": args.rows,
+        "encoder": "orjson" if responses.orjson is not None else "json",
+        "results": results,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
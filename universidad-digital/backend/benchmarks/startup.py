@@ -0,0 +1,91 @@
+"""Tiempo hasta la primera petición atendida al arrancar un worker.
+
+Lanza `uvicorn app.main:app` varias veces con el entorno actual y mide desde el
+lanzamiento del proceso hasta la primera respuesta HTTP de --path (cualquier código
+cuenta como atendida). También mide el import de app.main por separado.
+
+Comparar el arranque completo con el de solo verificación (previo
+`python -m app.core.bootstrap`), desde backend/:
+    python benchmarks/startup.py --runs 5 --mode bootstrap
+    python benchmarks/startup.py --runs 5 --mode verify
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+_BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+
+def _env(mode: str) -> dict[str, str]:
+    env = dict(os.environ)
+    env["APP_STARTUP_BOOTSTRAP"] = "true" if mode == "bootstrap" else "false"
+    return env
+
+
+def import_ms(mode: str) -> float:
+    code = "import time; s = time.perf_counter(); import app.main; print(time.perf_counter() - s)"
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=_BACKEND_DIR, env=_env(mode), capture_output=True, text=True, check=True
+    )
+    return float(out.stdout.strip().splitlines()[-1]) * 1000
+
+
+def first_request_ms(mode: str, port: int, path: str, timeout: float) -> float:
+    url = f"http://127.0.0.1:{port}{path}"
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=_BACKEND_DIR,
+        env=_env(mode),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            if proc.poll() is not None:
+                raise SystemExit(f"El worker terminó al arrancar:\n{proc.stderr.read().decode()}")
+            try:
+                with urllib.request.urlopen(url, timeout=1):
+                    pass
+            except urllib.error.HTTPError:
+                pass
+            except (urllib.error.URLError, ConnectionError, TimeoutError):
+                time.sleep(0.005)
+                continue
+            return (time.perf_counter() - started) * 1000
+        raise SystemExit(f"Sin respuesta de {url} tras {timeout}s")
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mode", choices=("bootstrap", "verify"), default="bootstrap")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--port", type=int, default=8799)
+    parser.add_argument("--path", default="/auth/me")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    args = parser.parse_args()
+
+    imports = [import_ms(args.mode) for _ in range(args.runs)]
+    firsts = [first_request_ms(args.mode, args.port, args.path, args.timeout) for _ in range(args.runs)]
+    print(json.dumps({
+        "mode": args.mode,
+        "runs": args.runs,
+        "import_ms": {"median": round(statistics.median(imports), 1), "min": round(min(imports), 1)},
+        "first_request_ms": {"median": round(statistics.median(firsts), 1), "min": round(min(firsts), 1)},
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""Configuración común: SQLite temporal y hashing en el mismo proceso.
+
+Las variables se fijan antes de importar la aplicación porque `settings` y los
+engines se crean al importar.
+"""
+from __future__ import annotations
+
+import os
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+_DATA_DIR = Path(tempfile.mkdtemp(prefix="universidad-tests-"))
+
+os.environ["APP_DATABASE_URL"] = f"sqlite:///{_DATA_DIR / 'test.sqlite'}"
+os.environ["APP_DATABASE_ASYNC"] = "false"
+os.environ.setdefault("APP_JWT_SECRET", "clave-de-pruebas-" + "x" * 32)
+os.environ["APP_ENV"] = "test"
+os.environ["APP_PASSWORD_HASH_WORKERS"] = "0"
+# Sin refrescos periódicos de cachés a mitad de una medición.
+os.environ["APP_REVOCATION_REFRESH_SECONDS"] = "3600"
+os.environ["APP_NAME_CACHE_REFRESH_SECONDS"] = "3600"
+os.environ["APP_CATALOG_VERSION_REFRESH_SECONDS"] = "3600"
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import event, select  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.core.database import SessionLocal, engine  # noqa: E402
+from app.core.security import hash_password  # noqa: E402
+from app.main import app  # noqa: E402
+from app.roles.models import Role  # noqa: E402
+from app.users.models import User  # noqa: E402
+
+
+ADMIN_EMAIL = "admin@pruebas.ud.edu"
+ADMIN_PASSWORD = "AdminPass1234"
+
+
+@pytest.fixture(scope="session")
+def client() -> Iterator[TestClient]:
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def db(client: TestClient) -> Iterator[Session]:
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture(scope="session")
+def admin_headers(client: TestClient) -> dict[str, str]:
+    with SessionLocal() as session:
+        role = session.scalar(select(Role).where(Role.name == "Administrador"))
+        admin = User(email=ADMIN_EMAIL, full_name="Admin Pruebas", hashed_password=hash_password(ADMIN_PASSWORD))
+        admin.roles = [role]
+        session.add(admin)
+        session.commit()
+    response = client.post("/auth/login", json={"email": ADMIN_EMAIL, "password": ADMIN_PASSWORD})
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def role_id(name: str) -> int:
+    with SessionLocal() as session:
+        return session.scalar(select(Role.id).where(Role.name == name))
+
+
+def create_user(
+    client: TestClient, admin_headers: dict[str, str], email: str, roles: list[str], password: str = "ClaveSegura123"
+) -> dict:
+    response = client.post(
+        "/users/",
+        headers=admin_headers,
+        json={
+            "email": email,
+            "full_name": email.split("@")[0].replace(".", " ").title(),
+            "password": password,
+            "role_ids": [role_id(name) for name in roles],
+        },
+    )
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+def login(client: TestClient, email: str, password: str = "ClaveSegura123") -> dict[str, str]:
+    response = client.post("/auth/login", json={"email": email, "password": password})
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+def post(client: TestClient, headers: dict[str, str], path: str, payload: dict) -> dict:
+    """POST que debe crear (201) y retorna el cuerpo."""
+    response = client.post(path, headers=headers, json=payload)
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+def create_course(
+    client: TestClient, admin_headers: dict[str, str], code: str, credits: int = 3
+) -> tuple[dict, dict]:
+    """Materia y periodo propios de una prueba (los códigos son únicos)."""
+    subject = post(client, admin_headers, "/subjects/", {"code": code, "name": f"Materia {code}", "credits": credits})
+    period = post(
+        client,
+        admin_headers,
+        "/periods/",
+        {"code": code, "name": f"Periodo {code}", "start_date": "2025-01-01", "end_date": "2025-06-30"},
+    )
+    return subject, period
+
+
+def enroll(
+    client: TestClient, admin_headers: dict[str, str], user_id: int, subject_id: int, period_id: int, teacher_id: int | None = None
+) -> dict:
+    return post(
+        client,
+        admin_headers,
+        "/enrollments/",
+        {"user_id": user_id, "subject_id": subject_id, "period_id": period_id, "teacher_id": teacher_id},
+    )
+
+
+@contextmanager
+def count_statements() -> Iterator[list[str]]:
+    """Todas las sentencias del engine síncrono durante el bloque, en cualquier hilo."""
+    statements: list[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:  # type: ignore[no-untyped-def]
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
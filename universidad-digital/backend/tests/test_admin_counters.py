@@ -0,0 +1,50 @@
+"""Contadores del dashboard administrador ante cambios en los roles base."""
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+
+from tests.conftest import create_user, role_id
+
+
+def _dashboard(client: TestClient, admin_headers: dict[str, str]) -> dict[str, int]:
+    response = client.get("/dashboard/admin", headers=admin_headers)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def _drift(client: TestClient, admin_headers: dict[str, str]) -> dict[str, int]:
+    response = client.post("/dashboard/admin/reconcile", headers=admin_headers)
+    assert response.status_code == 200, response.text
+    return response.json()["drift"]
+
+
+def test_renaming_student_role_recounts(client: TestClient, admin_headers: dict[str, str]) -> None:
+    create_user(client, admin_headers, "cnt.estudiante1@ud.edu", ["Estudiante"])
+    create_user(client, admin_headers, "cnt.estudiante2@ud.edu", ["Estudiante"])
+    students = _dashboard(client, admin_headers)["total_students"]
+    assert students >= 2
+    student_role = role_id("Estudiante")
+
+    response = client.put(f"/roles/{student_role}", headers=admin_headers, json={"name": "Alumno"})
+    assert response.status_code == 200, response.text
+    assert _dashboard(client, admin_headers)["total_students"] == 0
+    assert _drift(client, admin_headers) == {}
+
+    response = client.put(f"/roles/{student_role}", headers=admin_headers, json={"name": "Estudiante"})
+    assert response.status_code == 200, response.text
+    assert _dashboard(client, admin_headers)["total_students"] == students
+    assert _drift(client, admin_headers) == {}
+
+
+def test_deleting_teacher_role_recounts(client: TestClient, admin_headers: dict[str, str]) -> None:
+    create_user(client, admin_headers, "cnt.docente@ud.edu", ["Docente"])
+    assert _dashboard(client, admin_headers)["total_teachers"] >= 1
+
+    response = client.delete(f"/roles/{role_id('Docente')}", headers=admin_headers)
+    assert response.status_code == 204, response.text
+    assert _dashboard(client, admin_headers)["total_teachers"] == 0
+    assert _drift(client, admin_headers) == {}
+
+    # Las demás pruebas cuentan con el rol base.
+    response = client.post("/roles/", headers=admin_headers, json={"name": "Docente", "description": "Rol docente"})
+    assert response.status_code == 201, response.text
@@ -0,0 +1,111 @@
+"""Máscara de permisos en el token y rechazo de tokens desactualizados."""
+from __future__ import annotations
+
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.roles.models import Role
+from app.users.models import User
+from tests.conftest import create_user, login, post, role_id
+
+STALE = "Token desactualizado; inicia sesión nuevamente."
+
+
+def _me(client: TestClient, headers: dict[str, str]) -> int:
+    return client.get("/auth/me", headers=headers).status_code
+
+
+def test_role_masks_gate_routes(client: TestClient, admin_headers: dict[str, str]) -> None:
+    create_user(client, admin_headers, "mask.estudiante@ud.edu", ["Estudiante"])
+    create_user(client, admin_headers, "mask.docente@ud.edu", ["Docente"])
+    student = login(client, "mask.estudiante@ud.edu")
+    teacher = login(client, "mask.docente@ud.edu")
+
+    assert client.get("/users/", headers=admin_headers).status_code == 200
+    assert client.get("/users/", headers=student).status_code == 403
+    assert client.get("/users/", headers=teacher).status_code == 403
+    assert client.get("/transcripts/me", headers=student).status_code == 200
+    assert client.get("/transcripts/me", headers=teacher).status_code == 403
+    bulk = {"items": [{"enrollment_id": 999999, "value": "80"}]}
+    assert client.post("/grades/bulk", headers=teacher, json=bulk).status_code == 200
+    assert client.post("/grades/bulk", headers=student, json=bulk).status_code == 403
+
+
+def test_token_without_mask_is_rejected(client: TestClient, admin_headers: dict[str, str]) -> None:
+    user = create_user(client, admin_headers, "mask.sinperm@ud.edu", ["Estudiante"])
+    token = create_access_token(subject=str(user["id"]), jti=uuid4().hex, claims={"ver": 0})
+    response = client.get("/auth/me", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Token inválido."
+
+
+def test_assign_and_remove_role_reject_old_tokens(client: TestClient, admin_headers: dict[str, str]) -> None:
+    user = create_user(client, admin_headers, "ver.roles@ud.edu", ["Estudiante"])
+    old = login(client, "ver.roles@ud.edu")
+    assert _me(client, old) == 200
+
+    response = client.post(f"/users/{user['id']}/roles/{role_id('Docente')}", headers=admin_headers)
+    assert response.status_code == 200, response.text
+    response = client.get("/auth/me", headers=old)
+    assert (response.status_code, response.json()["detail"]) == (401, STALE)
+
+    promoted = login(client, "ver.roles@ud.edu")
+    assert client.post("/grades/bulk", headers=promoted, json={"items": [{"enrollment_id": 1, "value": "1"}]}).status_code == 200
+
+    response = client.delete(f"/users/{user['id']}/roles/{role_id('Docente')}", headers=admin_headers)
+    assert response.status_code == 200, response.text
+    assert _me(client, promoted) == 401
+    assert client.post("/grades/bulk", headers=login(client, "ver.roles@ud.edu"), json={"items": [{"enrollment_id": 1, "value": "1"}]}).status_code == 403
+
+
+def test_deactivation_rejects_old_tokens(client: TestClient, admin_headers: dict[str, str]) -> None:
+    user = create_user(client, admin_headers, "ver.baja@ud.edu", ["Estudiante"])
+    old = login(client, "ver.baja@ud.edu")
+    assert client.delete(f"/users/{user['id']}", headers=admin_headers).status_code == 200
+    assert _me(client, old) == 401
+
+    response = client.put(f"/users/{user['id']}", headers=admin_headers, json={"is_active": True})
+    assert response.status_code == 200, response.text
+    assert _me(client, old) == 401
+    assert _me(client, login(client, "ver.baja@ud.edu")) == 200
+
+
+def test_renaming_or_deleting_a_role_rejects_holders(client: TestClient, admin_headers: dict[str, str]) -> None:
+    role = post(client, admin_headers, "/roles/", {"name": "Auditor", "description": "Rol auditor"})
+    create_user(client, admin_headers, "ver.auditor@ud.edu", ["Estudiante", "Auditor"])
+    bystander = login(client, create_user(client, admin_headers, "ver.ajeno@ud.edu", ["Estudiante"])["email"])
+    old = login(client, "ver.auditor@ud.edu")
+
+    response = client.put(f"/roles/{role['id']}", headers=admin_headers, json={"name": "Auditoría"})
+    assert response.status_code == 200, response.text
+    assert _me(client, old) == 401
+    assert _me(client, bystander) == 200
+
+    renamed = login(client, "ver.auditor@ud.edu")
+    assert client.delete(f"/roles/{role['id']}", headers=admin_headers).status_code == 204
+    assert _me(client, renamed) == 401
+    assert _me(client, login(client, "ver.auditor@ud.edu")) == 200
+
+
+def test_role_change_in_another_worker_is_seen(
+    client: TestClient, db: Session, admin_headers: dict[str, str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    user = create_user(client, admin_headers, "ver.otro.worker@ud.edu", ["Administrador"])
+    old = login(client, "ver.otro.worker@ud.edu")
+    assert client.get("/users/", headers=old).status_code == 200  # principal en caché
+
+    # Otro worker quita el rol: confirma en la base sin tocar las cachés de este proceso.
+    demoted = db.get(User, user["id"])
+    demoted.roles = [db.get(Role, role_id("Estudiante"))]
+    demoted.token_version += 1
+    db.commit()
+    assert client.get("/users/", headers=old).status_code == 200  # dentro del intervalo
+
+    monkeypatch.setattr(settings, "name_cache_refresh_seconds", 0.0)
+    response = client.get("/users/", headers=old)
+    assert (response.status_code, response.json()["detail"]) == (401, STALE)
@@ -0,0 +1,76 @@
+"""Comprobación de esquema de los workers con APP_STARTUP_BOOTSTRAP=false."""
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from sqlalchemy import Engine, create_engine, text
+
+from app.core import bootstrap
+from app.core.database import Base
+
+
+POSTGRES_URL = os.environ.get("APP_TEST_POSTGRES_URL")
+
+
+def _empty(engine: Engine) -> None:
+    with engine.begin() as connection:
+        connection.execute(text("DROP TABLE IF EXISTS alembic_version"))
+        Base.metadata.drop_all(connection)
+
+
+@pytest.fixture(
+    params=[
+        "sqlite",
+        pytest.param(
+            "postgresql",
+            marks=pytest.mark.skipif(not POSTGRES_URL, reason="APP_TEST_POSTGRES_URL no está definida"),
+        ),
+    ]
+)
+def scratch_engine(request: pytest.FixtureRequest, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Engine]:
+    # En PostgreSQL la base indicada se vacía, como en tests/test_explain_indexes.py.
+    if request.param == "postgresql":
+        scratch = create_engine(POSTGRES_URL)
+        _empty(scratch)
+    else:
+        scratch = create_engine(f"sqlite:///{tmp_path / 'schema.sqlite'}")
+    monkeypatch.setattr(bootstrap, "engine", scratch)
+    yield scratch
+    if request.param == "postgresql":
+        _empty(scratch)
+    scratch.dispose()
+
+
+def test_verify_rejects_unstamped_schema(scratch_engine: Engine) -> None:
+    with scratch_engine.begin() as connection:
+        Base.metadata.create_all(connection)
+    with pytest.raises(RuntimeError, match="Versión de esquema ausente"):
+        bootstrap.verify_schema_version()
+
+
+def test_verify_accepts_bootstrapped_schema(scratch_engine: Engine) -> None:
+    with scratch_engine.begin() as connection:
+        Base.metadata.create_all(connection)
+        bootstrap.stamp_schema_version(connection)
+    bootstrap.verify_schema_version()
+
+
+def test_verify_rejects_stamp_without_tables(scratch_engine: Engine) -> None:
+    tables = [table for name, table in Base.metadata.tables.items() if name != "catalog_versions"]
+    with scratch_engine.begin() as connection:
+        Base.metadata.create_all(connection, tables=tables)
+        bootstrap.stamp_schema_version(connection)
+    with pytest.raises(RuntimeError, match="faltan tablas: catalog_versions"):
+        bootstrap.verify_schema_version()
+
+
+def test_verify_rejects_old_revision(scratch_engine: Engine) -> None:
+    with scratch_engine.begin() as connection:
+        Base.metadata.create_all(connection)
+        bootstrap._version_table.create(connection)
+        connection.execute(bootstrap._version_table.insert().values(version_num="003_query_indexes"))
+    with pytest.raises(RuntimeError, match="003_query_indexes"):
+        bootstrap.verify_schema_version()
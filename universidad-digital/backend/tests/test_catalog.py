@@ -0,0 +1,53 @@
+"""Caché de versiones de catálogo."""
+from __future__ import annotations
+
+import threading
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event, select
+
+from app.core.catalog import CatalogVersionCache
+from app.core.database import SessionLocal, engine
+from tests.conftest import count_statements
+
+
+def test_load_uses_the_callers_connection(client: TestClient) -> None:
+    versions = CatalogVersionCache()
+    checkouts: list[object] = []
+
+    def on_checkout(dbapi_connection, connection_record, connection_proxy) -> None:  # type: ignore[no-untyped-def]
+        checkouts.append(dbapi_connection)
+
+    with SessionLocal() as db:
+        db.execute(select(1))
+        event.listen(engine, "checkout", on_checkout)
+        try:
+            assert versions.get(db, "subjects") >= 0
+        finally:
+            event.remove(engine, "checkout", on_checkout)
+    assert checkouts == []
+
+
+def test_expired_interval_reloads_once(client: TestClient) -> None:
+    versions = CatalogVersionCache()
+    with SessionLocal() as db:
+        versions.load(db)
+        expected = versions.get(db, "subjects")
+    versions._loaded_at = 0.0
+    barrier = threading.Barrier(8)
+    seen: list[int] = []
+
+    def check() -> None:
+        with SessionLocal() as db:
+            barrier.wait()
+            seen.append(versions.get(db, "subjects"))
+
+    with count_statements() as statements:
+        threads = [threading.Thread(target=check) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    reloads = [statement for statement in statements if "FROM catalog_versions" in statement]
+    assert len(reloads) == 1
+    assert seen == [expected] * 8
@@ -0,0 +1,55 @@
+"""POST /enrollments/import: reporte por fila con creadas, duplicadas y errores."""
+from __future__ import annotations
+
+import csv
+import io
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.periods.models import AcademicPeriod
+from app.subjects.models import Subject
+from app.users.models import User
+
+
+def _import(client: TestClient, headers: dict[str, str], body: bytes) -> tuple[dict[int, list[str]], dict]:
+    response = client.post(
+        "/enrollments/import", content=body, headers={**headers, "Content-Type": "text/csv"}
+    )
+    assert response.status_code == 200, response.text
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    report = {int(row["line"]): [row["status"], row["detail"]] for row in rows}
+    return report, response.headers
+
+
+def test_import_reports_each_line(
+    client: TestClient, db: Session, admin_headers: dict[str, str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Lotes de 2: la línea con bytes inválidos cae en el segundo lote, después de un commit.
+    monkeypatch.setattr(settings, "enrollment_import_batch_size", 2)
+    period = AcademicPeriod(code="IMP-1", name="Importación", start_date=date(2025, 1, 1), end_date=date(2025, 6, 1))
+    first = Subject(code="IMP1", name="Importada 1", credits=3)
+    second = Subject(code="IMP2", name="Importada 2", credits=4)
+    student = User(email="imp.student@pruebas.ud.edu", full_name="Estudiante Importado", hashed_password="x")
+    db.add_all([period, first, second, student])
+    db.commit()
+
+    body = (
+        "user_id,subject_id,period_id\n"
+        f"{student.id},{first.id},{period.id}\n"
+        f"{student.id},{first.id},{period.id}\n"
+        f"{student.id},\xff\xfe,{period.id}\n".encode("latin-1")
+        + f"999999,{first.id},{period.id}\n"
+        f"{student.id},{second.id},{period.id}\n".encode()
+    )
+    report, headers = _import(client, admin_headers, body)
+
+    assert report[2][0] == "created"
+    assert report[3][0] == "duplicate"
+    assert report[4] == ["error", "La línea no está codificada en UTF-8."]
+    assert report[5] == ["error", "Usuario no encontrado."]
+    assert report[6][0] == "created"
+    assert (headers["X-Import-Created"], headers["X-Import-Duplicates"], headers["X-Import-Errors"]) == ("2", "1", "2")
@@ -0,0 +1,76 @@
+"""GET /enrollments/ emite las mismas sentencias con N y con 10×N inscripciones."""
+from __future__ import annotations
+
+from datetime import date
+
+from fastapi.testclient import TestClient
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.core.names import name_cache
+from app.enrollments.models import Enrollment
+from app.periods.models import AcademicPeriod
+from app.subjects.models import Subject
+from app.users.models import User
+from tests.conftest import count_statements
+
+
+SUBJECTS = 7
+TEACHERS = 5
+
+
+def _seed_enrollments(db: Session, period: AcademicPeriod, count: int) -> None:
+    """Inscripciones con estudiantes distintos y materias y docentes alternados."""
+    offset = db.scalar(select(func.count(Enrollment.id)).where(Enrollment.period_id == period.id))
+    subjects = db.scalars(select(Subject).where(Subject.code.like("QRY%")).order_by(Subject.id)).all()
+    teachers = db.scalars(select(User).where(User.email.like("qry-teacher%")).order_by(User.id)).all()
+    for index in range(offset, offset + count):
+        student = User(email=f"qry-student{index}@pruebas.ud.edu", full_name=f"Estudiante {index}", hashed_password="x")
+        db.add(student)
+        db.flush()
+        db.add(
+            Enrollment(
+                user_id=student.id,
+                subject_id=subjects[index % SUBJECTS].id,
+                period_id=period.id,
+                teacher_id=teachers[index % TEACHERS].id,
+            )
+        )
+    db.commit()
+
+
+def _list_statements(client: TestClient, headers: dict[str, str], period_id: int, expected: int) -> int:
+    # Caché de nombres vacía: cada listado resuelve todos sus nombres desde la base.
+    name_cache.clear()
+    with count_statements() as statements:
+        response = client.get("/enrollments/", params={"period_id": period_id}, headers=headers)
+    assert response.status_code == 200, response.text
+    assert len(response.json()) == expected
+    assert all(row["user_name"] and row["subject_name"] and row["teacher_name"] for row in response.json())
+    return len(statements)
+
+
+def test_enrollment_listing_statement_count_is_constant(
+    client: TestClient, db: Session, admin_headers: dict[str, str]
+) -> None:
+    period = AcademicPeriod(
+        code="QRY-1", name="Periodo consultas", start_date=date(2025, 1, 1), end_date=date(2025, 6, 1)
+    )
+    db.add(period)
+    db.add_all(Subject(code=f"QRY{index}", name=f"Materia {index}", credits=3) for index in range(SUBJECTS))
+    db.add_all(
+        User(email=f"qry-teacher{index}@pruebas.ud.edu", full_name=f"Docente {index}", hashed_password="x")
+        for index in range(TEACHERS)
+    )
+    db.commit()
+
+    count = 8
+    _seed_enrollments(db, period, count)
+    # La primera petición carga filtros y cachés de autenticación; no se mide.
+    _list_statements(client, admin_headers, period.id, count)
+    small = _list_statements(client, admin_headers, period.id, count)
+
+    _seed_enrollments(db, period, 9 * count)
+    large = _list_statements(client, admin_headers, period.id, 10 * count)
+
+    assert small == large
@@ -0,0 +1,118 @@
+"""Planes de PostgreSQL de las consultas calientes sobre datos sembrados.
+
+Requiere APP_TEST_POSTGRES_URL (por ejemplo postgresql+psycopg://postgres@localhost/ud_test);
+la base indicada se vacía. El esquema se crea con create_all, se baja con alembic a
+002_token_version y se sube a head, así que los índices verificados son los que crean
+las migraciones y no solo los de los modelos.
+"""
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.config import Config
+from alembic.migration import MigrationContext
+from sqlalchemy import Engine, create_engine, text
+from sqlalchemy.orm import Session
+
+from app.core.bootstrap import SCHEMA_VERSION
+from app.core.database import Base
+from benchmarks.explain_indexes import explain_cases, used_indexes
+
+POSTGRES_URL = os.environ.get("APP_TEST_POSTGRES_URL")
+
+pytestmark = pytest.mark.skipif(not POSTGRES_URL, reason="APP_TEST_POSTGRES_URL no está definida")
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+# 200 docentes y 19 801 estudiantes; 19 801 no comparte factores con 50 materias ni
+# 4 periodos, así que las 100 000 inscripciones no repiten (usuario, materia, periodo).
+SEED = (
+    """
+    INSERT INTO roles (id, name) VALUES (1, 'Administrador'), (2, 'Docente'), (3, 'Estudiante')
+    """,
+    """
+    INSERT INTO users (id, email, full_name, hashed_password, is_active, updated_at)
+    SELECT g, 'usuario' || g || '@ud.edu', 'Usuario ' || g, 'x', g % 20 <> 0,
+           now() - (g % 1000) * interval '1 day'
+    FROM generate_series(1, 20001) AS g
+    """,
+    """
+    INSERT INTO user_roles (user_id, role_id)
+    SELECT g, CASE WHEN g <= 200 THEN 2 ELSE 3 END FROM generate_series(1, 20001) AS g
+    """,
+    """
+    INSERT INTO subjects (id, code, name, credits, is_active)
+    SELECT g, 'MAT' || g, 'Materia ' || g, 1 + g % 5, true FROM generate_series(1, 50) AS g
+    """,
+    """
+    INSERT INTO academic_periods (id, code, name, start_date, end_date, is_active)
+    SELECT g, '2026-' || g, 'Periodo ' || g, date '2026-01-01', date '2026-06-30', g = 4
+    FROM generate_series(1, 4) AS g
+    """,
+    """
+    INSERT INTO enrollments (user_id, subject_id, teacher_id, period_id, is_active)
+    SELECT 201 + g % 19801, 1 + g % 50, 1 + g % 200, 1 + g % 4, g % 10 <> 0
+    FROM generate_series(1, 100000) AS g
+    """,
+    """
+    INSERT INTO grades (enrollment_id, value)
+    SELECT id, (id % 100)::numeric FROM enrollments WHERE id % 5 <> 0
+    """,
+    # Una semana de logouts; el 1 % ya expiró y espera la purga.
+    """
+    INSERT INTO revoked_tokens (jti, revoked_at, expires_at)
+    SELECT md5(g::text), now() - g * interval '12 seconds',
+           now() + CASE WHEN g % 100 = 0 THEN -1 ELSE 1 END * g * interval '1 second'
+    FROM generate_series(1, 50000) AS g
+    """,
+)
+
+
+def _alembic_config() -> Config:
+    config = Config()
+    config.set_main_option("script_location", str(BACKEND_DIR / "alembic"))
+    return config
+
+
+@pytest.fixture(scope="module")
+def pg_engine() -> Iterator[Engine]:
+    engine = create_engine(POSTGRES_URL)
+    with engine.begin() as connection:
+        connection.execute(text("DROP TABLE IF EXISTS alembic_version"))
+        Base.metadata.drop_all(connection)
+        Base.metadata.create_all(connection)
+    config = _alembic_config()
+    with engine.connect() as connection:
+        config.attributes["connection"] = connection
+        command.stamp(config, "head")
+        command.downgrade(config, "002_token_version")
+        command.upgrade(config, "head")
+        connection.commit()
+    with engine.begin() as connection:
+        for statement in SEED:
+            connection.execute(text(statement))
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.execute(text("VACUUM ANALYZE"))
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+
+
+def test_migrations_match_models(pg_engine: Engine) -> None:
+    with pg_engine.connect() as connection:
+        context = MigrationContext.configure(connection, opts={"compare_type": True})
+        assert context.get_current_revision() == SCHEMA_VERSION
+        assert compare_metadata(context, Base.metadata) == []
+
+
+def test_hot_queries_use_expected_indexes(pg_engine: Engine) -> None:
+    with Session(pg_engine) as db:
+        plans = {name: (expected, used_indexes(db, stmt)) for name, stmt, expected in explain_cases(db)}
+    missing = {name: used for name, (expected, used) in plans.items() if expected not in used}
+    assert not missing, f"Planes sin el índice esperado: {missing}"
@@ -0,0 +1,63 @@
+"""POST /grades/bulk: resultados por elemento sin abortar el lote."""
+from __future__ import annotations
+
+from decimal import Decimal
+
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.grades.models import Grade
+from tests.conftest import create_course, create_user, enroll, login
+
+
+def test_bulk_reports_errors_per_item(client: TestClient, db: Session, admin_headers: dict[str, str]) -> None:
+    teacher = create_user(client, admin_headers, "bulk.docente@ud.edu", ["Docente"])
+    other_teacher = create_user(client, admin_headers, "bulk.otro@ud.edu", ["Docente"])
+    student = create_user(client, admin_headers, "bulk.estudiante@ud.edu", ["Estudiante"])
+    subject, period = create_course(client, admin_headers, "BULK1")
+    other_subject, _ = create_course(client, admin_headers, "BULK2")
+    third_subject, _ = create_course(client, admin_headers, "BULK3")
+    own = enroll(client, admin_headers, student["id"], subject["id"], period["id"], teacher["id"])
+    foreign = enroll(client, admin_headers, student["id"], other_subject["id"], period["id"], other_teacher["id"])
+    inactive = enroll(client, admin_headers, student["id"], third_subject["id"], period["id"], teacher["id"])
+    assert client.delete(f"/enrollments/{inactive['id']}", headers=admin_headers).status_code == 200
+
+    response = client.post(
+        "/grades/bulk",
+        headers=login(client, "bulk.docente@ud.edu"),
+        json={
+            "items": [
+                {"enrollment_id": own["id"], "value": "85.50"},
+                {"enrollment_id": foreign["id"], "value": "70"},
+                {"enrollment_id": inactive["id"], "value": "60"},
+                {"enrollment_id": 999999, "value": "50"},
+                {"enrollment_id": own["id"], "value": "90", "notes": "Recuperación"},
+            ]
+        },
+    )
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert (body["created"], body["errors"]) == (2, 3)
+    results = body["results"]
+    assert [result["index"] for result in results] == [0, 1, 2, 3, 4]
+    assert [result["status"] for result in results] == ["created", "error", "error", "error", "created"]
+    assert results[1]["detail"] == "Solo puedes calificar estudiantes de tus materias asignadas."
+    assert results[2]["detail"] == "Inscripción inactiva."
+    assert results[3]["detail"] == "Inscripción no encontrada."
+    assert all(result["grade_id"] is None for result in results[1:4])
+
+    grades = {
+        grade.id: grade
+        for grade in db.scalars(select(Grade).where(Grade.enrollment_id.in_([own["id"], foreign["id"], inactive["id"]])))
+    }
+    assert set(grades) == {results[0]["grade_id"], results[4]["grade_id"]}
+    assert grades[results[0]["grade_id"]].value == Decimal("85.50")
+    assert grades[results[4]["grade_id"]].notes == "Recuperación"
+
+
+def test_bulk_requires_teacher(client: TestClient, admin_headers: dict[str, str]) -> None:
+    response = client.post(
+        "/grades/bulk", headers=admin_headers, json={"items": [{"enrollment_id": 1, "value": "80"}]}
+    )
+    assert response.status_code == 403
@@ -0,0 +1,61 @@
+"""Shards por hilo de app.core.metrics y activación de /metrics según el entorno."""
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Iterator
+
+import pytest
+
+from app.core.config import Settings
+from app.core.metrics import REGISTRY, Counter, Histogram
+
+
+@pytest.fixture
+def scratch_metrics() -> Iterator[tuple[Counter, Histogram]]:
+    counter = Counter("test_events_total", "Eventos de prueba.", ("kind",))
+    histogram = Histogram("test_duration_seconds", "Duración de prueba.", buckets=(0.1, 1.0))
+    yield counter, histogram
+    REGISTRY.remove(counter)
+    REGISTRY.remove(histogram)
+
+
+def _run_in_threads(count: int, target: Callable[[], None]) -> None:
+    for _ in range(count):
+        thread = threading.Thread(target=target)
+        thread.start()
+        thread.join()
+
+
+def test_dead_thread_shards_are_folded(scratch_metrics: tuple[Counter, Histogram]) -> None:
+    counter, histogram = scratch_metrics
+
+    def work() -> None:
+        counter.inc("a")
+        counter.inc("b", amount=2)
+        histogram.observe(0.5)
+
+    _run_in_threads(200, work)
+    counter.inc("a")
+
+    assert counter.value("a") == 201
+    assert counter.value("b") == 400
+    # Solo queda el shard del hilo actual; los 200 hilos terminados están en la base.
+    assert len(counter._shards) == 1
+    lines = list(histogram.render())
+    assert 'test_duration_seconds_bucket{le="1"} 200' in lines
+    assert "test_duration_seconds_count 200" in lines
+    assert len(histogram._shards) == 0
+
+
+@pytest.mark.parametrize(
+    ("env", "enabled", "active"),
+    [
+        ("development", None, True),
+        ("production", None, False),
+        ("production", True, True),
+        ("development", False, False),
+    ],
+)
+def test_metrics_default_off_in_production(env: str, enabled: bool | None, active: bool) -> None:
+    settings = Settings(env=env, metrics_enabled=enabled, jwt_secret="x" * 40)
+    assert settings.metrics_active is active
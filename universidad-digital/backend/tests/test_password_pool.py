@@ -0,0 +1,32 @@
+"""Pool de procesos de bcrypt: recuperación cuando muere un proceso hijo."""
+from __future__ import annotations
+
+import os
+import signal
+from collections.abc import Iterator
+
+import pytest
+
+from app.core import security
+from app.core.config import settings
+
+
+@pytest.fixture
+def password_pool(monkeypatch: pytest.MonkeyPatch) -> Iterator[security._PasswordPool]:
+    monkeypatch.setattr(settings, "password_hash_workers", 1)
+    monkeypatch.setattr(settings, "password_hash_queue_timeout_seconds", 30.0)
+    pool = security._PasswordPool()
+    yield pool
+    pool.shutdown()
+
+
+def test_killed_child_is_replaced(password_pool: security._PasswordPool) -> None:
+    hashed = password_pool.run(security._hash_sync, "ClaveSegura123")
+    child = password_pool.run(os.getpid)
+    assert child != os.getpid()
+
+    os.kill(child, signal.SIGKILL)
+
+    for _ in range(3):
+        assert password_pool.run(security._verify_sync, "ClaveSegura123", hashed)
+    assert password_pool.run(os.getpid) != child
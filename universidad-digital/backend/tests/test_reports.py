@@ -0,0 +1,67 @@
+"""Reportes históricos: snapshot al cerrar, reconstrucción tras notas tardías y reapertura."""
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.reports.models import PeriodSnapshot, PeriodStudentSummary
+from tests.conftest import create_course, create_user, enroll, login, post
+
+
+def _report(client: TestClient, admin_headers: dict[str, str], period_id: int, kind: str) -> list[dict]:
+    response = client.get(f"/reports/periods/{period_id}/{kind}", headers=admin_headers)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def _has_snapshot(db: Session, period_id: int) -> bool:
+    db.expire_all()
+    return db.get(PeriodSnapshot, period_id) is not None
+
+
+def test_snapshot_follows_period_lifecycle(client: TestClient, db: Session, admin_headers: dict[str, str]) -> None:
+    teacher = create_user(client, admin_headers, "rep.docente@ud.edu", ["Docente"])
+    first = create_user(client, admin_headers, "rep.estudiante1@ud.edu", ["Estudiante"])
+    second = create_user(client, admin_headers, "rep.estudiante2@ud.edu", ["Estudiante"])
+    subject, period = create_course(client, admin_headers, "REP1", credits=4)
+    period_id = period["id"]
+    first_enrollment = enroll(client, admin_headers, first["id"], subject["id"], period_id, teacher["id"])
+    second_enrollment = enroll(client, admin_headers, second["id"], subject["id"], period_id, teacher["id"])
+    teacher_headers = login(client, "rep.docente@ud.edu")
+    post(client, teacher_headers, "/grades/", {"enrollment_id": first_enrollment["id"], "value": "60"})
+    post(client, teacher_headers, "/grades/", {"enrollment_id": second_enrollment["id"], "value": "80"})
+
+    response = client.get(f"/reports/periods/{period_id}/subjects", headers=admin_headers)
+    assert response.status_code == 409
+
+    response = client.put(f"/periods/{period_id}", headers=admin_headers, json={"is_active": False})
+    assert response.status_code == 200, response.text
+    assert _has_snapshot(db, period_id)
+    [summary] = _report(client, admin_headers, period_id, "subjects")
+    assert (summary["enrollments_count"], summary["graded_count"]) == (2, 2)
+    assert (summary["average"], summary["min_grade"], summary["max_grade"]) == ("70.00", "60.00", "80.00")
+    [teacher_row] = _report(client, admin_headers, period_id, "teachers")
+    assert (teacher_row["teacher_id"], teacher_row["students_count"]) == (teacher["id"], 2)
+
+    # Nota tardía en el periodo cerrado: borra la marca y la próxima lectura reconstruye.
+    post(client, teacher_headers, "/grades/", {"enrollment_id": first_enrollment["id"], "value": "100"})
+    assert not _has_snapshot(db, period_id)
+    students = {row["user_id"]: row for row in _report(client, admin_headers, period_id, "students")}
+    assert students[first["id"]]["weighted_average"] == "80.00"
+    assert students[second["id"]]["weighted_average"] == "80.00"
+    assert _has_snapshot(db, period_id)
+    # Los resúmenes agregan notas finales: (60 + 100) / 2 y 80.
+    [summary] = _report(client, admin_headers, period_id, "subjects")
+    assert (summary["average"], summary["min_grade"], summary["max_grade"]) == ("80.00", "80.00", "80.00")
+
+    # Reabrir descarta el snapshot y los resúmenes; los reportes vuelven a rechazarse.
+    response = client.put(f"/periods/{period_id}", headers=admin_headers, json={"is_active": True})
+    assert response.status_code == 200, response.text
+    assert not _has_snapshot(db, period_id)
+    summaries = db.scalar(
+        select(func.count()).select_from(PeriodStudentSummary).where(PeriodStudentSummary.period_id == period_id)
+    )
+    assert summaries == 0
+    response = client.get(f"/reports/periods/{period_id}/students", headers=admin_headers)
+    assert response.status_code == 409
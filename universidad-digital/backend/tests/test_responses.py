@@ -0,0 +1,34 @@
+"""La serialización directa de listados debe coincidir byte a byte con la de Pydantic."""
+from __future__ import annotations
+
+import json
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from pydantic import TypeAdapter
+
+from app.core import responses
+
+VALUES = [
+    {
+        "created_at": datetime(2026, 3, 1, 12, 30, 5, 120000, tzinfo=timezone.utc),
+        "updated_at": datetime(2026, 3, 1, 12, 30, 5, tzinfo=timezone.utc),
+        "enrolled_at": datetime(2026, 3, 1, 12, 30, 5),
+        "local_at": datetime(2026, 3, 1, 7, 30, tzinfo=timezone(timedelta(hours=-5))),
+        "start_date": date(2026, 2, 1),
+        "value": Decimal("85.50"),
+        "name": "Matemáticas",
+    }
+]
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_matches_pydantic(monkeypatch: pytest.MonkeyPatch, use_orjson: bool) -> None:
+    if use_orjson and responses.orjson is None:
+        pytest.skip("orjson no está instalado")
+    if not use_orjson:
+        monkeypatch.setattr(responses, "orjson", None)
+    expected = TypeAdapter(list).dump_json(VALUES)
+    assert json.loads(responses.dumps(VALUES)) == json.loads(expected)
+    assert responses.dumps(VALUES) == expected
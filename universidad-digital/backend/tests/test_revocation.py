@@ -0,0 +1,32 @@
+"""Refresco del filtro de tokens revocados."""
+from __future__ import annotations
+
+import threading
+
+from fastapi.testclient import TestClient
+
+from app.auth.revocation import RevocationFilter
+from app.core.database import SessionLocal
+from tests.conftest import count_statements
+
+
+def test_expired_interval_refreshes_once(client: TestClient) -> None:
+    revocations = RevocationFilter()
+    with SessionLocal() as db:
+        revocations.load(db)
+    revocations._last_refresh = 0.0
+    barrier = threading.Barrier(8)
+
+    def check() -> None:
+        with SessionLocal() as db:
+            barrier.wait()
+            revocations.maybe_refresh(db)
+
+    with count_statements() as statements:
+        threads = [threading.Thread(target=check) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    refreshes = [statement for statement in statements if "FROM revoked_tokens" in statement]
+    assert len(refreshes) == 1
@@ -0,0 +1,75 @@
+"""GET /transcripts: promedios ponderados por créditos y caché de periodos cerrados."""
+from __future__ import annotations
+
+from decimal import Decimal
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.grades.models import Grade
+from app.reports.services import invalidate_period_snapshot
+from app.transcripts.services import transcript_cache
+from tests.conftest import create_course, create_user, enroll, login, post
+
+
+def _transcript(client: TestClient, admin_headers: dict[str, str], user_id: int) -> dict:
+    response = client.get(f"/transcripts/{user_id}", headers=admin_headers)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_transcript_weighted_averages_and_cache(
+    client: TestClient, db: Session, admin_headers: dict[str, str]
+) -> None:
+    teacher = create_user(client, admin_headers, "hist.docente@ud.edu", ["Docente"])
+    student = create_user(client, admin_headers, "hist.estudiante@ud.edu", ["Estudiante"])
+    algebra, first = create_course(client, admin_headers, "HIST1", credits=4)
+    physics = post(client, admin_headers, "/subjects/", {"code": "HIST1F", "name": "Física", "credits": 2})
+    chemistry, second = create_course(client, admin_headers, "HIST2", credits=3)
+    ungraded = post(client, admin_headers, "/subjects/", {"code": "HIST2U", "name": "Sin notas", "credits": 5})
+
+    def enroll_in(subject: dict, period: dict) -> int:
+        return enroll(client, admin_headers, student["id"], subject["id"], period["id"], teacher["id"])["id"]
+
+    algebra_id = enroll_in(algebra, first)
+    physics_id = enroll_in(physics, first)
+    chemistry_id = enroll_in(chemistry, second)
+    enroll_in(ungraded, second)
+    teacher_headers = login(client, "hist.docente@ud.edu")
+    for enrollment_id, value in ((algebra_id, "80"), (algebra_id, "90"), (physics_id, "70"), (chemistry_id, "95")):
+        post(client, teacher_headers, "/grades/", {"enrollment_id": enrollment_id, "value": value})
+
+    transcript = _transcript(client, admin_headers, student["id"])
+    first_period, second_period = transcript["periods"]
+    # (85 × 4 + 70 × 2) / 6 y (95 × 3) / 3; la materia sin notas cuenta como intentada.
+    assert [row["final_grade"] for row in first_period["enrollments"]] == ["85.00", "70.00"]
+    assert (first_period["credits_attempted"], first_period["credits_graded"]) == (6, 6)
+    assert first_period["average"] == first_period["cumulative_average"] == "80.00"
+    assert (second_period["credits_attempted"], second_period["credits_graded"]) == (8, 3)
+    assert second_period["average"] == "95.00"
+    # (480 + 285) / 9
+    assert second_period["cumulative_average"] == transcript["cumulative_average"] == "85.00"
+    assert transcript["credits_graded"] == 9
+
+    # Cerrar el periodo crea su snapshot; desde ahí se sirve de la caché.
+    response = client.put(f"/periods/{first['id']}", headers=admin_headers, json={"is_active": False})
+    assert response.status_code == 200, response.text
+    _transcript(client, admin_headers, student["id"])
+    hits = transcript_cache.hits
+    assert _transcript(client, admin_headers, student["id"])["periods"][0]["average"] == "80.00"
+    assert transcript_cache.hits == hits + 1
+
+    # Nota tardía en este proceso: la escritura invalida la entrada. (90 × 4 + 70 × 2) / 6
+    post(client, teacher_headers, "/grades/", {"enrollment_id": algebra_id, "value": "100"})
+    transcript = _transcript(client, admin_headers, student["id"])
+    assert transcript["periods"][0]["average"] == "83.33"
+
+    # Nota escrita por otro worker: borra el snapshot (la marca) pero no toca la caché local.
+    client.post(f"/reports/periods/{first['id']}/snapshot", headers=admin_headers)
+    _transcript(client, admin_headers, student["id"])
+    db.add(Grade(enrollment_id=physics_id, value=Decimal("100")))
+    invalidate_period_snapshot(db, first["id"])
+    db.commit()
+    transcript = _transcript(client, admin_headers, student["id"])
+    # (90 × 4 + 85 × 2) / 6
+    assert transcript["periods"][0]["average"] == "88.33"
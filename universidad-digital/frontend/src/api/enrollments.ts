@@ -26,7 +26,9 @@ export type EnrollmentUpdate = {
 };
 
 export async function listEnrollments() {
-  const { data } = await http.get<EnrollmentResponse[]>("/enrollments");
+  const { data } = await http.get<EnrollmentResponse[]>("/enrollments", {
+    params: { all: true },
+  });
   return data;
 }
 
@@ -22,7 +22,9 @@ export type GradeUpdate = {
 };
 
 export async function listGrades() {
-  const { data } = await http.get<GradeResponse[]>("/grades");
+  const { data } = await http.get<GradeResponse[]>("/grades", {
+    params: { all: true },
+  });
   return data;
 }
 
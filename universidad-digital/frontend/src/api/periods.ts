@@ -25,7 +25,9 @@ export type PeriodUpdate = {
 };
 
 export async function listPeriods() {
-  const { data } = await http.get<PeriodResponse[]>("/periods");
+  const { data } = await http.get<PeriodResponse[]>("/periods", {
+    params: { all: true },
+  });
   return data;
 }
 
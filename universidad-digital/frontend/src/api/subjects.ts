@@ -24,7 +24,9 @@ export type SubjectUpdate = {
 };
 
 export async function listSubjects() {
-  const { data } = await http.get<SubjectResponse[]>("/subjects");
+  const { data } = await http.get<SubjectResponse[]>("/subjects", {
+    params: { all: true },
+  });
   return data;
 }
 
@@ -16,7 +16,9 @@ export type UserUpdate = {
 };
 
 export async function listUsers() {
-  const { data } = await http.get<UserResponse[]>("/users");
+  const { data } = await http.get<UserResponse[]>("/users", {
+    params: { all: true },
+  });
   return data;
 }
 